@@ -1,9 +1,14 @@
 from crewai import Agent
+from tools.runtime_profile import crew_verbose
+from tools.model_router import routed_llm
 
 
-def create_content_creator_agent():
+def create_content_creator_agent(llm=None):
     """
     Creates a content creator agent that writes engaging LinkedIn posts
+    
+    Args:
+        llm: Optional LLM or model name. Defaults to the model router's content route
     """
     return Agent(
         role="LinkedIn Content Creator",
@@ -22,7 +27,8 @@ def create_content_creator_agent():
             topic to grab attention, then smoothly transition to showcase Linkup's expertise. 
             You balance viral engagement potential with genuine technical insights."""
         ),
-        verbose=True,
+        llm=llm if llm is not None else routed_llm("content"),
+        verbose=crew_verbose(),
         allow_delegation=False,
         max_iter=3
     ) 
\ No newline at end of file
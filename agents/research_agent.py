@@ -1,10 +1,16 @@
 from crewai import Agent
-from tools.linkup_tool import LinkupSearchTool
+from tools.runtime_profile import crew_verbose
+from tools.linkup_tool import get_shared_search_tool
+from tools.model_router import routed_llm
 
 
-def create_research_agent():
+def create_research_agent(tools=None, llm=None):
     """
     Creates a research agent that uses Linkup to find relevant content and trends
+    
+    Args:
+        tools: Optional tools for the agent. Defaults to the process-wide LinkupSearchTool
+        llm: Optional LLM or model name. Defaults to the model router's research route
     """
     return Agent(
         role="Content Researcher",
@@ -25,8 +31,9 @@ def create_research_agent():
             with CTOs, AI leads, and infrastructure teams at scale-ups and enterprises, giving you 
             unique visibility into real-world AI implementation challenges and breakthrough solutions."""
         ),
-        tools=[LinkupSearchTool()],
-        verbose=True,
+        tools=tools if tools is not None else [get_shared_search_tool()],
+        llm=llm if llm is not None else routed_llm("research"),
+        verbose=crew_verbose(),
         allow_delegation=False,
         max_iter=3
     ) 
\ No newline at end of file
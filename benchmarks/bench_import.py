@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: import time of crew.py and the tools, and `crew.py --help`
+
+Every measurement runs in a fresh interpreter, the way a CLI call or a
+serverless invocation starts. `python -X importtime` attributes the import
+cost to modules, so a regression (e.g. a module-level `import crewai`) shows
+up by name. Run from the project root:
+
+    uv run python -m benchmarks.bench_import
+    uv run python -m benchmarks.bench_import --check   # exit 1 if a target is missed
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-start targets in milliseconds, documented in the README. The import
+# target is crew's cumulative -X importtime, without interpreter startup;
+# the --help target is the wall time of the whole process.
+IMPORT_TARGET_MS = 200.0
+HELP_TARGET_MS = 500.0
+
+SCENARIOS = {
+    "python (baseline)": [sys.executable, "-c", "pass"],
+    "import crew": [sys.executable, "-c", "import crew"],
+    "crew.py --help": [sys.executable, "crew.py", "--help"],
+    "import tools.linkup_tool": [sys.executable, "-c", "import tools.linkup_tool"],
+    "LinkedInContentCrew()": [sys.executable, "-c", "import crew; crew.LinkedInContentCrew()"],
+}
+
+
+def _environment() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "benchmark-placeholder")
+    env.setdefault("LINKUP_API_KEY", "benchmark-placeholder")
+    env["CREW_TRACING"] = ""
+    return env
+
+
+def wall_time(command: List[str], runs: int) -> float:
+    """Median wall time of a fresh process in milliseconds, after one warm-up run for the OS page cache"""
+    env = _environment()
+    subprocess.run(command, cwd=ROOT, env=env, capture_output=True, check=True)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, env=env, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def import_profile(module: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Cumulative import time of module and of its direct imports, from -X importtime
+
+    Returns:
+        (total milliseconds, [(child module, milliseconds)] slowest first)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=_environment(), capture_output=True, text=True, check=True,
+    )
+    # Lines look like "import time:   self |  cumulative | <indent>name"; children precede their parent
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, name.strip(), int(cumulative) / 1000))
+
+    end = max(i for i, (depth, name, _) in enumerate(rows) if depth == 0 and name == module)
+    total = rows[end][2]
+    start = end
+    while start > 0 and rows[start - 1][0] > 0:
+        start -= 1
+    children = [(name, ms) for depth, name, ms in rows[start:end] if depth == 1]
+    return total, sorted(children, key=lambda child: child[1], reverse=True)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Cold-start and import-time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per scenario")
+    parser.add_argument("--top", type=int, default=8, help="Slowest direct imports to list per module")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 when a target is missed")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    args = build_arg_parser().parse_args(argv)
+
+    print(f"🚀 Cold start, median of {args.runs} fresh processes")
+    missed = []
+    for label, command in SCENARIOS.items():
+        elapsed = wall_time(command, args.runs)
+        line = f"   {label:<28}{elapsed:>8.0f} ms"
+        if label == "crew.py --help":
+            line += f"   (target {HELP_TARGET_MS:.0f} ms)"
+            if elapsed > HELP_TARGET_MS:
+                line += " ❌"
+                missed.append(label)
+        print(line)
+
+    for module in ("crew", "tools.linkup_tool"):
+        total, children = import_profile(module)
+        line = f"\n📦 import {module}: {total:.0f} ms cumulative (-X importtime)"
+        if module == "crew":
+            line += f"   (target {IMPORT_TARGET_MS:.0f} ms)"
+            if total > IMPORT_TARGET_MS:
+                line += " ❌"
+                missed.append("import crew")
+        print(line)
+        for name, ms in children[:args.top]:
+            print(f"   {name:<40}{ms:>8.1f} ms")
+
+    if args.check and missed:
+        raise SystemExit(f"Cold-start targets missed: {', '.join(missed)}")
+
+
+if __name__ == "__main__":
+    main()
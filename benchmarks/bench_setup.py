@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for per-request setup cost (agents, tools, tasks and Crew construction)
+
+Compares the old cold path, where every call built its own research agent and
+LinkupSearchTool, with the warm path used by LinkedInContentCrew now. No API
+calls are made. Run from the project root:
+
+    uv run python -m benchmarks.bench_setup
+"""
+
+import os
+import time
+from dotenv import load_dotenv
+from crewai import Crew, Process
+
+from agents.research_agent import create_research_agent
+from agents.content_creator_agent import create_content_creator_agent
+from tasks.research_task import create_research_task
+from tasks.content_creation_task import create_content_creation_task
+from tasks.topic_discovery_task import create_topic_discovery_task
+from tools.linkup_tool import LinkupSearchTool
+
+load_dotenv()
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-placeholder")
+
+ITERATIONS = 50
+
+
+def cold_hot_topics_setup():
+    """Setup performed by get_hot_topics before warm agents were reused"""
+    research_agent = create_research_agent(tools=[LinkupSearchTool()])
+    topic_task = create_topic_discovery_task("AI")
+    topic_task.agent = create_research_agent(tools=[LinkupSearchTool()])
+    return Crew(agents=[research_agent], tasks=[topic_task], process=Process.sequential, verbose=True)
+
+
+def cold_post_setup():
+    """Setup performed by a fresh LinkedInContentCrew per create_linkedin_post request"""
+    research_agent = create_research_agent(tools=[LinkupSearchTool()])
+    content_creator_agent = create_content_creator_agent()
+    research_task = create_research_task(research_agent, "AI")
+    content_task = create_content_creation_task(content_creator_agent, research_task)
+    return Crew(
+        agents=[research_agent, content_creator_agent],
+        tasks=[research_task, content_task],
+        process=Process.sequential,
+        verbose=True
+    )
+
+
+def make_warm_setups():
+    research_agent = create_research_agent()
+    content_creator_agent = create_content_creator_agent()
+
+    def warm_hot_topics_setup():
+        topic_task = create_topic_discovery_task("AI", research_agent)
+        return Crew(agents=[research_agent], tasks=[topic_task], process=Process.sequential, verbose=True)
+
+    def warm_post_setup():
+        research_task = create_research_task(research_agent, "AI")
+        content_task = create_content_creation_task(content_creator_agent, research_task)
+        return Crew(
+            agents=[research_agent, content_creator_agent],
+            tasks=[research_task, content_task],
+            process=Process.sequential,
+            verbose=True
+        )
+
+    return warm_hot_topics_setup, warm_post_setup
+
+
+def time_per_call(func, iterations: int = ITERATIONS) -> float:
+    """Average milliseconds per call after one warm-up call"""
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    print("⏱️  Per-request setup cost (no API calls)")
+    print("=" * 60)
+
+    warm_hot_topics_setup, warm_post_setup = make_warm_setups()
+    rows = [
+        ("get_hot_topics", cold_hot_topics_setup, warm_hot_topics_setup),
+        ("create_linkedin_post", cold_post_setup, warm_post_setup),
+    ]
+
+    print(f"{'request':<24}{'before (ms)':>14}{'after (ms)':>14}{'speedup':>10}")
+    for name, cold, warm in rows:
+        cold_ms = time_per_call(cold)
+        warm_ms = time_per_call(warm)
+        print(f"{name:<24}{cold_ms:>14.2f}{warm_ms:>14.2f}{cold_ms / warm_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the Linkup API and an OpenAI-compatible stub LLM
+
+Serves two endpoints so the whole crew can run without network access:
+
+    POST /v1/search            Linkup search (sourcedAnswer / searchResults)
+    POST /v1/chat/completions  Stub LLM that drives crewai's ReAct loop
+
+Latency is drawn from a configurable distribution and a share of requests can
+be failed to exercise retries and fallbacks. Point the crew at it with:
+
+    LINKUP_BASE_URL=http://127.0.0.1:8765/v1
+    OPENAI_API_BASE=http://127.0.0.1:8765/v1
+
+Run standalone from the project root:
+
+    uv run python -m benchmarks.fake_linkup_server --port 8765 --latency lognormal:0.4:0.3
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+CANNED_STORIES = [
+    ("Nvidia", "Nvidia reported data center revenue of $41B for the quarter, up 56% year over year, according to Reuters."),
+    ("OpenAI", "OpenAI announced a $500B infrastructure partnership with Oracle and SoftBank, Bloomberg reported."),
+    ("EU AI Act", "The EU AI Act's obligations for general-purpose models took effect on August 2, affecting over 20 model providers."),
+    ("Microsoft", "Microsoft said 9,000 employees would be affected by restructuring, as reported by CNBC."),
+    ("TSMC", "TSMC raised its 2025 revenue growth forecast to 30% on strong AI chip demand, per the Financial Times."),
+    ("Apple", "Apple shares fell 3% after the company delayed its Siri AI upgrade to 2026, The Verge reported."),
+    ("Meta", "Meta offered AI researchers pay packages above $100M, drawing 2M social media mentions in a week."),
+    ("Tesla", "Tesla launched its robotaxi pilot in Austin with 10 vehicles, according to The Wall Street Journal."),
+]
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+@dataclass
+class LatencyModel:
+    """
+    Latency distribution in seconds
+
+    Specs: "fixed:0.2", "uniform:0.1:0.5", "lognormal:<median>:<sigma>"
+    """
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        parts = spec.split(":")
+        kind = parts[0]
+        values = [float(value) for value in parts[1:]] + [0.0, 0.0]
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+        return cls(kind, values[0], values[1])
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            import math
+            return rng.lognormvariate(math.log(max(self.a, 1e-6)), self.b)
+        return self.a
+
+
+@dataclass
+class FakeServerConfig:
+    search_latency: LatencyModel
+    llm_latency: LatencyModel
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    rate_limit_rps: float = 0.0
+    seed: int = 7
+    # Per-model LLM latency overriding llm_latency, e.g. to make a primary model slow
+    model_latency: Dict[str, LatencyModel] = field(default_factory=dict)
+
+
+def sourced_answer(query: str, rng: random.Random) -> Dict[str, Any]:
+    stories = rng.sample(CANNED_STORIES, 3)
+    answer = f"Latest on '{query}': " + " ".join(story for _, story in stories)
+    return {
+        "answer": answer,
+        "sources": [
+            {
+                "name": f"{name} coverage",
+                "url": f"https://news.example.com/{name.lower().replace(' ', '-')}",
+                "snippet": story[:120],
+            }
+            for name, story in stories
+        ],
+    }
+
+
+def search_results(query: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "results": [
+            {
+                "type": "text",
+                "name": f"{name} coverage",
+                "url": f"https://news.example.com/{name.lower().replace(' ', '-')}",
+                "content": story,
+            }
+            for name, story in rng.sample(CANNED_STORIES, 5)
+        ]
+    }
+
+
+def _message_text(messages: List[Dict[str, Any]]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        parts.append(content or "")
+    return "\n".join(parts)
+
+
+def stub_completion(messages: List[Dict[str, Any]]) -> str:
+    """
+    Produce a canned reply that moves crewai's ReAct loop forward
+
+    An agent with tools is asked to call the Linkup tool once; after the
+    observation comes back (or for agents without tools) a final answer
+    matching the task's expected format is returned.
+    """
+    text = _message_text(messages)
+    first_turn = not any(message.get("role") == "assistant" for message in messages)
+
+    if "Action Input" in text and first_turn:
+        match = re.search(r"Search for: '([^']+)'", text)
+        query = match.group(1) if match else "trending business news"
+        return (
+            "Thought: I should search for current trending content.\n"
+            "Action: Linkup Search Tool\n"
+            f"Action Input: {json.dumps({'query': query})}"
+        )
+
+    if "hottest" in text:
+        count_match = re.search(r"EXACTLY (\d+) numbered", text)
+        count = int(count_match.group(1)) if count_match else 5
+        if "source_urls" in text:
+            # Structured output requested (output_pydantic): answer with JSON matching the schema
+            structured = []
+            for number in range(1, count + 1):
+                name, story = CANNED_STORIES[(number - 1) % len(CANNED_STORIES)]
+                structured.append({
+                    "title": f"{name} story #{number}",
+                    "context": story,
+                    "key_details": ["Figures as reported by the source."],
+                    "why_hot": "Widely shared this week.",
+                    "professional_angle": "Affects how enterprises plan AI spend.",
+                    "source_urls": [f"https://news.example.com/{name.lower().replace(' ', '-')}"],
+                })
+            return "Thought: I now know the final answer\nFinal Answer: " + json.dumps({"topics": structured})
+
+        topics = []
+        for number in range(1, count + 1):
+            name, story = CANNED_STORIES[(number - 1) % len(CANNED_STORIES)]
+            topics.append(
+                f"{number}. **{name} story #{number}**\n"
+                f"📰 **Context:** {story}\n"
+                f"📊 **Key Details:** Figures as reported by the source.\n"
+                f"🔥 **Why It's Hot:** Widely shared this week.\n"
+                f"🔗 **Professional Angle:** Affects how enterprises plan AI spend."
+            )
+        return "Thought: I now know the final answer\nFinal Answer: " + "\n\n".join(topics)
+
+    if "LinkedIn Content Creator" in text:
+        name, story = CANNED_STORIES[_words(text) % len(CANNED_STORIES)]
+        return (
+            "Thought: I now know the final answer\nFinal Answer: "
+            f"{story}\n\nHere is what that means for teams building with AI. "
+            "Accurate, current information is now an infrastructure problem.\n\n"
+            "What is your team doing about it?\n\n#AI #Search #Enterprise"
+        )
+
+    name, story = CANNED_STORIES[_words(text) % len(CANNED_STORIES)]
+    return (
+        "Thought: I now know the final answer\nFinal Answer: "
+        f"VIRAL TOPICS: {name}. {story}\nPROFESSIONAL CONNECTIONS: Reliable real-time data.\n"
+        "ENGAGEMENT HOOKS: Lead with the number."
+    )
+
+
+class FakeLinkupHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: FakeServerConfig
+    rng: random.Random
+    rng_lock = threading.Lock()
+    counters: Dict[str, int]
+    ceiling: Dict[str, float]
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up on the request, e.g. a search cancelled after an early stop
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+    def _draw(self, model: LatencyModel) -> float:
+        with self.rng_lock:
+            return model.sample(self.rng)
+
+    def _roll(self, rate: float) -> bool:
+        with self.rng_lock:
+            return self.rng.random() < rate
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path.rstrip("/").endswith("/search"):
+            self._handle_search(payload)
+        elif self.path.rstrip("/").endswith("/chat/completions"):
+            self._handle_chat(payload)
+        else:
+            self._send_json(404, {"error": {"code": "NOT_FOUND", "message": self.path}})
+
+    def _over_ceiling(self) -> bool:
+        """Server-side token bucket: True when searches arrive faster than rate_limit_rps"""
+        rps = self.config.rate_limit_rps
+        if rps <= 0:
+            return False
+        with self.rng_lock:
+            now = time.monotonic()
+            bucket = self.ceiling
+            bucket["tokens"] = min(rps, bucket["tokens"] + (now - bucket["updated"]) * rps)
+            bucket["updated"] = now
+            if bucket["tokens"] < 1:
+                return True
+            bucket["tokens"] -= 1
+            return False
+
+    def _handle_search(self, payload: Dict[str, Any]):
+        self.counters["search_requests"] += 1
+        over_ceiling = self._over_ceiling()
+        time.sleep(self._draw(self.config.search_latency))
+
+        if over_ceiling or self._roll(self.config.rate_limit_rate):
+            self.counters["search_rate_limited"] += 1
+            self._send_json(
+                429,
+                {"error": {"code": "TOO_MANY_REQUESTS", "message": "Too many requests", "details": []}},
+                headers={"Retry-After": "1"},
+            )
+            return
+        if self._roll(self.config.error_rate):
+            self.counters["search_errors"] += 1
+            self._send_json(500, {"error": {"code": "INTERNAL", "message": "Injected failure", "details": []}})
+            return
+
+        query = payload.get("q", "")
+        with self.rng_lock:
+            if payload.get("outputType") == "searchResults":
+                body = search_results(query, self.rng)
+            else:
+                body = sourced_answer(query, self.rng)
+        self._send_json(200, body)
+
+    def _handle_chat(self, payload: Dict[str, Any]):
+        self.counters["llm_requests"] += 1
+        model = payload.get("model", "stub-llm")
+        time.sleep(self._draw(self.config.model_latency.get(model, self.config.llm_latency)))
+
+        messages = payload.get("messages", [])
+        content = stub_completion(messages)
+        prompt_tokens = estimate_tokens(_message_text(messages))
+        completion_tokens = estimate_tokens(content)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        created = int(time.time())
+
+        if payload.get("stream"):
+            self._stream_chat(model, created, content, usage)
+            return
+
+        self._send_json(200, {
+            "id": f"chatcmpl-{created}",
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        })
+
+    def _stream_chat(self, model: str, created: int, content: str, usage: Dict[str, int]):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def emit(delta: Dict[str, Any], finish_reason: Optional[str] = None, extra: Optional[Dict] = None):
+            chunk = {
+                "id": f"chatcmpl-{created}",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            chunk.update(extra or {})
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        emit({"role": "assistant", "content": ""})
+        for word in re.findall(r"\S+\s*", content):
+            emit({"content": word})
+        emit({}, finish_reason="stop", extra={"usage": usage})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+class FakeLinkupServer:
+    """Fake Linkup + stub LLM HTTP server running on a background thread"""
+
+    def __init__(self, config: FakeServerConfig, host: str = "127.0.0.1", port: int = 0):
+        handler = type("ConfiguredFakeLinkupHandler", (FakeLinkupHandler,), {
+            "config": config,
+            "rng": random.Random(config.seed),
+            "counters": {
+                "search_requests": 0,
+                "search_errors": 0,
+                "search_rate_limited": 0,
+                "llm_requests": 0,
+            },
+            "ceiling": {"tokens": max(1.0, config.rate_limit_rps), "updated": time.monotonic()},
+        })
+        self.handler = handler
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        return dict(self.handler.counters)
+
+    def start(self) -> "FakeLinkupServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-linkup", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def parse_model_latency(specs: List[str]) -> Dict[str, LatencyModel]:
+    """Parse MODEL=SPEC items of --model-latency"""
+    latencies = {}
+    for spec in specs:
+        model, _, latency = spec.rpartition("=")
+        latencies[model] = LatencyModel.parse(latency)
+    return latencies
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Offline Linkup API and stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="lognormal:0.4:0.3",
+                        help="Search latency: fixed:S, uniform:A:B or lognormal:MEDIAN:SIGMA (seconds)")
+    parser.add_argument("--llm-latency", default="fixed:0.05", help="Stub LLM latency, same format")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of searches failing with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of searches answered with HTTP 429")
+    parser.add_argument("--rate-limit-rps", type=float, default=0.0,
+                        help="Searches per second allowed before answering HTTP 429 (0 = no ceiling)")
+    parser.add_argument("--model-latency", action="append", default=[], metavar="MODEL=SPEC",
+                        help="Stub LLM latency for one model, e.g. gpt-4.1-2025-04-14=fixed:3 (repeatable)")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def config_from_args(args: argparse.Namespace) -> FakeServerConfig:
+    return FakeServerConfig(
+        search_latency=LatencyModel.parse(args.latency),
+        llm_latency=LatencyModel.parse(args.llm_latency),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        rate_limit_rps=args.rate_limit_rps,
+        seed=args.seed,
+        model_latency=parse_model_latency(args.model_latency),
+    )
+
+
+def main():
+    args = build_arg_parser().parse_args()
+    server = FakeLinkupServer(config_from_args(args), host=args.host, port=args.port)
+    print(f"🧪 Fake Linkup + stub LLM listening on {server.base_url}")
+    print(f"   LINKUP_BASE_URL={server.base_url}")
+    print(f"   OPENAI_API_BASE={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark harness running the crew against the offline fake Linkup server
+
+Drives LinkupSearchTool._run, get_hot_topics, create_linkedin_post and
+create_linkedin_post_from_topic through benchmarks.fake_linkup_server (fake
+Linkup API + stub LLM) and reports throughput, p50/p95/p99 latency, token
+counts and Linkup searches per stage. No real API keys or
+network access are needed. Run from the project root:
+
+    uv run python -m benchmarks.run_benchmarks --iterations 20 --concurrency 4
+    uv run python -m benchmarks.run_benchmarks --stages tool --latency lognormal:0.4:0.5 --error-rate 0.05
+    uv run python -m benchmarks.run_benchmarks --stages post --concurrency 4 --profile production
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+import concurrent.futures
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.fake_linkup_server import CANNED_STORIES, FakeLinkupServer, FakeServerConfig, LatencyModel
+from tools.runtime_profile import configure_logging
+
+
+STAGES = ("tool", "hot_topics", "post", "topic_post")
+
+
+@dataclass
+class StageResult:
+    stage: str
+    iterations: int
+    concurrency: int
+    errors: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    searches: int = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.iterations / self.wall_time if self.wall_time else 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        # Nearest-rank percentile
+        rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    def summary(self) -> Dict[str, float]:
+        ok = max(self.iterations - self.errors, 1)
+        return {
+            "stage": self.stage,
+            "iterations": self.iterations,
+            "concurrency": self.concurrency,
+            "errors": self.errors,
+            "throughput_per_s": round(self.throughput, 3),
+            "p50_s": round(self.percentile(50), 4),
+            "p95_s": round(self.percentile(95), 4),
+            "p99_s": round(self.percentile(99), 4),
+            "prompt_tokens_per_op": round(self.prompt_tokens / ok, 1),
+            "completion_tokens_per_op": round(self.completion_tokens / ok, 1),
+            "cpu_ms_per_op": round(self.cpu_time / max(self.iterations, 1) * 1000, 2),
+            "searches_per_op": round(self.searches / max(self.iterations, 1), 2),
+        }
+
+
+def configure_environment(server: FakeLinkupServer, use_cache: bool, profile: str = "dev") -> None:
+    """Point Linkup and the LLM at the fake server before the crew is imported"""
+    os.environ.update({
+        "RUNTIME_PROFILE": profile,
+        "LINKUP_API_KEY": "fake-linkup-key",
+        "LINKUP_BASE_URL": server.base_url,
+        "OPENAI_API_KEY": "fake-openai-key",
+        "OPENAI_API_BASE": server.base_url,
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "OTEL_SDK_DISABLED": "true",
+    })
+    if not use_cache:
+        os.environ["LINKUP_CACHE_TTL"] = "0"
+        os.environ["RESEARCH_STORE_TTL"] = "0"
+        os.environ["LLM_CACHE_TTL"] = "0"
+
+
+def run_stage(
+    stage: str,
+    operation: Callable[[int], Dict[str, int]],
+    iterations: int,
+    concurrency: int,
+) -> StageResult:
+    """
+    Run operation(i) iterations times on a thread pool and collect latencies
+
+    operation returns a dict with optional prompt_tokens / completion_tokens.
+    """
+    result = StageResult(stage=stage, iterations=iterations, concurrency=concurrency)
+    lock = threading.Lock()
+
+    def timed(i: int):
+        start = time.perf_counter()
+        try:
+            tokens = operation(i) or {}
+            failed = False
+        except Exception:
+            tokens, failed = {}, True
+        elapsed = time.perf_counter() - start
+        with lock:
+            result.latencies.append(elapsed)
+            result.errors += int(failed)
+            result.prompt_tokens += tokens.get("prompt_tokens", 0)
+            result.completion_tokens += tokens.get("completion_tokens", 0)
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(iterations)))
+    result.wall_time = time.perf_counter() - start
+    result.cpu_time = time.process_time() - cpu_start
+    return result
+
+
+def build_operations() -> Dict[str, Callable[[int], Dict[str, int]]]:
+    from crew import LinkedInContentCrew
+    from tools.linkup_tool import get_shared_search_tool
+    from tools.result_compaction import estimate_tokens
+    from tools.topic_index import DiscoveredTopic
+
+    tool = get_shared_search_tool()
+    local = threading.local()
+
+    def worker_crew() -> "LinkedInContentCrew":
+        # One crew per worker thread: crewai agents can't run two tasks at once
+        if not hasattr(local, "crew"):
+            local.crew = LinkedInContentCrew()
+        return local.crew
+
+    def usage_of(crew, run) -> Dict[str, int]:
+        before = len(crew.usage_log)
+        run()
+        entries = list(crew.usage_log)[before:]
+        return {
+            "prompt_tokens": sum(entry["prompt_tokens"] for entry in entries),
+            "completion_tokens": sum(entry["completion_tokens"] for entry in entries),
+        }
+
+    def tool_op(i: int) -> Dict[str, int]:
+        output = tool._run(f"benchmark topic {i}")
+        if output.startswith("Error:"):
+            raise RuntimeError(output)
+        return {"prompt_tokens": estimate_tokens(output)}
+
+    def hot_topics_op(i: int) -> Dict[str, int]:
+        crew = worker_crew()
+        return usage_of(crew, lambda: crew.get_hot_topics(f"benchmark area {i}"))
+
+    def post_op(i: int) -> Dict[str, int]:
+        crew = worker_crew()
+        return usage_of(crew, lambda: crew.create_linkedin_post(f"benchmark topic {i}"))
+
+    def topic_post_op(i: int) -> Dict[str, int]:
+        # A topic as discovery returns it, so only the research task's own searches are counted
+        name, story = CANNED_STORIES[i % len(CANNED_STORIES)]
+        topic = DiscoveredTopic(
+            title=f"{name} benchmark story #{i}",
+            context=story,
+            key_details=["Figures as reported by the source."],
+            why_hot="Widely shared this week.",
+            professional_angle="Affects how enterprises plan AI spend.",
+            source_urls=[f"https://news.example.com/{name.lower().replace(' ', '-')}"],
+        )
+        crew = worker_crew()
+        return usage_of(crew, lambda: crew.create_linkedin_post_from_topic(topic))
+
+    return {"tool": tool_op, "hot_topics": hot_topics_op, "post": post_op, "topic_post": topic_post_op}
+
+
+def print_report(results: List[StageResult], counters: Dict[str, int]) -> None:
+    print("\n📊 BENCHMARK RESULTS")
+    print("=" * 116)
+    header = f"{'stage':<12}{'ops':>6}{'conc':>6}{'errors':>8}{'ops/s':>9}{'p50 s':>9}{'p95 s':>9}{'p99 s':>9}{'prompt tok':>12}{'compl tok':>11}{'cpu ms':>10}{'searches':>10}"
+    print(header)
+    for result in results:
+        row = result.summary()
+        print(
+            f"{row['stage']:<12}{row['iterations']:>6}{row['concurrency']:>6}{row['errors']:>8}"
+            f"{row['throughput_per_s']:>9.2f}{row['p50_s']:>9.3f}{row['p95_s']:>9.3f}{row['p99_s']:>9.3f}"
+            f"{row['prompt_tokens_per_op']:>12.0f}{row['completion_tokens_per_op']:>11.0f}{row['cpu_ms_per_op']:>10.1f}"
+            f"{row['searches_per_op']:>10.2f}"
+        )
+    print("-" * 116)
+    print(f"Fake server: {counters}")
+    print("Token columns are per successful operation; the tool stage reports estimated output tokens.")
+    print("cpu ms is process CPU time per operation, including the in-process fake server.")
+    print("searches are Linkup requests the fake server received per operation, cache hits excluded.")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmarks for the LinkedIn content crew")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"Comma-separated subset of {', '.join(STAGES)}")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--latency", default="lognormal:0.4:0.3", help="Fake Linkup latency distribution")
+    parser.add_argument("--llm-latency", default="fixed:0.05", help="Stub LLM latency distribution")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rps", type=float, default=0.0, help="Fake Linkup search ceiling before HTTP 429")
+    parser.add_argument("--with-cache", action="store_true", help="Keep the Linkup search cache and research store enabled")
+    parser.add_argument("--profile", choices=("dev", "production"), default="dev", help="RUNTIME_PROFILE for the crew")
+    parser.add_argument("--show-output", action="store_true", help="Send crew console output to the terminal instead of /dev/null")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    args = build_arg_parser().parse_args(argv)
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise SystemExit(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    server = FakeLinkupServer(FakeServerConfig(
+        search_latency=LatencyModel.parse(args.latency),
+        llm_latency=LatencyModel.parse(args.llm_latency),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        rate_limit_rps=args.rate_limit_rps,
+    )).start()
+    configure_environment(server, use_cache=args.with_cache, profile=args.profile)
+    # Log with the profile just set, as the crew's own entry points do
+    configure_logging()
+
+    print(f"🧪 Fake Linkup + stub LLM at {server.base_url}")
+    print(f"🚀 Stages: {', '.join(stages)} | iterations={args.iterations} concurrency={args.concurrency} profile={args.profile}")
+
+    results = []
+    # Discard console output through a real file so its I/O cost is still measured
+    devnull = open(os.devnull, "w")
+    try:
+        operations = build_operations()
+        for stage in stages:
+            sink = contextlib.nullcontext() if args.show_output else contextlib.redirect_stdout(devnull)
+            searches_before = server.counters["search_requests"]
+            with sink:
+                result = run_stage(stage, operations[stage], args.iterations, args.concurrency)
+            result.searches = server.counters["search_requests"] - searches_before
+            results.append(result)
+            print(f"✅ {stage} done")
+    finally:
+        server.stop()
+        devnull.close()
+
+    print_report(results, server.counters)
+
+    if args.json_path:
+        with open(args.json_path, "w") as handle:
+            json.dump({
+                "config": vars(args),
+                "results": [result.summary() for result in results],
+                "server": server.counters,
+            }, handle, indent=2)
+        print(f"💾 Wrote {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,35 @@
 import os
+import argparse
+import contextlib
+import contextvars
+import queue
+import threading
+import time
+import concurrent.futures
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Iterator, List, Optional, Tuple, Union
 from dotenv import load_dotenv
-from crewai import Crew, Process
 
-# Import agents and tasks
-from agents.research_agent import create_research_agent
-from agents.content_creator_agent import create_content_creator_agent
-from tasks.research_task import create_research_task
-from tasks.content_creation_task import create_content_creation_task
-from tasks.topic_discovery_task import create_topic_discovery_task
+# crewai, the agents, tasks and the Linkup tool are imported where they are
+# first used: loading crewai takes seconds, and `python crew.py --help` or a
+# short-lived process that only reads config shouldn't pay for it.
+from tools.topic_pool import TopicPool, parse_numbered_topics
+from tools.tracing import configure_tracing_from_env, observe, span, tracing_enabled
+from tools.research_store import get_default_research_store
+from tools.rate_limiter import request_priority
+from tools.runtime_profile import configure_logging, crew_verbose, get_logger
+from tools.post_streaming import (
+    TERMINAL_KINDS,
+    PostStreamSubscription,
+    StreamCancelled,
+    StreamEvent,
+    abort_if_cancelled,
+)
+
+if TYPE_CHECKING:
+    from crewai import Crew
+    from tools.topic_index import DiscoveredTopic
 
 # Load environment variables
 load_dotenv()
@@ -15,61 +37,418 @@ load_dotenv()
 if not os.getenv("OPENAI_MODEL_NAME"):
     os.environ["OPENAI_MODEL_NAME"] = "gpt-4.1-2025-04-14"
 
+configure_tracing_from_env()
+
+logger = get_logger("crew")
+
+
+@dataclass
+class PostResult:
+    """Outcome of one topic in a batch run"""
+    topic: Optional[str]
+    post: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class PostVariant:
+    """One A/B variant of a post written from shared research"""
+    variant: str
+    post: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class LinkedInContentCrew:
     """
     LinkedIn Content Creation Crew using Linkup for research
+    
+    research_agent and content_creator_agent are templates: every run uses
+    copies owned by the calling thread (see _worker_agents), so one crew can
+    serve concurrent callers.
     """
     
     def __init__(self):
         """Initialize the crew with agents"""
+        from agents.research_agent import create_research_agent
+        from agents.content_creator_agent import create_content_creator_agent
+        from tools.topic_index import TopicIndex
+        from tools.model_router import get_model_router
+        
         self.research_agent = create_research_agent()
         self.content_creator_agent = create_content_creator_agent()
+        self._worker_state = threading.local()
+        self.usage_log = deque(maxlen=1000)
+        self._stream_agents: "queue.SimpleQueue[Tuple]" = queue.SimpleQueue()
+        self.research_store = get_default_research_store()
+        self._variant_agents: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.topic_index = TopicIndex()
+        # Topics passed to invalidate_research whose next research pass must bypass the caches
+        self._stale_topics = set()
+        self._stale_lock = threading.Lock()
+        # Picks each LLM call's model; model_router.stats() has latency and tokens per route
+        self.model_router = get_model_router()
     
     def get_hot_topics(self, general_area: str = None):
-        """Get the 5 hottest topics for content creation"""
+        """
+        Get the 5 hottest topics for content creation
         
-        # Create the research agent
-        research_agent = create_research_agent()
+        The result's ``pydantic`` attribute holds a TopicDiscoveryResult. Its
+        topics are also added to topic_index, so any of them can be passed to
+        create_linkedin_post_from_topic by id.
+        """
         
-        # Create the topic discovery task
-        topic_task = create_topic_discovery_task(general_area)
+        from tasks.topic_discovery_task import create_topic_discovery_task
+        
+        # Create the topic discovery task for this thread's research agent
+        research_agent, _ = self._worker_agents()
+        topic_task = create_topic_discovery_task(general_area, research_agent)
         
         # Create a crew for topic discovery
-        topic_crew = Crew(
-            agents=[research_agent],
-            tasks=[topic_task],
-            process=Process.sequential,
-            verbose=True
-        )
+        topic_crew = self._sequential_crew([research_agent], [topic_task])
         
         # Execute the crew and return results
-        return topic_crew.kickoff()
+        result = self._kickoff(topic_crew, "get_hot_topics")
+        self._index_topics(result)
+        return result
+
+    def new_topic_session(self, page_size: int = 5, pool_size: int = 15) -> TopicPool:
+        """Start a topic browsing session whose pool is shared by its get_topic_page calls"""
+        return TopicPool(page_size=page_size, pool_size=pool_size)
+
+    def get_topic_page(self, session: TopicPool, general_area: str = None) -> List["DiscoveredTopic"]:
+        """
+        Get the next page of hot topics for a browsing session
+        
+        The first call discovers pool_size topics in one crew run, and later
+        calls are served from the session's pool without searching again.
+        Discovery reruns only when the pool runs dry (excluding topics already
+        shown) or general_area changes. Discovered topics are added to
+        topic_index as well.
+        
+        Args:
+            session: Pool returned by new_topic_session
+            general_area: Optional area or custom instruction to focus on
+            
+        Returns:
+            Up to page_size topics not shown before in this session
+        """
+        if session.needs_refill(general_area):
+            from tasks.topic_discovery_task import create_topic_discovery_task
+            
+            exclude = session.shown_titles if general_area == session.focus else None
+            research_agent, _ = self._worker_agents()
+            topic_task = create_topic_discovery_task(
+                general_area,
+                research_agent,
+                topic_count=session.pool_size,
+                exclude_titles=exclude,
+            )
+            topic_crew = self._sequential_crew([research_agent], [topic_task])
+            result = self._kickoff(topic_crew, "get_topic_page")
+            session.fill(general_area, self._index_topics(result), result.raw)
+        
+        return session.next_page()
+
+    def _index_topics(self, result) -> List["DiscoveredTopic"]:
+        """
+        Topics of a discovery run, added to topic_index
+        
+        Falls back to parsing the numbered text when the LLM's answer didn't
+        validate against TopicDiscoveryResult.
+        """
+        from tools.topic_index import DiscoveredTopic, TopicDiscoveryResult
+        
+        structured = getattr(result, "pydantic", None)
+        if isinstance(structured, TopicDiscoveryResult):
+            topics = structured.topics
+        else:
+            raw = getattr(result, "raw", None) or str(result)
+            topics = [DiscoveredTopic.from_pooled(topic) for topic in parse_numbered_topics(raw)]
+        return self.topic_index.add(topics)
+
+    def get_topic(self, topic_id: str) -> Optional["DiscoveredTopic"]:
+        """Look up a discovered topic by id (None if it was never discovered or was evicted)"""
+        return self.topic_index.get(topic_id)
+
+    def create_linkedin_post_from_topic(self, topic: Union[str, "DiscoveredTopic"]):
+        """
+        Create a LinkedIn post about a topic found by topic discovery
+        
+        The facts discovery already gathered for the topic (context, key
+        details, sources) are handed to the research task, so research only
+        searches for what is missing instead of starting from scratch.
+        
+        Args:
+            topic: A DiscoveredTopic, or its id in topic_index
+            
+        Returns:
+            The final LinkedIn post content
+        """
+        if isinstance(topic, str):
+            found = self.topic_index.get(topic)
+            if found is None:
+                raise ValueError(f"Unknown topic id '{topic}': run get_hot_topics or get_topic_page first")
+            topic = found
+        research_agent, content_creator_agent = self._worker_agents()
+        return self._run_post_pipeline(
+            research_agent,
+            content_creator_agent,
+            topic.title,
+            known_context=topic.brief(),
+        )
 
     def create_linkedin_post(self, topic: str = None):
         """
         Create a LinkedIn post based on research findings
         
+        Research is reused from the research store when this topic was
+        researched recently (by research_only or an earlier post); call
+        invalidate_research(topic) first to force a new research pass.
+        
         Args:
             topic: Optional specific topic to research. If None, will search for general trends
             
         Returns:
             The final LinkedIn post content
         """
+        research_agent, content_creator_agent = self._worker_agents()
+        return self._run_post_pipeline(research_agent, content_creator_agent, topic)
+
+    def create_linkedin_post_variants(
+        self,
+        topic: str = None,
+        variants: Optional[List[str]] = None,
+        concurrency: int = 3,
+    ) -> List[PostVariant]:
+        """
+        Write several variants of a post from a single research pass
+        
+        Research runs once (or comes from the research store), then one
+        content task per variant runs in parallel against the same brief, so
+        N variants cost one research pass plus N writing passes.
+        
+        Args:
+            topic: Optional specific topic to research. If None, will search for general trends
+            variants: Style instructions per variant (hook, length, tone). Defaults to DEFAULT_POST_VARIANTS
+            concurrency: Maximum number of content tasks running at once
+            
+        Returns:
+            A PostVariant per requested variant, in the same order
+        """
+        from tasks.content_creation_task import DEFAULT_POST_VARIANTS
+        
+        variants = list(variants) if variants else list(DEFAULT_POST_VARIANTS)
+        stored = self.research_store.get(topic) if self.research_store else None
+        brief = stored.brief if stored is not None else str(self.research_only(topic))
+        
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(variants))),
+            thread_name_prefix="linkedin-variant",
+        ) as executor:
+            return list(executor.map(lambda variant: self._write_variant(brief, variant), variants))
+
+    def _write_variant(self, brief: str, variant: str) -> PostVariant:
+        """Run one content task for a variant on a pooled copy of the content creator"""
+        from tasks.content_creation_task import create_content_creation_task
+        
+        start = time.perf_counter()
+        try:
+            agent = self._variant_agents.get_nowait()
+        except queue.Empty:
+            agent = self.content_creator_agent.copy()
+        try:
+            content_task = create_content_creation_task(agent, research_brief=brief, variant=variant)
+            crew = self._sequential_crew([agent], [content_task])
+            post = self._kickoff(crew, "create_linkedin_post_variant")
+            return PostVariant(variant=variant, post=str(post), elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return PostVariant(variant=variant, error=str(e), elapsed=time.perf_counter() - start)
+        finally:
+            self._variant_agents.put(agent)
+
+    def stream_linkedin_post(self, topic: str = None) -> Iterator[StreamEvent]:
+        """
+        Create a LinkedIn post, yielding progress and the post as it is written
+        
+        Research progress arrives as "status" events, then the content
+        creator's output as "token" events while the LLM generates it, and
+        finally one "done" event with the complete post (or "error"). Closing
+        the generator early cancels the pipeline at its next agent step, so
+        the content LLM call is skipped when the caller leaves during research.
+        
+        Args:
+            topic: Optional specific topic to research. If None, will search for general trends
+            
+        Yields:
+            StreamEvent items; the last one has kind "done", "error" or "cancelled"
+        """
+        events, subscription = self._start_post_stream(topic)
+        try:
+            while True:
+                event = events.get()
+                yield event
+                if event.kind in TERMINAL_KINDS:
+                    return
+        finally:
+            subscription.cancel()
+
+    async def astream_linkedin_post(self, topic: str = None) -> AsyncIterator[StreamEvent]:
+        """Async iterator variant of stream_linkedin_post"""
+        import asyncio
+        
+        events, subscription = self._start_post_stream(topic)
+        try:
+            while True:
+                event = await asyncio.to_thread(events.get)
+                yield event
+                if event.kind in TERMINAL_KINDS:
+                    return
+        finally:
+            subscription.cancel()
+
+    def _start_post_stream(self, topic: Optional[str]):
+        """Run the post pipeline on a background thread that feeds a queue of StreamEvents"""
+        events: "queue.Queue[StreamEvent]" = queue.Queue()
+        research_agent, content_creator_agent = agents = self._checkout_stream_agents()
+        subscription = PostStreamSubscription(events.put, token_roles={content_creator_agent.role})
+        
+        def run():
+            try:
+                with subscription.attach():
+                    result = self._run_post_pipeline(research_agent, content_creator_agent, topic)
+                events.put(StreamEvent("done", str(result)))
+            except StreamCancelled:
+                events.put(StreamEvent("cancelled"))
+            except Exception as e:
+                events.put(StreamEvent("error", str(e)))
+            finally:
+                self._stream_agents.put(agents)
+        
+        # Run in a copy of the caller's context so e.g. its request priority applies
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(run,), name="linkedin-post-stream", daemon=True).start()
+        return events, subscription
+
+    def _checkout_stream_agents(self):
+        """
+        Take an idle pair of streaming agents, building one if none is free
+        
+        Streaming agents are copies of the crew's agents whose content
+        creator LLM has stream=True and whose step_callback honours
+        cancellation. Pairs are returned to the pool after each run.
+        """
+        try:
+            return self._stream_agents.get_nowait()
+        except queue.Empty:
+            research_agent = self.research_agent.copy()
+            content_creator_agent = self.content_creator_agent.copy()
+            # Agent.copy() makes a shallow copy of the LLM, so this doesn't affect the originals
+            content_creator_agent.llm.stream = True
+            research_agent.step_callback = abort_if_cancelled
+            content_creator_agent.step_callback = abort_if_cancelled
+            return research_agent, content_creator_agent
+
+    def create_linkedin_posts(self, topics: Iterable[Optional[str]], concurrency: int = 4) -> Iterator[PostResult]:
+        """
+        Create LinkedIn posts for many topics concurrently
+        
+        Each worker thread runs its own research→content pipeline with copies
+        of the crew's agents. The copies share the same LinkupSearchTool, so
+        the pooled Linkup client and the search cache are shared too. A failure
+        on one topic is reported in its PostResult and doesn't affect the others.
+        Their Linkup calls run at batch priority, so an interactive request
+        sharing the process isn't stuck behind the whole batch.
+        
+        Args:
+            topics: Topics to write about (None researches general trends)
+            concurrency: Maximum number of pipelines running at once
+            
+        Yields:
+            A PostResult for each topic, in completion order
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, concurrency),
+            thread_name_prefix="linkedin-post",
+        )
+        try:
+            futures = [executor.submit(self._create_post_isolated, topic) for topic in topics]
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            # Don't start queued topics if the caller stops consuming early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _create_post_isolated(self, topic: Optional[str]) -> PostResult:
+        """Run one pipeline on the calling worker thread and capture its outcome"""
+        start = time.perf_counter()
+        try:
+            research_agent, content_creator_agent = self._worker_agents()
+            # Bulk work yields Linkup capacity to interactive requests
+            with request_priority("batch"):
+                post = self._run_post_pipeline(research_agent, content_creator_agent, topic)
+            return PostResult(topic=topic, post=str(post), elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return PostResult(topic=topic, error=str(e), elapsed=time.perf_counter() - start)
+
+    def _worker_agents(self):
+        """
+        Return agents owned by the current thread
+        
+        crewai agents keep per-execution state, so concurrent pipelines can't
+        share one Agent instance. Copies are made once per thread and reused;
+        the crew's own agents never run, they are only copied.
+        """
+        state = self._worker_state
+        if not hasattr(state, "agents"):
+            state.agents = (self.research_agent.copy(), self.content_creator_agent.copy())
+        return state.agents
+
+    def _run_post_pipeline(
+        self,
+        research_agent,
+        content_creator_agent,
+        topic: Optional[str] = None,
+        known_context: Optional[str] = None,
+    ):
+        """
+        Build and run the research→content crew for one topic
+        
+        When the research store holds a fresh brief for the topic, only the
+        content task runs, against that brief. Otherwise the research task's
+        output is stored for the next post on the same topic. known_context
+        is passed to the research task as facts that needn't be searched again.
+        """
+        from tasks.research_task import create_research_task
+        from tasks.content_creation_task import create_content_creation_task
+        
+        stored = self.research_store.get(topic) if self.research_store else None
+        if stored is not None:
+            logger.info("♻️  Reusing research brief for '%s' (%.0fs old)", topic or "general trends", stored.age)
+            content_task = create_content_creation_task(content_creator_agent, research_brief=stored.brief)
+            crew = self._sequential_crew([content_creator_agent], [content_task])
+            return self._kickoff(crew, "create_linkedin_post")
+        
         # Create tasks
-        research_task = create_research_task(self.research_agent, topic)
-        content_task = create_content_creation_task(self.content_creator_agent, research_task)
+        research_task = create_research_task(research_agent, topic, known_context=known_context)
+        content_task = create_content_creation_task(content_creator_agent, research_task)
         
         # Create crew
-        crew = Crew(
-            agents=[self.research_agent, self.content_creator_agent],
-            tasks=[research_task, content_task],
-            process=Process.sequential,
-            verbose=True
-        )
+        crew = self._sequential_crew([research_agent, content_creator_agent], [research_task, content_task])
         
         # Execute the workflow
-        result = crew.kickoff()
+        with self._fresh_if_invalidated(topic):
+            result = self._kickoff(crew, "create_linkedin_post")
+        self._store_research(topic, research_task)
         return result
     
     def research_only(self, topic: str = None):
@@ -82,23 +461,153 @@ class LinkedInContentCrew:
         Returns:
             Research findings
         """
-        research_task = create_research_task(self.research_agent, topic)
+        from tasks.research_task import create_research_task
         
-        crew = Crew(
-            agents=[self.research_agent],
-            tasks=[research_task],
-            process=Process.sequential,
-            verbose=True
-        )
+        research_agent, _ = self._worker_agents()
+        research_task = create_research_task(research_agent, topic)
+        
+        crew = self._sequential_crew([research_agent], [research_task])
+        
+        with self._fresh_if_invalidated(topic):
+            result = self._kickoff(crew, "research_only")
+        self._store_research(topic, research_task)
+        return result
+
+    def invalidate_research(self, topic: str = None):
+        """
+        Force fresh research for a topic on its next post or research_only call
+        
+        Drops the topic's brief from the research store, and runs the next
+        research pass for it inside fresh_completions() and fresh_searches().
+        That pass skips the LLM completion cache and the Linkup search cache,
+        calls the model and Linkup again, and writes the new answers back to
+        both caches.
+        """
+        if self.research_store:
+            self.research_store.invalidate(topic)
+        with self._stale_lock:
+            self._stale_topics.add(self._topic_key(topic))
+
+    @staticmethod
+    def _topic_key(topic: Optional[str]) -> str:
+        return " ".join((topic or "").lower().split())
+
+    @contextlib.contextmanager
+    def _fresh_if_invalidated(self, topic: Optional[str]):
+        """Bypass the LLM and search caches when topic was invalidated; it stays stale until a run succeeds"""
+        key = self._topic_key(topic)
+        with self._stale_lock:
+            stale = key in self._stale_topics
+        if not stale:
+            yield
+            return
+        
+        from tools.llm_cache import fresh_completions
+        from tools.search_cache import fresh_searches
+        
+        logger.info("🔄 Researching '%s' without cached answers", topic or "general trends")
+        with fresh_completions(), fresh_searches():
+            yield
+        with self._stale_lock:
+            self._stale_topics.discard(key)
+
+    def _store_research(self, topic: Optional[str], research_task) -> None:
+        output = getattr(research_task, "output", None)
+        if self.research_store and output is not None and output.raw:
+            self.research_store.put(topic, output.raw)
+
+    @staticmethod
+    def _sequential_crew(agents: list, tasks: list) -> "Crew":
+        """Wrap agents and tasks in a sequential Crew with the profile's verbosity"""
+        from crewai import Crew, Process
+        
+        return Crew(agents=agents, tasks=tasks, process=Process.sequential, verbose=crew_verbose())
+
+    def _kickoff(self, crew: "Crew", label: str):
+        """
+        Run a crew and record its LLM token usage in usage_log
+        
+        Comparing prompt_tokens with LINKUP_INLINE_ANALYSIS_GUIDANCE on and off
+        shows what repeating the tool's analysis guidance costs per run.
+        Usage is measured as the change in each agent's token counters, since
+        crewai's token_usage accumulates over the lifetime of a (warm) agent.
+        With tracing enabled the run is recorded as a span and each agent's
+        share of the tokens is reported as a metric.
+        """
+        before = {id(agent): self._agent_usage(agent) for agent in crew.agents}
+        with span("crew.run", run=label):
+            result = crew.kickoff()
+        
+        totals = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "successful_requests": 0}
+        for agent in crew.agents:
+            after, previous = self._agent_usage(agent), before[id(agent)]
+            spent = {key: after[key] - previous[key] for key in totals}
+            for key in totals:
+                totals[key] += spent[key]
+            if tracing_enabled():
+                observe("llm_prompt_tokens", spent["prompt_tokens"], agent=agent.role, run=label)
+                observe("llm_completion_tokens", spent["completion_tokens"], agent=agent.role, run=label)
+        
+        from tools.linkup_tool import analysis_guidance_inline
         
-        result = crew.kickoff()
+        self.usage_log.append({"run": label, **totals, "inline_guidance": analysis_guidance_inline()})
+        logger.info("📊 %s: %d prompt tokens, %d completion tokens", label, totals["prompt_tokens"], totals["completion_tokens"])
         return result
 
+    @staticmethod
+    def _agent_usage(agent) -> dict:
+        """Cumulative token counters of an agent so far"""
+        process = getattr(agent, "_token_process", None)
+        if process is None:
+            return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "successful_requests": 0}
+        summary = process.get_summary()
+        return {
+            "prompt_tokens": summary.prompt_tokens,
+            "completion_tokens": summary.completion_tokens,
+            "total_tokens": summary.total_tokens,
+            "successful_requests": summary.successful_requests,
+        }
+
+
+_shared_crew: Optional[LinkedInContentCrew] = None
+_shared_crew_lock = threading.Lock()
+
+
+def get_shared_crew() -> LinkedInContentCrew:
+    """
+    Return a process-wide LinkedInContentCrew with warm agents
+    
+    Long-running services should use this instead of constructing a crew per
+    request: agents and tools are built once, and each call only creates its
+    tasks and a lightweight Crew around them. It is safe to call from many
+    threads at once, since every run uses its thread's own copies of the agents.
+    """
+    global _shared_crew
+    
+    with _shared_crew_lock:
+        if _shared_crew is None:
+            _shared_crew = LinkedInContentCrew()
+        return _shared_crew
+
 
-def main():
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Research trending topics with Linkup and turn them into LinkedIn posts. "
+                    "Without options, an interactive menu asks how to pick the topic."
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--topic", help="Research this topic and write a post about it, without the menu")
+    source.add_argument("--trends", action="store_true", help="Write a post from general trends, without the menu")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main function to demonstrate the LinkedIn content creation workflow
     """
+    args = build_arg_parser().parse_args(argv)
+    configure_logging()
+    
     # Check if required environment variables are set
     if not os.getenv("LINKUP_API_KEY"):
         print("⚠️  Warning: LINKUP_API_KEY environment variable not set")
@@ -113,64 +622,77 @@ def main():
     # Initialize the crew
     crew = LinkedInContentCrew()
     
+    # Keeps default and popular searches warm when TREND_PREFETCH_INTERVAL is set
+    from tools.prefetcher import get_trend_prefetcher
+    get_trend_prefetcher()
+    
     # Example usage
     print("🚀 Starting LinkedIn Content Creation Workflow...")
     print("=" * 60)
     
-    # Ask user for workflow preference
-    print("Choose your workflow:")
-    print("1. Get 5 hottest topics and choose one")
-    print("2. Enter a specific topic directly")
-    print("3. Let AI choose from general trends")
-    
-    choice = input("\nEnter your choice (1, 2, or 3): ").strip()
+    chosen = None
+    if args.topic or args.trends:
+        # Topic given on the command line
+        choice = None
+        topic = args.topic
+    else:
+        # Ask user for workflow preference
+        print("Choose your workflow:")
+        print("1. Get 5 hottest topics and choose one")
+        print("2. Enter a specific topic directly")
+        print("3. Let AI choose from general trends")
+        
+        choice = input("\nEnter your choice (1, 2, or 3): ").strip()
     
     try:
-        if choice == "1":
+        if choice is None:
+            pass
+        
+        elif choice == "1":
             # Get hot topics workflow with feedback loop
             print("\n🔍 Discovering the hottest topics...")
             general_area = input("Enter a general area (e.g., 'AI', 'enterprise tech') or press Enter for default: ").strip()
             general_area = general_area if general_area else None
             
+            session = crew.new_topic_session()
+            hot_topics = None
             while True:
-                hot_topics = crew.get_hot_topics(general_area)
-                
-                print("\n" + "=" * 60)
-                print("🔥 HOTTEST TOPICS:")
-                print("=" * 60)
-                print(hot_topics)
-                
-                # Let user choose or request new topics
-                print("\n" + "=" * 60)
-                print("Options:")
-                print("• Enter 1-5 to create a post about that topic")
-                print("• Enter 'new' to get different topics")
-                print("• Enter 'refresh' to search again with custom instructions")
+                if hot_topics is None:
+                    hot_topics = crew.get_topic_page(session, general_area)
+                    
+                    print("\n" + "=" * 60)
+                    print("🔥 HOTTEST TOPICS:")
+                    print("=" * 60)
+                    if hot_topics:
+                        print("\n\n".join(t.render(i) for i, t in enumerate(hot_topics, 1)))
+                    else:
+                        print(session.last_raw_output)
+                    
+                    # Let user choose or request new topics
+                    print("\n" + "=" * 60)
+                    print("Options:")
+                    if hot_topics:
+                        print(f"• Enter 1-{len(hot_topics)} to create a post about that topic")
+                    print("• Enter 'new' to get different topics")
+                    print("• Enter 'refresh' to search again with custom instructions")
                 
                 user_input = input("\nYour choice: ").strip().lower()
                 
-                if user_input in ["1", "2", "3", "4", "5"]:
-                    # Extract the chosen topic title from the response
-                    lines = str(hot_topics).split('\n')
-                    topic_line = None
-                    for line in lines:
-                        if line.strip().startswith(f"{user_input}."):
-                            topic_line = line
-                            break
-                    
-                    if topic_line:
-                        # Extract topic title (remove number and clean up)
-                        topic = topic_line.split('.', 1)[1].strip()
-                        topic = topic.split('\n')[0].strip()  # Get just the title
-                        print(f"\n✅ Creating post about: {topic}")
+                if user_input.isdigit():
+                    index = int(user_input) - 1
+                    if 0 <= index < len(hot_topics):
+                        chosen = hot_topics[index]
+                        print(f"\n✅ Creating post about: {chosen.title}")
                         break
+                    if hot_topics:
+                        print(f"❌ No topic {user_input}. Enter a number from 1 to {len(hot_topics)}.")
                     else:
-                        topic = "AI infrastructure trends"
-                        print(f"\n⚠️  Could not parse topic, using default: {topic}")
-                        break
+                        print("❌ No topics could be read from that search. Enter 'new' or 'refresh' to search again.")
+                    continue
                         
                 elif user_input == "new":
-                    print("\n🔄 Searching for different topics...")
+                    print("\n🔄 Getting different topics...")
+                    hot_topics = None
                     continue
                     
                 elif user_input == "refresh":
@@ -182,12 +704,15 @@ def main():
                         # Use custom instruction as the general area
                         general_area = custom_instruction
                         print(f"\n🔍 Searching for topics that are: {custom_instruction}")
+                    hot_topics = None
                     continue
                     
                 else:
-                    print("❌ Invalid choice. Using default topic.")
-                    topic = "AI infrastructure trends"
-                    break
+                    if hot_topics:
+                        print(f"❌ Invalid choice. Enter 1-{len(hot_topics)}, 'new' or 'refresh'.")
+                    else:
+                        print("❌ Invalid choice. Enter 'new' or 'refresh'.")
+                    continue
                 
         elif choice == "2":
             # Direct topic entry
@@ -205,7 +730,10 @@ def main():
         
         # Create a LinkedIn post
         print(f"\n🔍 Researching and creating LinkedIn post...")
-        result = crew.create_linkedin_post(topic)
+        if chosen is not None:
+            result = crew.create_linkedin_post_from_topic(chosen)
+        else:
+            result = crew.create_linkedin_post(topic)
         
         print("\n" + "=" * 60)
         print("📝 FINAL LINKEDIN POST:")
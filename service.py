@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Job-queue service: run LinkedIn post generation across worker processes
+
+Jobs are submitted to a SQLite queue and picked up by a pool of worker
+processes, each holding its own warm LinkedInContentCrew. A supervisor
+restarts workers that crash and kills workers whose job runs past its
+timeout (e.g. a hung LLM call), so one bad job never takes the service
+down. Run from the project root:
+
+    uv run service.py serve --workers 4
+    uv run service.py submit --topic "AI chips"          # prints the job id
+    uv run service.py status <job id>
+    uv run service.py result <job id> --wait 120
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from tools.job_queue import Job, JobQueue, QueueFull, get_job_queue
+from tools.runtime_profile import configure_logging, get_logger
+
+load_dotenv()
+
+logger = get_logger("service")
+
+
+def _run_post(crew, payload: Dict[str, Any]) -> str:
+    return str(crew.create_linkedin_post(payload.get("topic")))
+
+
+def _run_research(crew, payload: Dict[str, Any]) -> str:
+    return str(crew.research_only(payload.get("topic")))
+
+
+def _run_variants(crew, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    variants = crew.create_linkedin_post_variants(payload.get("topic"), variants=payload.get("variants"))
+    return [{"variant": v.variant, "post": v.post, "error": v.error} for v in variants]
+
+
+# Job kind -> handler(crew, payload) returning a JSON-serializable result
+JOB_HANDLERS: Dict[str, Callable[[Any, Dict[str, Any]], Any]] = {
+    "post": _run_post,
+    "research": _run_research,
+    "variants": _run_variants,
+}
+
+
+def submit(kind: str = "post", topic: Optional[str] = None, timeout: Optional[float] = None, **payload: Any) -> str:
+    """
+    Queue a job and return its id
+
+    Args:
+        kind: One of JOB_HANDLERS ("post", "research" or "variants")
+        topic: Topic for the job (None researches general trends)
+        timeout: Seconds the job may run (default SERVICE_JOB_TIMEOUT)
+        payload: Extra handler arguments, e.g. variants=[...] for "variants"
+
+    Raises:
+        QueueFull: Too many jobs are pending; back off and retry
+    """
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind {kind!r}, expected one of {', '.join(JOB_HANDLERS)}")
+    return get_job_queue().submit(kind, {"topic": topic, **payload}, timeout=timeout)
+
+
+def status(job_id: str) -> Optional[Dict[str, Any]]:
+    """Current state of a job (without its result), or None for an unknown id"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return None
+    state = job.to_dict()
+    state.pop("result")
+    return state
+
+
+def result(job_id: str, wait: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    A job's result, waiting up to wait seconds for it to finish
+
+    Returns:
+        The job state including "result" (None until the job is done), or None for an unknown id
+    """
+    job = get_job_queue().wait(job_id, timeout=wait or 0)
+    return job.to_dict() if job is not None else None
+
+
+def worker_main(db_path: str, stop: Any) -> None:
+    """
+    Worker process: build one warm crew, then run jobs until stop is set
+
+    A failing job is marked failed and the worker moves on. Crashes and
+    timeouts are handled by the supervisor, which owns this process.
+    """
+    # SIGINT goes to the whole process group; let the supervisor decide when workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    configure_logging()
+    from crew import get_shared_crew
+
+    queue = JobQueue(db_path)
+    crew = get_shared_crew()
+    pid = os.getpid()
+    logger.info("👷 Worker %d ready", pid)
+
+    while not stop.is_set():
+        job = queue.claim(pid)
+        if job is None:
+            stop.wait(0.2)
+            continue
+        logger.info("▶️  Worker %d running %s job %s (attempt %d)", pid, job.kind, job.id, job.attempts)
+        try:
+            handler = JOB_HANDLERS[job.kind]
+            queue.complete(job.id, handler(crew, job.payload))
+            logger.info("✅ Job %s done", job.id)
+        except Exception as e:
+            queue.fail(job.id, f"{type(e).__name__}: {e}")
+            logger.warning("❌ Job %s failed: %s", job.id, e)
+
+
+class WorkerService:
+    """
+    Supervises a pool of worker processes sharing one job queue
+
+    Workers are started with the "spawn" method, so each is a fresh
+    interpreter with its own crew, connection pool and caches. Every
+    ``check_interval`` seconds the supervisor:
+
+    - kills the worker of any job running past its timeout, then requeues
+      the job (or fails it after ``max_attempts``),
+    - does the same for jobs whose worker died, and starts a replacement worker.
+
+    The supervisor also runs the service's only trend prefetcher (when
+    TREND_PREFETCH_INTERVAL is set), so the hourly quota holds however many
+    workers there are. It writes to the shared on-disk search cache, and
+    the topics of started jobs count towards its popular queries.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        workers: int = 2,
+        max_attempts: int = 2,
+        check_interval: float = 0.5,
+    ):
+        self.queue = queue
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.check_interval = check_interval
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes: List[multiprocessing.Process] = []
+        self._counters = {"restarts": 0, "timeouts": 0, "crashes": 0}
+        self.prefetcher = None
+        self._seen_running: set = set()
+
+    def _spawn(self) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=worker_main,
+            args=(self.queue.db_path, self._stop),
+            name="linkedin-worker",
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    def start(self) -> "WorkerService":
+        # Jobs left running by a previous service instance have no live worker
+        for job in self.queue.running():
+            self.queue.retry_or_fail(job.id, "Service restarted while the job was running", self.max_attempts)
+        self._processes = [self._spawn() for _ in range(self.workers)]
+        logger.info("🚀 Started %d workers on %s", self.workers, self.queue.db_path)
+        from tools.prefetcher import get_trend_prefetcher
+        self.prefetcher = get_trend_prefetcher()
+        return self
+
+    def _release(self, job: Job, reason: str) -> None:
+        new_status = self.queue.retry_or_fail(job.id, reason, self.max_attempts)
+        logger.warning("⚠️  Job %s: %s (%s)", job.id, reason, "requeued" if new_status == "queued" else new_status)
+
+    def check(self) -> None:
+        """One supervision pass: enforce job timeouts and replace dead workers"""
+        now = time.time()
+        by_pid = {process.pid: process for process in self._processes}
+        running = self.queue.running()
+        if self.prefetcher is not None:
+            # Workers' tool calls are counted in their own processes, so count job topics here
+            for job in running:
+                if job.id not in self._seen_running and job.payload.get("topic"):
+                    self.prefetcher.frequency.record(job.payload["topic"])
+            self._seen_running = {job.id for job in running}
+        for job in running:
+            process = by_pid.get(job.worker_pid)
+            if process is None or not process.is_alive():
+                if process is not None:
+                    continue  # handled below together with the restart
+                self._release(job, "Worker lost")
+            elif job.deadline is not None and now > job.deadline:
+                process.kill()
+                process.join()
+                self._counters["timeouts"] += 1
+                self._release(job, f"Timed out after {job.timeout:.0f}s")
+
+        for index, process in enumerate(self._processes):
+            if process.is_alive() or self._stop.is_set():
+                continue
+            for job in self.queue.running():
+                if job.worker_pid == process.pid:
+                    self._counters["crashes"] += 1
+                    self._release(job, f"Worker crashed (exit code {process.exitcode})")
+            logger.warning("♻️  Worker %d exited (code %s); starting a replacement", process.pid, process.exitcode)
+            self._processes[index] = self._spawn()
+            self._counters["restarts"] += 1
+
+    def serve_forever(self) -> None:
+        try:
+            while not self._stop.is_set():
+                self.check()
+                time.sleep(self.check_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self, grace: float = 10.0) -> None:
+        """Let workers finish their current job for up to grace seconds, then kill them"""
+        self._stop.set()
+        if self.prefetcher is not None:
+            self.prefetcher.stop(timeout=grace)
+        deadline = time.monotonic() + grace
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+        for process in self._processes:
+            if process.is_alive():
+                process.kill()
+                process.join()
+        for job in self.queue.running():
+            self.queue.retry_or_fail(job.id, "Service stopped while the job was running", self.max_attempts)
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = dict(self._counters)
+        stats["alive"] = sum(process.is_alive() for process in self._processes)
+        stats["jobs"] = self.queue.counts()
+        if self.prefetcher is not None:
+            stats["prefetch"] = self.prefetcher.stats()
+        return stats
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Job-queue service for LinkedIn post generation")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run the worker pool until interrupted")
+    serve.add_argument("--workers", type=int, default=int(os.getenv("SERVICE_WORKERS") or os.cpu_count() or 2))
+    serve.add_argument("--max-attempts", type=int, default=int(os.getenv("SERVICE_MAX_ATTEMPTS", "2")),
+                       help="Runs per job before a crash or timeout fails it")
+
+    submit_cmd = commands.add_parser("submit", help="Queue a job and print its id")
+    submit_cmd.add_argument("--kind", choices=sorted(JOB_HANDLERS), default="post")
+    submit_cmd.add_argument("--topic", help="Topic to write about (default: general trends)")
+    submit_cmd.add_argument("--timeout", type=float, help="Seconds the job may run")
+    submit_cmd.add_argument("--wait", type=float, help="Also wait up to this many seconds and print the result")
+
+    status_cmd = commands.add_parser("status", help="Print a job's state")
+    status_cmd.add_argument("job_id")
+
+    result_cmd = commands.add_parser("result", help="Print a job's result")
+    result_cmd.add_argument("job_id")
+    result_cmd.add_argument("--wait", type=float, default=0, help="Seconds to wait for the job to finish")
+    return parser
+
+
+def _print_job(job: Optional[Dict[str, Any]]) -> int:
+    if job is None:
+        print("❌ Unknown job id")
+        return 1
+    print(json.dumps(job, indent=2))
+    return 0 if job["status"] != "failed" else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    configure_logging()
+
+    if args.command == "serve":
+        service = WorkerService(get_job_queue(), workers=args.workers, max_attempts=args.max_attempts).start()
+        signal.signal(signal.SIGTERM, lambda *_: service._stop.set())
+        service.serve_forever()
+        return 0
+
+    if args.command == "submit":
+        try:
+            job_id = submit(args.kind, args.topic, timeout=args.timeout)
+        except QueueFull as e:
+            print(f"⏳ Queue full: {e}")
+            return 2
+        print(job_id)
+        return _print_job(result(job_id, args.wait)) if args.wait else 0
+
+    if args.command == "status":
+        return _print_job(status(args.job_id))
+
+    return _print_job(result(args.job_id, args.wait))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,37 @@
 from crewai import Task
+from typing import Optional
 
 
-def create_content_creation_task(agent, research_output):
+# Default styles for A/B post variants: each changes the hook, length and tone
+DEFAULT_POST_VARIANTS = [
+    "Hook: a specific number or statistic. Length: 150-200 words. Tone: confident and direct.",
+    "Hook: a question the reader can't ignore. Length: under 100 words. Tone: conversational.",
+    "Hook: a short scene or story. Length: 250-300 words. Tone: reflective.",
+    "Hook: a contrarian statement. Length: 120-180 words. Tone: bold but respectful.",
+]
+
+
+def create_content_creation_task(
+    agent,
+    research_output=None,
+    research_brief: Optional[str] = None,
+    variant: Optional[str] = None,
+):
     """
     Creates a content creation task for writing LinkedIn posts based on research
     
     Args:
         agent: The content creator agent to assign this task to
-        research_output: The output from the research task
+        research_output: The research task whose output is passed as context
+        research_brief: Stored research to write from instead, when no research task runs
+        variant: Optional style instructions (hook, length, tone) for an A/B variant
     """
+    brief_section = ""
+    if research_brief:
+        brief_section = f"\n\n### RESEARCH BRIEF:\n{research_brief.strip()}"
+    if variant:
+        brief_section += f"\n\n### VARIANT STYLE (follow this over the defaults above):\n{variant.strip()}"
+    
     return Task(
         description=(
             """## Create a thoughtful LinkedIn post that demonstrates professional insight and perspective. 
@@ -51,7 +74,7 @@ def create_content_creation_task(agent, research_output):
             - REAL EXAMPLES: Use specific companies, numbers, and concrete facts\n"
             - NO MARKETING SPEAK: Write like you're explaining to a colleague, not selling something\n"
             - HUMAN TONE: Sound like a real person, not a robot or marketing copy"""
-        ).strip(),
+        ).strip() + brief_section,
         expected_output=(
             """## A simple, direct LinkedIn post that provides real value:
             1. POWERFUL HOOK: Start with a shocking fact, specific number, or bold statement that stops scrolling
@@ -66,6 +89,7 @@ def create_content_creation_task(agent, research_output):
             No semicolons or formal language. Start with a hook that grabs attention immediately. 
             Use everyday words to communicate sophisticated insights. The value comes from what you say, not how fancy you say it."""
         ).strip(),
+        name="content_creation",
         agent=agent,
         context=[research_output] if research_output else []
     ) 
\ No newline at end of file
@@ -1,15 +1,31 @@
 from crewai import Task
+from tools.linkup_tool import analysis_guidance_for_task
+from typing import Optional
 
 
-def create_research_task(agent, topic: str = None):
+# What the research agent searches for when no topic is given
+DEFAULT_RESEARCH_QUERY = "latest professional trends linkedin content strategy"
+
+
+def create_research_task(agent, topic: str = None, known_context: Optional[str] = None):
     """
     Creates a research task for finding trending topics and content insights
     
     Args:
         agent: The research agent to assign this task to
         topic: Optional specific topic to research. If None, will search for general trends
+        known_context: Facts already gathered for the topic (e.g. by topic discovery), so the
+            agent only searches for what is missing
     """
-    search_query = topic if topic else "latest professional trends linkedin content strategy"
+    search_query = topic if topic else DEFAULT_RESEARCH_QUERY
+    
+    gathered = ""
+    if known_context:
+        gathered = (
+            f"\n\n### ALREADY GATHERED (from topic discovery):\n{known_context.strip()}\n\n"
+            "Build the brief from these facts. Don't search again for what they already cover; "
+            "only use the Linkup Search Tool if essential details are missing."
+        )
     
     return Task(
         description=(
@@ -38,7 +54,7 @@ def create_research_task(agent, topic: str = None):
             - Target audience insights
             - Recommended tone and style
             - Potential engagement hooks"""
-        ).strip(),
+        ).strip() + gathered + analysis_guidance_for_task(),
         expected_output=(
             """## A viral-potential content brief containing:
             1. VIRAL TOPICS: 2-3 trending topics from ANY area (tech, culture, news, business) 
@@ -54,5 +70,6 @@ def create_research_task(agent, topic: str = None):
             7. SHAREABILITY FACTORS: Elements that make content likely to be shared and discussed
             8. SPECIFIC EXAMPLES: Real companies, people, events, or incidents that are trending now"""
         ).strip(),
+        name="research",
         agent=agent
     ) 
\ No newline at end of file
@@ -1,15 +1,32 @@
 from crewai import Task
 from agents.research_agent import create_research_agent
-from tools.linkup_tool import LinkupSearchTool
-from typing import Optional
+from tools.linkup_tool import analysis_guidance_for_task
+from tools.topic_index import TopicDiscoveryResult
+from typing import List, Optional
 
 
-def create_topic_discovery_task(general_area: Optional[str] = None) -> Task:
+# Search focus when no general area is given
+DEFAULT_SEARCH_FOCUS = "viral trending moments"
+
+
+def create_topic_discovery_task(
+    general_area: Optional[str] = None,
+    agent=None,
+    topic_count: int = 5,
+    exclude_titles: Optional[List[str]] = None,
+) -> Task:
     """
-    Create a task for discovering the 5 hottest topics for LinkedIn content.
+    Create a task for discovering the hottest topics for LinkedIn content.
+    
+    The task's output is structured: its ``pydantic`` attribute holds a
+    TopicDiscoveryResult listing each topic's title, context, key details
+    and source URLs.
     
     Args:
         general_area: Optional general area to focus on (e.g. "AI", "enterprise tech", etc.)
+        agent: The research agent to assign this task to. A new one is created if omitted
+        topic_count: How many topics to discover (5 by default, more to fill a topic pool)
+        exclude_titles: Topics already shown to the user that should not be repeated
     """
     # Handle different types of user requests
     if general_area:
@@ -27,14 +44,20 @@ def create_topic_discovery_task(general_area: Optional[str] = None) -> Task:
             search_focus = general_area
             search_description = f"trending topics in {general_area}"
     else:
-        search_focus = "viral trending moments"
+        search_focus = DEFAULT_SEARCH_FOCUS
         search_description = "viral trending topics and real-time trending content"
     
+    exclusions = ""
+    if exclude_titles:
+        shown = "\n".join(f"- {title}" for title in exclude_titles)
+        exclusions = f"\n\n### ALREADY SHOWN - FIND DIFFERENT TOPICS THAN THESE:\n{shown}"
+    
     return Task(
         description=(
-            f"""## Discover the 5 hottest, most viral {search_description} for LinkedIn content creation. 
+            f"""## Discover the {topic_count} hottest, most viral {search_description} for LinkedIn content creation. 
             Your research should uncover VIRAL trending topics that are getting massive social media attention 
             and would make engaging LinkedIn content.
+            Search for: '{search_focus}'
             
             ### VIRAL DISCOVERY STRATEGY:
             1. REAL-TIME TRENDING: Current events, political developments, viral social media moments
@@ -60,15 +83,16 @@ def create_topic_discovery_task(general_area: Optional[str] = None) -> Task:
             - Look for stories that would make people stop scrolling and engage
             - Find content with genuine viral momentum and social media buzz
             - Search for specific incidents, moments, or stories people are actually discussing"""
-        ).strip(),
+        ).strip() + exclusions + analysis_guidance_for_task(),
         expected_output=(
-            """## EXACTLY 5 numbered trending topics based on the search results:
-            Format:
-            {number}. **{ENGAGING TOPIC TITLE}**
-            📰 **Context:** {What's happening - include names, companies, details when available}
-            📊 **Key Details:** {Important facts, numbers, or specifics from search results}
-            🔥 **Why It's Hot:** {Why this topic is trending or engaging}
-            🔗 **Professional Angle:** {Why this matters to professionals and business leaders}
+            f"""## EXACTLY {topic_count} trending topics based on the search results, hottest first.
+            For each topic give:
+            - title: an engaging, specific topic title
+            - context: what's happening - include names, companies, details when available
+            - key_details: important facts, numbers, or specifics from search results
+            - why_hot: why this topic is trending or engaging
+            - professional_angle: why this matters to professionals and business leaders
+            - source_urls: the URLs listed under "Sources:" in the search results this topic comes from
             
             ### SPECIFICITY GUIDELINES (Use when available):
             - Include names of people, companies, CEOs, or organizations when mentioned
@@ -85,7 +109,7 @@ def create_topic_discovery_task(general_area: Optional[str] = None) -> Task:
             ❌ 'Tech companies face challenges' (no specifics)
             
             ### CORE REQUIREMENT:
-            Create 5 engaging topics based on whatever is trending in the search results, using whatever details are available. Focus on making compelling LinkedIn content rather than forcing specific themes.
+            Create {topic_count} engaging topics based on whatever is trending in the search results, using whatever details are available. Focus on making compelling LinkedIn content rather than forcing specific themes.
             
             ### TOPIC VARIETY GOALS:
             - Mix of whatever is trending: politics, business, culture, sports, geopolitics
@@ -94,6 +118,7 @@ def create_topic_discovery_task(general_area: Optional[str] = None) -> Task:
             - Focus on topics that would generate LinkedIn engagement and discussion
             - Each topic should be relevant to professionals regardless of industry"""
         ).strip(),
-        agent=create_research_agent(),
-        tools=[LinkupSearchTool()]
+        output_pydantic=TopicDiscoveryResult,
+        name="topic_discovery",
+        agent=agent if agent is not None else create_research_agent()
     ) 
\ No newline at end of file
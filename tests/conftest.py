@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+
+class FakeClock:
+    """Stands in for time.time (or time.monotonic) so TTL tests don't have to sleep"""
+
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def monotonic(monkeypatch):
+    """FakeClock for time.monotonic; not for tests that run an event loop"""
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake)
+    return fake
+
+
+class FakeLinkupClient:
+    """
+    Stands in for the pooled LinkupClient in search tests
+
+    Each query answers after ``delays[query]`` seconds (``default_delay``
+    otherwise) with a sourced answer whose words are unique to the query, so
+    compaction never merges two answers. Queries in ``empty`` get no answer.
+    """
+
+    def __init__(self, default_delay: float = 0.01):
+        self.default_delay = default_delay
+        self.delays: Dict[str, float] = {}
+        self.empty: set = set()
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def _respond(self, query: str):
+        with self._lock:
+            self.calls.append(query)
+        if query in self.empty:
+            return SimpleNamespace(answer="", sources=[])
+        tag = zlib.crc32(query.encode())
+        words = " ".join(f"w{tag}x{i}" for i in range(12))
+        return SimpleNamespace(
+            answer=f"{query}: {words}.",
+            sources=[SimpleNamespace(url=f"https://example.com/{tag}")],
+        )
+
+    def search(self, query: str, **kwargs):
+        time.sleep(self.delays.get(query, self.default_delay))
+        return self._respond(query)
+
+    async def async_search(self, query: str, **kwargs):
+        await asyncio.sleep(self.delays.get(query, self.default_delay))
+        return self._respond(query)
+
+
+@pytest.fixture
+def linkup_client():
+    return FakeLinkupClient()
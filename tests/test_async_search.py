@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+from tests.test_parallel_search import FALLBACK, FIRST_WAVE, TOPIC, make_tool, searched
+
+
+def run(tool, client, topic=TOPIC):
+    return asyncio.run(tool._async_trending_search(client, topic))
+
+
+def test_first_wave_timing_out_before_the_hedge_still_runs_the_fallback(linkup_client):
+    for query in FIRST_WAVE:
+        linkup_client.delays[query] = 0.5
+    tool = make_tool(search_timeout=0.1, hedge_after=1.0)
+
+    output = run(tool, linkup_client)
+
+    assert sorted(searched(output)) == sorted(FALLBACK)
+
+
+def test_first_wave_runs_concurrently(linkup_client):
+    for query in FIRST_WAVE:
+        linkup_client.delays[query] = 0.2
+
+    started = time.monotonic()
+    output = run(make_tool(), linkup_client)
+
+    assert time.monotonic() - started < 0.4
+    assert sorted(searched(output)) == sorted(FIRST_WAVE)
+
+
+def test_freed_slots_do_not_start_the_fallback(linkup_client):
+    # One slot at a time: each finished first-wave search frees the only slot
+    output = run(make_tool(max_concurrent_searches=1), linkup_client)
+
+    assert linkup_client.calls == FIRST_WAVE
+    assert searched(output) == FIRST_WAVE
+
+
+def test_short_first_wave_runs_the_fallback_after_it(linkup_client):
+    linkup_client.empty.update(FIRST_WAVE[:2])
+
+    output = run(make_tool(max_concurrent_searches=1), linkup_client)
+
+    assert linkup_client.calls == FIRST_WAVE + FALLBACK
+    assert sorted(searched(output)) == sorted([FIRST_WAVE[2], *FALLBACK])
+
+
+def test_first_wave_with_sufficient_answers_is_enough(linkup_client):
+    linkup_client.empty.add(FIRST_WAVE[0])
+
+    output = run(make_tool(), linkup_client)
+
+    assert sorted(linkup_client.calls) == sorted(FIRST_WAVE)
+    assert sorted(searched(output)) == sorted(FIRST_WAVE[1:])
+
+
+def test_slow_search_is_cut_off_after_search_timeout(linkup_client):
+    linkup_client.delays[FIRST_WAVE[0]] = 1.0
+
+    started = time.monotonic()
+    output = run(make_tool(search_timeout=0.1), linkup_client)
+
+    assert time.monotonic() - started < 0.5
+    assert sorted(searched(output)) == sorted(FIRST_WAVE[1:])
+
+
+def test_late_first_wave_is_hedged_with_the_fallback(linkup_client):
+    for query in FIRST_WAVE:
+        linkup_client.delays[query] = 0.4
+
+    started = time.monotonic()
+    output = run(make_tool(hedge_after=0.1), linkup_client)
+
+    assert time.monotonic() - started < 0.8
+    results = searched(output)
+    assert len(results) == 3
+    assert set(FALLBACK) <= set(results)
+
+
+def test_exhausted_budget_returns_what_has_arrived_and_cancels_the_rest(linkup_client):
+    for query in FIRST_WAVE[1:]:
+        linkup_client.delays[query] = 1.0
+
+    started = time.monotonic()
+    output = run(make_tool(time_budget=0.2, search_timeout=2.0), linkup_client)
+
+    assert time.monotonic() - started < 0.5  # stragglers are cancelled, not awaited
+    assert searched(output) == [FIRST_WAVE[0]]
+
+
+def test_target_reached_stops_the_search(linkup_client):
+    linkup_client.delays[FIRST_WAVE[0]] = 1.0
+    tool = make_tool(hedge_after=0.05, min_results=3)
+
+    started = time.monotonic()
+    output = run(tool, linkup_client)
+
+    assert time.monotonic() - started < 0.5
+    results = searched(output)
+    assert len(results) == 3
+    assert set(FIRST_WAVE[1:]) <= set(results)
+    assert FIRST_WAVE[0] not in results
@@ -0,0 +1,79 @@
+import pytest
+
+from tools.job_queue import JobQueue, QueueFull
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.sqlite"), max_pending=3, default_timeout=60)
+
+
+def test_jobs_are_claimed_in_submission_order(queue):
+    first = queue.submit("post", {"topic": "a"})
+    second = queue.submit("research", {"topic": "b"}, timeout=5)
+
+    job = queue.claim(worker_pid=101)
+    assert (job.id, job.status, job.attempts, job.worker_pid) == (first, "running", 1, 101)
+    assert job.payload == {"topic": "a"}
+    assert job.deadline == job.started_at + 60
+
+    job = queue.claim(worker_pid=102)
+    assert (job.id, job.timeout) == (second, 5)
+    assert queue.claim(worker_pid=103) is None
+
+
+def test_complete_and_fail_store_the_outcome(queue):
+    done_id = queue.submit("post")
+    failed_id = queue.submit("post")
+    queue.claim(1)
+    queue.claim(1)
+
+    queue.complete(done_id, {"post": "hello"})
+    queue.fail(failed_id, "ValueError: bad topic")
+
+    assert queue.get(done_id).result == {"post": "hello"}
+    assert queue.get(failed_id).error == "ValueError: bad topic"
+    assert queue.counts() == {"queued": 0, "running": 0, "done": 1, "failed": 1}
+    # A late answer from a timed-out worker can't overwrite the outcome
+    queue.complete(failed_id, "late")
+    assert queue.get(failed_id).status == "failed"
+
+
+def test_lost_job_is_requeued_until_attempts_run_out(queue):
+    job_id = queue.submit("post")
+
+    queue.claim(1)
+    assert queue.retry_or_fail(job_id, "Worker lost", max_attempts=2) == "queued"
+    job = queue.get(job_id)
+    assert (job.status, job.attempts, job.worker_pid, job.started_at, job.error) == ("queued", 1, None, None, "Worker lost")
+
+    assert queue.claim(2).attempts == 2
+    assert queue.retry_or_fail(job_id, "Timed out after 60s", max_attempts=2) == "failed"
+    job = queue.get(job_id)
+    assert (job.status, job.attempts, job.error) == ("failed", 2, "Timed out after 60s")
+    assert queue.claim(3) is None
+
+
+def test_retry_of_a_job_that_is_not_running(queue):
+    job_id = queue.submit("post")
+    assert queue.retry_or_fail(job_id, "Worker lost", max_attempts=2) == "missing"
+    assert queue.get(job_id).status == "queued"
+
+
+def test_submit_refuses_work_past_max_pending(queue):
+    for _ in range(3):
+        queue.submit("post")
+    with pytest.raises(QueueFull):
+        queue.submit("post")
+
+    job = queue.claim(1)
+    queue.complete(job.id, "ok")
+    queue.submit("post")
+
+
+def test_queue_is_shared_through_the_file(queue):
+    job_id = queue.submit("post", {"topic": "shared"})
+    other = JobQueue(queue.db_path)
+    assert other.claim(7).id == job_id
+    assert [job.worker_pid for job in queue.running()] == [7]
+    assert queue.wait(job_id, timeout=0).status == "running"
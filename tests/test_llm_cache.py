@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+from tools.llm_cache import LLMCache, completion_key, fresh_completions
+
+
+MESSAGES = [{"role": "system", "content": "You write posts"}, {"role": "user", "content": "AI chips"}]
+
+
+def test_key_ignores_parameter_order_transport_and_unset_values():
+    key = completion_key({"model": "gpt-4.1", "messages": MESSAGES, "temperature": 0.7})
+    assert key == completion_key({
+        "temperature": 0.7,
+        "messages": MESSAGES,
+        "model": "gpt-4.1",
+        "timeout": 30,
+        "api_key": "sk-test",
+        "stream": True,
+        "seed": None,
+    })
+    assert len(key) == 64
+
+
+def test_key_changes_with_anything_the_model_sees():
+    base = {"model": "gpt-4.1", "messages": MESSAGES, "temperature": 0.7}
+    variants = [
+        {**base, "model": "gpt-4.1-mini"},
+        {**base, "temperature": 0.2},
+        {**base, "messages": MESSAGES[:1]},
+        {**base, "stop": ["\nObservation:"]},
+    ]
+    keys = {completion_key(params) for params in [base, *variants]}
+    assert len(keys) == len(variants) + 1
+
+
+def test_completions_expire_after_ttl(clock):
+    cache = LLMCache(ttl_seconds=60)
+    cache.set("k", "cached answer")
+
+    clock.advance(59)
+    assert cache.get("k") == "cached answer"
+    clock.advance(2)
+    assert cache.get("k") is None
+
+
+def test_completions_are_shared_through_the_file(tmp_path):
+    path = str(tmp_path / "llm.sqlite")
+    LLMCache(db_path=path).set("k", "from another process")
+    assert LLMCache(db_path=path).get("k") == "from another process"
+
+
+def test_skipped_tasks_neither_read_nor_write():
+    cache = LLMCache(skip_tasks=["content_creation"])
+    content = SimpleNamespace(name="content_creation")
+    research = SimpleNamespace(name="research")
+
+    assert not cache.reads_enabled(content) and not cache.writes_enabled(content)
+    assert cache.reads_enabled(research) and cache.writes_enabled(research)
+    assert cache.reads_enabled(None)
+
+
+def test_fresh_completions_skips_reads_only():
+    cache = LLMCache()
+    with fresh_completions():
+        assert not cache.reads_enabled()
+        assert cache.writes_enabled()
+    assert cache.reads_enabled()
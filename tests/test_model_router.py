@@ -0,0 +1,151 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from crewai import LLM
+
+from tools.llm_cache import LLMCache
+from tests.conftest import FakeClock
+from tools.model_router import INPUT_BUCKETS, ModelRoute, ModelRouter, RoutedLLM
+
+
+PRIMARY, FAST = "gpt-4.1", "gpt-4.1-nano"
+MESSAGES = [{"role": "user", "content": "Write about AI chips"}]
+
+
+def make_router(budget=2.0, probe_interval=60.0):
+    return ModelRouter(
+        {
+            "research": ModelRoute("research", PRIMARY, FAST, latency_budget=budget),
+            "content": ModelRoute("content", PRIMARY),
+        },
+        probe_interval=probe_interval,
+    )
+
+
+def test_tasks_are_routed_by_name():
+    router = make_router()
+    assert router.route_for_task(SimpleNamespace(name="content_creation"), "research") == "content"
+    assert router.route_for_task(SimpleNamespace(name="something else"), "research") == "research"
+    assert router.route_for_task(None, "content") == "content"
+
+
+def test_route_without_budget_always_uses_its_model():
+    router = make_router()
+    router.record("content", PRIMARY, 100, 30.0)
+    assert router.select("content", 100) == PRIMARY
+    assert router.timeout_for("content", PRIMARY) is None
+
+
+def test_slow_primary_is_bypassed_for_that_input_size(monotonic):
+    router = make_router(budget=2.0)
+    assert router.select("research", 100) == PRIMARY
+
+    router.record("research", PRIMARY, INPUT_BUCKETS[-1] + 1, 6.0)  # slow on long prompts
+    router.record("research", PRIMARY, 100, 1.0)  # fine on short ones
+
+    assert router.select("research", INPUT_BUCKETS[-1] + 1) == FAST
+    assert router.select("research", 100) == PRIMARY
+    assert router.stats()["research"]["routed_to_fallback"] == 1
+
+
+def test_primary_is_probed_again_after_probe_interval(monotonic):
+    router = make_router(budget=2.0, probe_interval=60.0)
+    router.record("research", PRIMARY, 100, 6.0)
+    assert router.select("research", 100) == FAST
+
+    monotonic.advance(61)
+    assert router.select("research", 100) == PRIMARY
+    for _ in range(4):  # recovered: the smoothed latency drops back under budget
+        router.record("research", PRIMARY, 100, 0.5)
+    assert router.select("research", 100) == PRIMARY
+
+
+def test_primary_calls_get_a_timeout_and_fallback_calls_do_not():
+    router = make_router(budget=2.0)
+    assert router.timeout_for("research", PRIMARY) == 4.0
+    assert router.timeout_for("research", FAST) is None
+
+
+def test_cached_and_failed_calls_do_not_move_latency():
+    router = make_router(budget=2.0)
+    router.record("research", PRIMARY, 100, 0.0, outcome="cached")
+    router.record("research", PRIMARY, 100, 9.0, outcome="error")
+
+    assert router.select("research", 100) == PRIMARY
+    stats = router.stats()["research"]
+    assert (stats["cache_hits"], stats["calls"], stats["errors"]) == (1, 1, 1)
+
+
+class Timeout(Exception):
+    """Named like litellm's timeout error"""
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    """Replace the litellm-backed LLM.call; the primary model times out after its timeout"""
+    calls = []
+    elapsed = FakeClock()
+
+    def call(llm, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None):
+        calls.append({"model": llm.model, "timeout": llm.timeout, "params": dict(llm.additional_params)})
+        if llm.model == PRIMARY:
+            elapsed.advance(llm.timeout)
+            raise Timeout("request timed out")
+        elapsed.advance(0.5)
+        return f"answer from {llm.model}"
+
+    monkeypatch.setattr(time, "perf_counter", elapsed)
+    monkeypatch.setattr(LLM, "call", call)
+    return calls
+
+
+def test_timed_out_primary_is_retried_on_the_fallback(model_calls):
+    router = make_router(budget=2.0)
+    llm = RoutedLLM(router, "research")
+
+    assert llm.call(MESSAGES) == f"answer from {FAST}"
+
+    assert [call["model"] for call in model_calls] == [PRIMARY, FAST]
+    assert model_calls[0]["timeout"] == 4.0
+    assert model_calls[0]["params"]["max_retries"] == 0
+    assert model_calls[1]["timeout"] is None
+    # The shared LLM is never changed by a call
+    assert (llm.model, llm.timeout, llm.additional_params) == (PRIMARY, None, {})
+    stats = router.stats()["research"]
+    assert stats["timeouts"] == 1
+    assert stats["models"][FAST]["calls"] == 1
+
+
+def test_after_a_timeout_calls_go_straight_to_the_fallback(model_calls):
+    router = make_router(budget=2.0)
+    llm = RoutedLLM(router, "research")
+    llm.call(MESSAGES)
+    model_calls.clear()
+
+    llm.call(MESSAGES)
+
+    assert [call["model"] for call in model_calls] == [FAST]
+
+
+def test_errors_other_than_timeouts_are_not_retried(monkeypatch):
+    def call(llm, *args, **kwargs):
+        raise ValueError("bad request")
+
+    monkeypatch.setattr(LLM, "call", call)
+    llm = RoutedLLM(make_router(budget=2.0), "research")
+    with pytest.raises(ValueError):
+        llm.call(MESSAGES)
+
+
+def test_cached_completion_skips_the_model(model_calls):
+    router = make_router(budget=0.0)
+    router.routes["research"].model = FAST
+    llm = RoutedLLM(router, "research", cache=LLMCache())
+
+    first = llm.call(MESSAGES)
+    second = llm.call(MESSAGES)
+
+    assert first == second == f"answer from {FAST}"
+    assert len(model_calls) == 1
+    assert router.stats()["research"]["cache_hits"] == 1
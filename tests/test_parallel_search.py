@@ -0,0 +1,109 @@
+import time
+
+from tools.linkup_tool import LinkupSearchTool
+
+
+TOPIC = "AI chips"
+FIRST_WAVE = ["latest news AI chips", "trending AI chips", "breaking news AI chips"]
+FALLBACK = ["recent developments AI chips", "AI chips news today"]
+
+
+def make_tool(**overrides):
+    settings = dict(
+        use_cache=False,
+        adaptive_queries=False,
+        coalesce_searches=False,
+        include_analysis_guidance=False,
+        search_timeout=1.0,
+        hedge_after=5.0,
+        time_budget=5.0,
+    )
+    settings.update(overrides)
+    return LinkupSearchTool(**settings)
+
+
+def searched(output):
+    return [line[len("=== SEARCH: "):-len(" ===")] for line in output.splitlines() if line.startswith("=== SEARCH: ")]
+
+
+def test_first_wave_timing_out_before_the_hedge_still_runs_the_fallback(linkup_client):
+    for query in FIRST_WAVE:
+        linkup_client.delays[query] = 0.5
+    tool = make_tool(search_timeout=0.1, hedge_after=1.0)
+
+    output = tool._parallel_trending_search(linkup_client, TOPIC)
+
+    assert sorted(searched(output)) == sorted(FALLBACK)
+
+
+def test_answered_first_wave_skips_the_fallback(linkup_client):
+    output = make_tool()._parallel_trending_search(linkup_client, TOPIC)
+
+    assert sorted(searched(output)) == sorted(FIRST_WAVE)
+    assert sorted(linkup_client.calls) == sorted(FIRST_WAVE)
+
+
+def test_first_wave_with_sufficient_answers_is_enough(linkup_client):
+    linkup_client.empty.add(FIRST_WAVE[0])
+
+    output = make_tool()._parallel_trending_search(linkup_client, TOPIC)
+
+    assert sorted(searched(output)) == sorted(FIRST_WAVE[1:])
+    assert sorted(linkup_client.calls) == sorted(FIRST_WAVE)
+
+
+def test_short_first_wave_runs_the_fallback(linkup_client):
+    linkup_client.empty.update(FIRST_WAVE[:2])
+
+    output = make_tool()._parallel_trending_search(linkup_client, TOPIC)
+
+    assert sorted(searched(output)) == sorted([FIRST_WAVE[2], *FALLBACK])
+    assert sorted(linkup_client.calls) == sorted(FIRST_WAVE + FALLBACK)
+
+
+def test_slow_search_is_cut_off_after_search_timeout(linkup_client):
+    linkup_client.delays[FIRST_WAVE[0]] = 1.0
+    tool = make_tool(search_timeout=0.1)
+
+    started = time.monotonic()
+    output = tool._parallel_trending_search(linkup_client, TOPIC)
+
+    assert time.monotonic() - started < 0.5
+    assert sorted(searched(output)) == sorted(FIRST_WAVE[1:])
+
+
+def test_late_first_wave_is_hedged_with_the_fallback(linkup_client):
+    for query in FIRST_WAVE:
+        linkup_client.delays[query] = 0.4
+    tool = make_tool(hedge_after=0.1)
+
+    started = time.monotonic()
+    output = tool._parallel_trending_search(linkup_client, TOPIC)
+
+    assert time.monotonic() - started < 0.8
+    results = searched(output)
+    assert len(results) == 3
+    assert set(FALLBACK) <= set(results)
+
+
+def test_exhausted_budget_returns_what_has_arrived(linkup_client):
+    for query in FIRST_WAVE[1:]:
+        linkup_client.delays[query] = 1.0
+    tool = make_tool(time_budget=0.2, search_timeout=2.0)
+
+    started = time.monotonic()
+    output = tool._parallel_trending_search(linkup_client, TOPIC)
+
+    assert time.monotonic() - started < 0.5
+    assert searched(output) == [FIRST_WAVE[0]]
+
+
+def test_nothing_back_within_budget_gives_the_fallback_block(linkup_client):
+    for query in FIRST_WAVE:
+        linkup_client.delays[query] = 1.0
+    tool = make_tool(time_budget=0.2, search_timeout=2.0)
+
+    output = tool._parallel_trending_search(linkup_client, TOPIC)
+
+    assert "FALLBACK TRENDING TOPICS" in output
+    assert searched(output) == []
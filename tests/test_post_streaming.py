@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from tools.post_streaming import (
+    FinalAnswerFilter,
+    PostStreamSubscription,
+    StreamCancelled,
+    abort_if_cancelled,
+    current_subscription,
+)
+
+
+def stream(chunks, answer_filter=None):
+    answer_filter = answer_filter or FinalAnswerFilter()
+    return [answer_filter.feed(chunk) for chunk in chunks]
+
+
+def test_preamble_is_held_back_until_the_marker():
+    out = stream(["Thought: I know the ", "answer\n", "Final Answer: AI chips ", "are hot"])
+    assert out == ["", "", "AI chips ", "are hot"]
+
+
+def test_marker_split_across_chunks():
+    out = stream(["Thought: done\nFinal An", "swer", ":", " Hello", " world"])
+    assert "".join(out) == "Hello world"
+    assert out[:3] == ["", "", ""]
+
+
+def test_whitespace_after_a_marker_that_ends_a_chunk_is_dropped():
+    out = stream(["Final Answer:", "\n", "  Hello", " world"])
+    assert out == ["", "", "Hello", " world"]
+
+
+def test_answer_text_keeps_its_own_whitespace():
+    out = stream(["Final Answer: Line one\n\n", "Line two"])
+    assert "".join(out) == "Line one\n\nLine two"
+
+
+def test_marker_inside_the_answer_is_passed_through():
+    out = stream(["Final Answer: quote ", "Final Answer: as text"])
+    assert "".join(out) == "quote Final Answer: as text"
+
+
+def test_answer_without_marker_yields_nothing():
+    assert "".join(stream(["Thought: thinking", " still thinking"])) == ""
+
+
+def test_reset_starts_a_fresh_answer():
+    answer_filter = FinalAnswerFilter()
+    stream(["Final Answer: first"], answer_filter)
+    answer_filter.reset()
+    assert stream(["Thought: again ", "Final Answer: second"], answer_filter) == ["", "second"]
+
+
+def subscription(roles=("Writer",)):
+    events = []
+    return PostStreamSubscription(events.append, set(roles)), events
+
+
+def test_tokens_are_filtered_per_role():
+    sub, events = subscription(roles=("Writer", "Editor"))
+    sub.on_token("Writer", "Final Answer: post")
+    sub.on_token("Editor", "Thought: not yet")
+    sub.on_token("Researcher", "Final Answer: research notes")
+    sub.on_token("Editor", " Final Answer: edited")
+
+    assert [(e.kind, e.agent, e.text) for e in events] == [("token", "Writer", "post"), ("token", "Editor", "edited")]
+
+
+def test_new_llm_call_resets_the_filter():
+    sub, events = subscription()
+    sub.on_token("Writer", "Final Answer: draft")
+    sub.on_llm_call_started("Writer")
+    sub.on_token("Writer", "Thought: tool output says ")
+    sub.on_token("Writer", "Final Answer: final")
+
+    assert [e.text for e in events] == ["draft", "final"]
+
+
+def test_cancelled_subscription_stops_tokens_and_the_pipeline():
+    sub, events = subscription()
+    with sub.attach():
+        abort_if_cancelled()
+        sub.cancel()
+        sub.on_token("Writer", "Final Answer: too late")
+        with pytest.raises(StreamCancelled):
+            abort_if_cancelled()
+
+    assert events == []
+    abort_if_cancelled()  # detached: nothing to cancel
+
+
+def test_events_reach_only_the_subscription_of_the_emitting_thread():
+    from crewai.utilities.events import crewai_event_bus
+    from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+
+    mine, my_events = subscription()
+    other, other_events = subscription()
+    other_ready, done = threading.Event(), threading.Event()
+
+    def other_stream():
+        with other.attach():
+            other_ready.set()
+            done.wait(5)
+
+    thread = threading.Thread(target=other_stream)
+    thread.start()
+    other_ready.wait(5)
+    try:
+        with mine.attach():
+            assert current_subscription() is mine
+            crewai_event_bus.emit(None, LLMStreamChunkEvent(chunk="Final Answer: mine", agent_role="Writer"))
+    finally:
+        done.set()
+        thread.join()
+
+    assert [e.text for e in my_events] == ["mine"]
+    assert other_events == []
+    assert current_subscription() is None
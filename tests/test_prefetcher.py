@@ -0,0 +1,102 @@
+import pytest
+
+import tools.linkup_client
+from tasks.topic_discovery_task import DEFAULT_SEARCH_FOCUS
+from tools.prefetcher import QueryFrequency, TrendPrefetcher
+from tools.search_cache import SearchCache
+
+from tests.test_parallel_search import make_tool
+
+
+def test_frequency_ranks_by_count_and_merges_spellings(clock):
+    frequency = QueryFrequency()
+    for query in ["AI chips", "  ai   CHIPS ", "quantum", "", "   "]:
+        frequency.record(query)
+
+    assert frequency.top(5) == ["ai   CHIPS", "quantum"]
+
+
+def test_frequency_favours_recent_queries(clock):
+    frequency = QueryFrequency(half_life=3600)
+    for _ in range(3):
+        frequency.record("yesterday's story")
+    clock.advance(2 * 3600)  # three asks decay to 0.75
+    frequency.record("today's story")
+
+    assert frequency.top(1) == ["today's story"]
+
+
+def test_frequency_evicts_the_weakest_query(clock):
+    frequency = QueryFrequency(half_life=3600, max_queries=2)
+    for query in ["popular"] * 3 + ["fading"] * 2:
+        frequency.record(query)
+    clock.advance(3 * 3600)  # popular decays to 0.375, fading to 0.25
+    frequency.record("newcomer")
+
+    assert frequency.top(5) == ["newcomer", "popular"]
+
+
+def test_quota_is_a_rolling_hour(monotonic):
+    prefetcher = TrendPrefetcher(tool=make_tool(), hourly_quota=2, frequency=QueryFrequency())
+
+    assert [prefetcher._take_quota() for _ in range(3)] == [True, True, False]
+    monotonic.advance(1800)
+    assert prefetcher._take_quota() is False
+    monotonic.advance(1800)  # the first two sends leave the window
+    assert [prefetcher._take_quota() for _ in range(3)] == [True, True, False]
+    assert prefetcher.stats()["quota_used"] == 2
+
+
+def test_planned_searches_take_the_best_sub_queries_without_duplicates(clock):
+    frequency = QueryFrequency()
+    frequency.record("AI chips")
+    frequency.record("AI chips")
+    frequency.record(DEFAULT_SEARCH_FOCUS.upper())  # same searches as a default path
+    prefetcher = TrendPrefetcher(tool=make_tool(), top_queries=2, queries_per_topic=1, frequency=frequency)
+
+    assert prefetcher.planned_searches() == [
+        "latest business news",
+        f"latest news {DEFAULT_SEARCH_FOCUS}",
+        "latest news latest professional trends linkedin content strategy",
+        "latest news AI chips",
+    ]
+
+
+@pytest.fixture
+def prefetcher(monkeypatch, linkup_client, monotonic):
+    monkeypatch.setenv("LINKUP_API_KEY", "test-key")
+    monkeypatch.setattr(tools.linkup_client, "get_linkup_client", lambda api_key: linkup_client)
+    linkup_client.default_delay = 0
+    tool = make_tool(use_cache=True, cache=SearchCache())
+    return TrendPrefetcher(tool=tool, hourly_quota=4, queries_per_topic=2, frequency=QueryFrequency())
+
+
+def test_run_once_refreshes_cached_searches_within_the_quota(prefetcher, linkup_client):
+    planned = prefetcher.planned_searches()
+    cache = prefetcher.tool.cache
+    cache.set(planned[0], "standard", "sourcedAnswer", {"answer": "stale"})
+
+    summary = prefetcher.run_once()
+
+    assert (summary["searches"], summary["errors"], summary["over_quota"]) == (4, 0, len(planned) - 4)
+    assert linkup_client.calls == planned[:4]  # the cached entry is refreshed, not read
+    assert all(cache.contains(query, "standard", "sourcedAnswer") for query in planned[:4])
+    assert cache.get(planned[0], "standard", "sourcedAnswer")["answer"] != "stale"
+
+
+def test_searches_over_quota_wait_for_the_window_to_roll(prefetcher, linkup_client, monotonic):
+    prefetcher.run_once()
+    assert prefetcher.run_once()["searches"] == 0
+
+    monotonic.advance(3600)
+    assert prefetcher.run_once()["searches"] == 4
+    stats = prefetcher.stats()
+    assert (stats["cycles"], stats["searches"]) == (3, 8)
+
+
+def test_run_once_needs_the_api_key_and_a_cache(monkeypatch, linkup_client):
+    monkeypatch.delenv("LINKUP_API_KEY", raising=False)
+    prefetcher = TrendPrefetcher(tool=make_tool(use_cache=True, cache=SearchCache()), frequency=QueryFrequency())
+
+    assert prefetcher.run_once()["searches"] == 0
+    assert prefetcher.stats()["cycles"] == 0
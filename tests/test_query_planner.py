@@ -0,0 +1,67 @@
+from tools.query_planner import QueryPlanner, is_narrow_topic
+from tools.search_results import SearchRecord
+
+
+CANDIDATES = [
+    ("latest news {topic}", "latest news AI"),
+    ("{topic} trends", "AI trends"),
+    ("breaking news {topic}", "breaking news AI"),
+    ("{topic} news today", "AI news today"),
+    ("recent developments {topic}", "recent developments AI"),
+]
+
+
+def test_narrow_topics():
+    assert not is_narrow_topic(None)
+    assert not is_narrow_topic("AI")
+    assert not is_narrow_topic("latest AI news")
+    assert is_narrow_topic("Nvidia H20 export license")
+    assert is_narrow_topic('"agentic AI"')
+
+
+def test_untried_templates_keep_order_and_first_wave_matches_target():
+    plan = QueryPlanner().plan("AI", CANDIDATES, min_results=3)
+
+    assert plan.first_wave == CANDIDATES[:3]
+    assert plan.fallback == CANDIDATES[3:]
+    assert (plan.target, plan.sufficient) == (3, 2)
+
+
+def test_narrow_topic_aims_for_fewer_answers():
+    plan = QueryPlanner().plan("Nvidia H20 export license", CANDIDATES, min_results=3)
+    assert (plan.target, plan.sufficient) == (2, 1)
+    assert len(plan.first_wave) == 2
+
+
+def test_failing_template_is_ranked_last_and_widens_the_first_wave():
+    planner = QueryPlanner(alpha=0.5)
+    for _ in range(4):
+        planner.record("latest news {topic}", None, 2.0, useful=False)
+
+    plan = planner.plan("AI", CANDIDATES, min_results=3)
+
+    assert plan.queries[-1] == CANDIDATES[0]
+    assert plan.first_wave == CANDIDATES[1:4]
+
+
+def test_fast_useful_template_outranks_slow_one():
+    planner = QueryPlanner()
+    answer = SearchRecord(query="q", answer="x" * 800)
+    planner.record("{topic} trends", answer, 0.2, useful=True)
+    planner.record("latest news {topic}", answer, 3.0, useful=True)
+
+    ranked = planner.rank(CANDIDATES[:2])
+
+    assert ranked[0][0] == "{topic} trends"
+    assert planner.score("{topic} trends") > planner.score("latest news {topic}")
+
+
+def test_cached_queries_go_first():
+    plan = QueryPlanner().plan("AI", CANDIDATES, min_results=3, cached={"recent developments AI"})
+    assert plan.first_wave[0] == CANDIDATES[4]
+
+
+def test_unknown_template_is_not_recorded():
+    planner = QueryPlanner()
+    planner.record(None, None, 1.0, useful=False)
+    assert planner.stats()["templates"] == {}
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from tools.rate_limiter import RateLimiter, backoff_delay, parse_retry_after, request_priority
+
+
+def test_penalize_halves_rate_down_to_a_floor():
+    limiter = RateLimiter(rate=10)
+    limiter.penalize()
+    assert limiter.current_rate == 5
+    for _ in range(10):
+        limiter.penalize()
+    assert limiter.current_rate == pytest.approx(1.0)
+    assert limiter.stats()["throttled"] == 11
+
+
+def test_successes_win_back_the_rate_additively():
+    limiter = RateLimiter(rate=10, max_in_flight=1)
+    limiter.penalize()
+
+    with limiter.slot():
+        pass
+    assert limiter.current_rate == pytest.approx(5.5)
+
+    with limiter.slot() as outcome:
+        outcome["throttled"] = True
+    assert limiter.current_rate == pytest.approx(5.5)
+
+    for _ in range(20):
+        limiter._tokens = limiter.burst  # keep the test from waiting on the bucket
+        with limiter.slot():
+            pass
+    assert limiter.current_rate == 10
+
+
+def test_empty_bucket_makes_callers_wait():
+    limiter = RateLimiter(rate=20, burst=1)
+    assert limiter.acquire() < 0.01
+    limiter.release()
+    assert limiter.acquire() == pytest.approx(0.05, abs=0.04)
+    limiter.release()
+
+
+def test_interactive_requests_are_served_before_batch():
+    limiter = RateLimiter(rate=1000, max_in_flight=1)
+    limiter.acquire()
+    order = []
+
+    def worker(priority):
+        with limiter.slot(priority):
+            order.append(priority)
+
+    batch = threading.Thread(target=worker, args=("batch",))
+    batch.start()
+    while limiter.stats()["queued"] < 1:
+        time.sleep(0.005)
+    interactive = threading.Thread(target=worker, args=("interactive",))
+    interactive.start()
+    while limiter.stats()["queued"] < 2:
+        time.sleep(0.005)
+
+    limiter.release()
+    batch.join(5)
+    interactive.join(5)
+
+    assert order == ["interactive", "batch"]
+    assert limiter.stats()["peak_in_flight"] == 1
+
+
+def test_priority_comes_from_the_context():
+    limiter = RateLimiter(rate=1000)
+    with request_priority("batch"):
+        with limiter.slot():
+            pass
+    stats = limiter.stats()
+    assert (stats["batch"]["acquired"], stats["interactive"]["acquired"]) == (1, 0)
+
+    with pytest.raises(ValueError):
+        with request_priority("urgent"):
+            pass
+
+
+def test_retry_after_parsing_and_backoff():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+    assert 2.0 <= backoff_delay(0, retry_after=2.0, base=0.5) <= 2.5
+    assert backoff_delay(10, cap=8.0) <= 8.0
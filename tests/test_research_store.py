@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+
+import pytest
+
+from tools.research_store import ResearchStore
+
+
+def test_brief_is_reused_until_ttl(clock):
+    store = ResearchStore(ttl_seconds=600)
+    store.put("AI chips", "brief")
+
+    clock.advance(599)
+    stored = store.get("ai   CHIPS")
+    assert stored.brief == "brief"
+    assert stored.age == pytest.approx(599)
+
+    clock.advance(2)
+    assert store.get("AI chips") is None
+
+
+def test_brief_does_not_carry_into_the_next_window(clock):
+    store = ResearchStore(ttl_seconds=7200, window_seconds=3600)
+    clock.now = 10 * 3600 - 60  # a minute before the window ends
+    store.put("AI chips", "brief")
+
+    clock.advance(30)
+    assert store.get("AI chips") is not None
+    clock.advance(60)
+    assert store.get("AI chips") is None
+
+
+def test_general_trends_and_topics_are_kept_apart():
+    store = ResearchStore()
+    store.put(None, "trends")
+    store.put("AI chips", "chips")
+
+    assert store.get(None).brief == "trends"
+    assert store.get("").brief == "trends"
+    assert store.get("AI chips").brief == "chips"
+    assert store.get("robots") is None
+
+
+def test_invalidate_forgets_only_that_topic():
+    store = ResearchStore()
+    store.put("AI chips", "chips")
+    store.put("robots", "robots")
+
+    store.invalidate("AI Chips")
+
+    assert store.get("AI chips") is None
+    assert store.get("robots").brief == "robots"
+
+
+def test_briefs_are_shared_through_the_file(tmp_path):
+    path = str(tmp_path / "briefs.sqlite")
+    ResearchStore(db_path=path).put("AI chips", "from another process")
+    assert ResearchStore(db_path=path).get("AI chips").brief == "from another process"
+
+
+@pytest.fixture
+def crew(monkeypatch):
+    """A LinkedInContentCrew whose crew runs are recorded instead of calling the LLM"""
+    for name in ("LINKUP_CACHE_PATH", "LLM_CACHE_PATH", "RESEARCH_STORE_PATH"):
+        monkeypatch.setenv(name, "")
+    from crew import LinkedInContentCrew
+    from tools.llm_cache import get_llm_cache
+    from tools.search_cache import cache_reads_enabled
+
+    crew = LinkedInContentCrew()
+    crew.research_store = ResearchStore()
+    crew.runs = []
+
+    def kickoff(run, label):
+        llm_cache = get_llm_cache()
+        crew.runs.append({
+            "label": label,
+            "tasks": [task.name for task in run.tasks],
+            "cached_reads": cache_reads_enabled() and (llm_cache is None or llm_cache.reads_enabled()),
+        })
+        for task in run.tasks:
+            task.output = SimpleNamespace(raw=f"{task.name} output")
+        return f"{label} result"
+
+    monkeypatch.setattr(crew, "_kickoff", kickoff)
+    return crew
+
+
+def test_research_only_brief_is_reused_by_the_next_post(crew):
+    crew.research_only("AI chips")
+    crew.create_linkedin_post("AI chips")
+
+    assert [run["tasks"] for run in crew.runs] == [["research"], ["content_creation"]]
+    assert crew.research_store.get("AI chips").brief == "research output"
+
+
+def test_post_research_is_stored_for_the_next_post(crew):
+    crew.create_linkedin_post("AI chips")
+    crew.create_linkedin_post("AI chips")
+    crew.create_linkedin_post("robots")
+
+    assert [run["tasks"] for run in crew.runs] == [
+        ["research", "content_creation"],
+        ["content_creation"],
+        ["research", "content_creation"],
+    ]
+
+
+def test_invalidated_topic_is_researched_again_without_cached_answers(crew):
+    crew.research_only("AI chips")
+    crew.invalidate_research("AI chips")
+
+    crew.create_linkedin_post("AI chips")
+    crew.create_linkedin_post("AI chips")
+
+    assert [run["tasks"] for run in crew.runs] == [
+        ["research"],
+        ["research", "content_creation"],
+        ["content_creation"],
+    ]
+    assert [run["cached_reads"] for run in crew.runs[:2]] == [True, False]
+
+
+def test_topic_stays_invalidated_until_a_run_succeeds(crew, monkeypatch):
+    def failing_kickoff(run, label):
+        raise RuntimeError("LLM down")
+
+    crew.invalidate_research("AI chips")
+    monkeypatch.setattr(crew, "_kickoff", failing_kickoff)
+    with pytest.raises(RuntimeError):
+        crew.research_only("AI chips")
+
+    assert crew._topic_key("AI chips") in crew._stale_topics
@@ -0,0 +1,36 @@
+from tasks.research_task import DEFAULT_RESEARCH_QUERY, create_research_task
+from tools.topic_index import DiscoveredTopic
+
+
+TOPIC = DiscoveredTopic(
+    title="Chipmaker doubles AI output",
+    context="A chipmaker doubled AI accelerator output after a new fab opened.",
+    key_details=["Output up 100% year over year", "Fab opened in March"],
+    why_hot="Widely shared by analysts.",
+    source_urls=["https://news.example.com/chips"],
+)
+
+
+def test_research_task_searches_for_the_topic_or_the_default_query():
+    assert "Search for: 'AI chips'" in create_research_task(None, "AI chips").description
+    assert f"Search for: '{DEFAULT_RESEARCH_QUERY}'" in create_research_task(None).description
+
+
+def test_task_without_gathered_facts_has_no_search_restriction():
+    description = create_research_task(None, TOPIC.title).description
+
+    assert "ALREADY GATHERED" not in description
+    assert "Don't search again" not in description
+
+
+def test_gathered_facts_are_handed_to_research_with_a_search_only_if_missing_instruction():
+    description = create_research_task(None, TOPIC.title, known_context=f"\n  {TOPIC.brief()}\n\n").description
+
+    gathered = description[description.index("### ALREADY GATHERED (from topic discovery):"):]
+    assert f"(from topic discovery):\n{TOPIC.brief()}\n\nBuild the brief from these facts." in gathered
+    assert "Don't search again for what they already cover" in gathered
+    assert "only use the Linkup Search Tool if essential details are missing" in gathered
+    for fact in ["Output up 100% year over year", "Fab opened in March", "https://news.example.com/chips"]:
+        assert fact in gathered
+    # The topic is still what research searches for when something is missing
+    assert f"Search for: '{TOPIC.title}'" in description
@@ -0,0 +1,134 @@
+from dataclasses import replace
+
+from tools.result_compaction import compact_results, estimate_tokens, split_sentences
+from tools.search_results import SearchRecord, format_sources
+
+
+def test_duplicate_sentences_and_sources_are_dropped_across_records():
+    first = SearchRecord(
+        query="a",
+        answer="Nvidia reported record data center revenue of $30B. Demand for H100 stays strong.",
+        sources=("https://example.com/nvidia", "https://example.com/h100"),
+    )
+    second = SearchRecord(
+        query="b",
+        answer="Nvidia reported record data center revenue of $30B! AMD shipped its MI300 accelerators.",
+        sources=("https://example.com/nvidia", "https://example.com/amd"),
+    )
+
+    report = compact_results([first, second])
+
+    assert [record.answer for record in report.records] == [
+        first.answer,
+        "AMD shipped its MI300 accelerators.",
+    ]
+    assert report.records[1].sources == ("https://example.com/amd",)
+    assert report.sentences_dropped == 1
+    assert report.sources_dropped == 1
+    assert report.tokens_saved > 0
+    assert not report.truncated
+
+
+def test_near_duplicate_sentences_are_dropped():
+    first = SearchRecord(query="a", answer="OpenAI announced a $500B infrastructure partnership with Oracle and SoftBank.")
+    second = SearchRecord(query="b", answer="OpenAI announced a $500B infrastructure partnership with Oracle and SoftBank today.")
+
+    report = compact_results([first, second])
+
+    assert len(report.records) == 1  # records left without sentences are removed
+    assert report.records[0].query == "a"
+
+
+def test_distinct_sentences_are_kept():
+    records = [
+        SearchRecord(query="a", answer="Apple delayed its AI features."),
+        SearchRecord(query="b", answer="Microsoft cut 9,000 jobs."),
+    ]
+    report = compact_results(records)
+    assert [record.answer for record in report.records] == [record.answer for record in records]
+    assert report.sentences_dropped == 0
+
+
+def test_token_budget_keeps_leads_round_robin():
+    records = [
+        SearchRecord(query="a", answer="First lead about chips. Second detail about chips. Third detail about chips."),
+        SearchRecord(query="b", answer="First lead about robots. Second detail about robots."),
+    ]
+    budget = estimate_tokens("First lead about chips.") + estimate_tokens("First lead about robots.") + 2
+
+    report = compact_results(records, max_tokens=budget)
+
+    assert report.truncated
+    assert [record.answer for record in report.records] == ["First lead about chips.", "First lead about robots."]
+
+
+def test_input_records_are_not_modified():
+    record = SearchRecord(query="a", answer="Same sentence here. Same sentence here.", sources=("u", "u"))
+    compact_results([record])
+    assert record.answer == "Same sentence here. Same sentence here."
+
+
+def rendered_tokens(records):
+    """Budget tokens of records as render_records prints them"""
+    return sum(
+        sum(estimate_tokens(sentence) + 1 for sentence in split_sentences(record.answer))
+        + estimate_tokens(format_sources(record.sources))
+        for record in records
+    )
+
+
+def source_heavy_record(query, answer, count=3):
+    return SearchRecord(
+        query=query,
+        answer=answer,
+        sources=tuple(f"https://news.example.com/{query}/2026/10/a-very-long-article-slug-number-{i}" for i in range(count)),
+    )
+
+
+def test_budget_counts_rendered_sources():
+    record = source_heavy_record("chips", "Chip exports rose.")
+    with_sources = rendered_tokens([record])
+
+    assert not compact_results([record], max_tokens=with_sources).truncated
+    assert compact_results([record], max_tokens=with_sources - 1).truncated
+
+
+def test_sources_are_trimmed_before_answer_text():
+    records = [
+        source_heavy_record("chips", "Chip exports rose. Fabs are sold out."),
+        source_heavy_record("robots", "Robot orders doubled."),
+    ]
+    one_source_each = [replace(record, sources=record.sources[:1]) for record in records]
+
+    report = compact_results(records, max_tokens=rendered_tokens(one_source_each))
+
+    assert report.truncated
+    assert [record.answer for record in report.records] == [record.answer for record in records]
+    assert [record.sources for record in report.records] == [record.sources[:1] for record in records]
+    assert report.sources_dropped == 4
+
+
+def test_sentences_are_cut_once_single_sources_do_not_fit():
+    records = [
+        source_heavy_record("chips", "Chip exports rose. Fabs are sold out for the whole of next year."),
+        source_heavy_record("robots", "Robot orders doubled. Warehouses lead the demand by a wide margin."),
+    ]
+    leads_only = [
+        replace(record, answer=record.answer.split(". ")[0] + ".", sources=record.sources[:1]) for record in records
+    ]
+    budget = rendered_tokens(leads_only)
+
+    report = compact_results(records, max_tokens=budget)
+
+    assert [record.answer for record in report.records] == [record.answer for record in leads_only]
+    assert rendered_tokens(report.records) <= budget
+
+
+def test_record_whose_sources_do_not_fit_is_left_out():
+    records = [source_heavy_record("chips", "Chip exports rose."), source_heavy_record("robots", "Robot orders doubled.")]
+    budget = rendered_tokens([replace(records[0], sources=records[0].sources[:1])])
+
+    report = compact_results(records, max_tokens=budget)
+
+    assert [record.query for record in report.records] == ["chips"]
+    assert rendered_tokens(report.records) <= budget
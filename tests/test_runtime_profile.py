@@ -0,0 +1,55 @@
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tools import runtime_profile
+from tools.runtime_profile import configure_logging, get_logger, stop_logging
+
+
+@pytest.fixture
+def crew_logger():
+    yield logging.getLogger("crew")
+    stop_logging()
+
+
+def test_importing_entry_modules_leaves_logging_alone():
+    script = (
+        "import logging, threading, crew, service\n"
+        "from tools import runtime_profile\n"
+        "root = logging.getLogger('crew')\n"
+        "print(runtime_profile._listener is None, root.propagate, root.handlers,\n"
+        "      [t.name for t in threading.enumerate() if t is not threading.main_thread()])\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=120,
+        cwd=Path(__file__).resolve().parents[1], env={"PATH": "", "RUNTIME_PROFILE": "production"},
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "True True [] []"
+
+
+def test_default_profile_keeps_records_propagating(monkeypatch, crew_logger, caplog):
+    monkeypatch.delenv("RUNTIME_PROFILE", raising=False)
+    configure_logging()
+
+    assert runtime_profile._listener is not None
+    assert crew_logger.propagate
+    with caplog.at_level(logging.INFO, logger="crew"):
+        get_logger("test").info("hello")
+    assert "hello" in caplog.text
+
+
+def test_explicit_profile_owns_the_crew_logger(monkeypatch, crew_logger):
+    monkeypatch.setenv("RUNTIME_PROFILE", "production")
+    configure_logging()
+
+    assert not crew_logger.propagate
+    assert crew_logger.level == logging.WARNING
+
+    stop_logging()
+    assert runtime_profile._listener is None
+    assert crew_logger.propagate
+    assert crew_logger.handlers == []
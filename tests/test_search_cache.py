@@ -0,0 +1,72 @@
+from tools.search_cache import SearchCache, make_cache_key
+
+
+def test_cache_key_normalizes_case_and_whitespace():
+    assert make_cache_key("  AI   Chips ", "standard", "sourcedAnswer") == ("ai chips", "standard", "sourcedAnswer")
+
+
+def test_hit_until_ttl_then_miss(clock):
+    cache = SearchCache(ttl_seconds=60)
+    cache.set("AI chips", "standard", "sourcedAnswer", {"answer": "x"})
+
+    clock.advance(59)
+    assert cache.get("ai  CHIPS") == {"answer": "x"}
+
+    clock.advance(2)
+    assert cache.get("AI chips") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expired"]) == (1, 1, 1)
+
+
+def test_depth_and_output_type_are_part_of_the_key():
+    cache = SearchCache()
+    cache.set("q", "deep", "sourcedAnswer", "deep answer")
+    assert cache.get("q", "standard", "sourcedAnswer") is None
+    assert cache.get("q", "deep", "sourcedAnswer") == "deep answer"
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = SearchCache(max_entries=2)
+    cache.set("a", "standard", "sourcedAnswer", 1)
+    cache.set("b", "standard", "sourcedAnswer", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", "standard", "sourcedAnswer", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    SearchCache(db_path=path).set("q", "standard", "sourcedAnswer", {"answer": "from disk"})
+
+    cache = SearchCache(db_path=path)
+    assert cache.get("q") == {"answer": "from disk"}
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.get("q") == {"answer": "from disk"}
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_disk_tier_drops_expired_and_oldest_entries(tmp_path, clock):
+    cache = SearchCache(ttl_seconds=60, db_path=str(tmp_path / "cache.sqlite"), max_disk_entries=2)
+    cache.set("old", "standard", "sourcedAnswer", 0)
+    clock.advance(61)
+    cache.set("a", "standard", "sourcedAnswer", 1)  # prunes the expired "old"
+    clock.advance(1)
+    cache.set("b", "standard", "sourcedAnswer", 2)
+    clock.advance(1)
+    cache.set("c", "standard", "sourcedAnswer", 3)  # over max_disk_entries: drops "a"
+
+    assert cache.stats()["disk_entries"] == 2
+    fresh = SearchCache(ttl_seconds=60, db_path=cache.db_path)
+    assert [fresh.contains(query) for query in ("old", "a", "b", "c")] == [False, False, True, True]
+
+
+def test_invalidate_removes_from_both_tiers(tmp_path):
+    cache = SearchCache(db_path=str(tmp_path / "cache.sqlite"))
+    cache.set("q", "standard", "sourcedAnswer", 1)
+    cache.invalidate("Q")
+    assert not cache.contains("q")
+    assert SearchCache(db_path=cache.db_path).get("q") is None
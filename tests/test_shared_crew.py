@@ -0,0 +1,85 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from tools.research_store import ResearchStore
+
+
+@pytest.fixture
+def crew(monkeypatch):
+    """A LinkedInContentCrew whose crew runs record the agents they ran on"""
+    for name in ("LINKUP_CACHE_PATH", "LLM_CACHE_PATH", "RESEARCH_STORE_PATH"):
+        monkeypatch.setenv(name, "")
+    from crew import LinkedInContentCrew
+
+    crew = LinkedInContentCrew()
+    crew.research_store = ResearchStore()
+    crew.runs = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    def kickoff(run, label):
+        crew.runs.append({"label": label, "agents": [id(agent) for agent in run.agents], "thread": threading.get_ident()})
+        if crew.overlap:
+            barrier.wait()  # both threads are inside a run at the same time
+        for task in run.tasks:
+            task.output = SimpleNamespace(raw=f"{task.name} output")
+        return SimpleNamespace(raw="1. Topic one\n2. Topic two", pydantic=None)
+
+    crew.overlap = False
+    monkeypatch.setattr(crew, "_kickoff", kickoff)
+    return crew
+
+
+ENTRY_POINTS = {
+    "get_hot_topics": lambda crew: crew.get_hot_topics("AI"),
+    "get_topic_page": lambda crew: crew.get_topic_page(crew.new_topic_session(), "AI"),
+    "create_linkedin_post": lambda crew: crew.create_linkedin_post("AI chips"),
+    "research_only": lambda crew: crew.research_only("quantum"),
+}
+
+
+def run_concurrently(crew, first, second):
+    crew.overlap = True
+    errors = []
+
+    def call(entry_point):
+        try:
+            ENTRY_POINTS[entry_point](crew)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call, args=(name,)) for name in (first, second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+@pytest.mark.parametrize("first,second", [
+    ("get_hot_topics", "create_linkedin_post"),
+    ("research_only", "get_topic_page"),
+    ("create_linkedin_post", "create_linkedin_post"),
+])
+def test_concurrent_calls_never_share_an_agent(crew, first, second):
+    run_concurrently(crew, first, second)
+
+    first_run, second_run = crew.runs
+    assert first_run["thread"] != second_run["thread"]
+    assert not set(first_run["agents"]) & set(second_run["agents"])
+    templates = {id(crew.research_agent), id(crew.content_creator_agent)}
+    assert not templates & set(first_run["agents"] + second_run["agents"])
+
+
+def test_calls_on_one_thread_reuse_its_agents(crew):
+    topic = crew.get_topic_page(crew.new_topic_session())[0]
+    crew.create_linkedin_post_from_topic(topic.id)
+    crew.research_only("quantum")
+
+    research_agent, content_creator_agent = crew._worker_agents()
+    assert [run["agents"] for run in crew.runs] == [
+        [id(research_agent)],
+        [id(research_agent), id(content_creator_agent)],
+        [id(research_agent)],
+    ]
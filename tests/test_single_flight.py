@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tools.single_flight import SingleFlight
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def test_concurrent_callers_share_one_execution():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return "answer"
+
+    results = []
+
+    def caller():
+        results.append(group.do("key", work))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    _wait_until(lambda: group.stats()["in_flight"] == 1)
+    followers = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    _wait_until(lambda: group.stats()["coalesced"] == 3)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [("answer", False)] + [("answer", True)] * 3
+    assert group.stats()["in_flight"] == 0
+
+
+def test_leader_exception_reaches_every_caller():
+    group = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def work():
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    def caller():
+        try:
+            group.do("key", work)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=caller) for _ in range(3)]
+    threads[0].start()
+    _wait_until(lambda: group.stats()["in_flight"] == 1)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_until(lambda: group.stats()["coalesced"] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ["boom"] * 3
+
+
+def test_finished_keys_start_a_fresh_call():
+    group = SingleFlight()
+    assert group.do("key", lambda: 1) == (1, False)
+    assert group.do("key", lambda: 2) == (2, False)
+    assert group.stats()["leaders"] == 2
+
+
+def test_async_callers_coalesce():
+    group = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def main():
+        return await asyncio.gather(*(group.ado("key", work) for _ in range(4)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert sorted(results) == [("answer", False)] + [("answer", True)] * 3
+
+
+def test_cancelled_async_leader_hands_the_call_to_a_waiter():
+    group = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def main():
+        leader = asyncio.ensure_future(group.ado("key", work))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(group.ado("key", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == (2, False)
@@ -0,0 +1,63 @@
+from tools.topic_pool import PooledTopic, TopicPool, normalize_title, parse_numbered_topics
+
+
+def topics(*titles):
+    return [PooledTopic(title=title) for title in titles]
+
+
+def titles(page):
+    return [topic.title for topic in page]
+
+
+def test_parse_numbered_topics_keeps_details():
+    text = """Here are the topics:
+1. **Nvidia's H20 export license**:
+Why it matters: China sales
+2) Apple delays Siri
+### 3. OpenAI's $500B Stargate
+"""
+    parsed = parse_numbered_topics(text)
+
+    assert titles(parsed) == ["Nvidia's H20 export license", "Apple delays Siri", "OpenAI's $500B Stargate"]
+    assert parsed[0].details == "Why it matters: China sales"
+    assert parsed[0].render(1) == "1. **Nvidia's H20 export license**\nWhy it matters: China sales"
+
+
+def test_normalize_title_ignores_case_and_punctuation():
+    assert normalize_title("  Apple's  SIRI delay! ") == normalize_title("apple s siri delay")
+
+
+def test_pages_are_served_from_the_pool_without_repeats():
+    pool = TopicPool(page_size=2)
+    assert pool.needs_refill(None)
+    pool.fill(None, topics("A", "B", "C", "D", "E"))
+
+    assert titles(pool.next_page()) == ["A", "B"]
+    assert not pool.needs_refill(None)
+    assert titles(pool.next_page()) == ["C", "D"]
+    assert pool.needs_refill(None)  # one topic left, less than a page
+    assert pool.shown_titles == ["A", "B", "C", "D"]
+
+
+def test_refill_with_the_same_focus_appends_and_skips_known_topics():
+    pool = TopicPool(page_size=2)
+    pool.fill("AI", topics("A", "B", "C"))
+    pool.next_page()
+
+    pool.fill("AI", topics("a!", "C", "D", "C.", "E"), raw_output="second search")
+
+    assert titles(pool.next_page()) == ["C", "D"]  # leftover first, then new ones
+    assert titles(pool.next_page()) == ["E"]
+    assert pool.last_raw_output == "second search"
+
+
+def test_new_focus_empties_the_pool_but_remembers_what_was_shown():
+    pool = TopicPool(page_size=2)
+    pool.fill("AI", topics("A", "B", "C"))
+    pool.next_page()
+    assert pool.needs_refill("robotics")
+
+    pool.fill("robotics", topics("B", "R1", "R2"))
+
+    assert pool.focus == "robotics"
+    assert titles(pool.next_page()) == ["R1", "R2"]
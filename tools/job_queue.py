@@ -0,0 +1,262 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+# Job lifecycle: queued -> running -> done | failed (a running job whose worker
+# crashed or timed out goes back to queued while it has attempts left)
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+
+class QueueFull(Exception):
+    """Raised by submit() when the queue already holds max_pending unfinished jobs"""
+
+
+@dataclass
+class Job:
+    """One unit of work in the job queue"""
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    timeout: float
+    created_at: float
+    worker_pid: Optional[int] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def deadline(self) -> Optional[float]:
+        return self.started_at + self.timeout if self.started_at is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "payload": self.payload,
+            "status": self.status,
+            "attempts": self.attempts,
+            "timeout": self.timeout,
+            "created_at": self.created_at,
+            "worker_pid": self.worker_pid,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """
+    Job queue in a SQLite file, shared by the submitting process and all workers
+
+    Each process opens its own connection; WAL mode lets readers (status,
+    result) run alongside the single writer. Workers claim jobs in FIFO
+    order inside an immediate transaction, so a job is never handed to two
+    workers. submit() refuses new work once ``max_pending`` jobs are queued
+    or running, which is the service's backpressure.
+    """
+
+    def __init__(self, db_path: str, max_pending: int = 100, default_timeout: float = 300):
+        self.db_path = db_path
+        self.max_pending = max_pending
+        self.default_timeout = default_timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = self._db()
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                timeout REAL NOT NULL,
+                created_at REAL NOT NULL,
+                worker_pid INTEGER,
+                started_at REAL,
+                finished_at REAL,
+                result TEXT,
+                error TEXT
+            )"""
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+        db.commit()
+
+    def _db(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections must not cross threads or processes
+        db = getattr(self._local, "db", None)
+        if db is None or getattr(self._local, "pid", None) != os.getpid():
+            db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            db.row_factory = sqlite3.Row
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            timeout=row["timeout"],
+            created_at=row["created_at"],
+            worker_pid=row["worker_pid"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            result=json.loads(row["result"]) if row["result"] is not None else None,
+            error=row["error"],
+        )
+
+    def submit(self, kind: str, payload: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> str:
+        """
+        Add a job and return its id
+
+        Raises:
+            QueueFull: max_pending jobs are already queued or running
+        """
+        job_id = uuid.uuid4().hex
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            (pending,) = db.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')").fetchone()
+            if pending >= self.max_pending:
+                raise QueueFull(f"{pending} jobs pending (limit {self.max_pending}); retry later")
+            db.execute(
+                "INSERT INTO jobs (id, kind, payload, status, timeout, created_at) VALUES (?, ?, ?, 'queued', ?, ?)",
+                (job_id, kind, json.dumps(payload or {}), timeout or self.default_timeout, time.time()),
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self._db().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job(row) if row is not None else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None, poll_interval: float = 0.2) -> Optional[Job]:
+        """Poll until the job is done or failed, or timeout seconds have passed; returns its latest state"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            job = self.get(job_id)
+            if job is None or job.status in ("done", "failed"):
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(poll_interval)
+
+    def claim(self, worker_pid: int) -> Optional[Job]:
+        """Take the oldest queued job for a worker, or None when the queue is empty"""
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            row = db.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                db.execute("COMMIT")
+                return None
+            db.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker_pid = ?, started_at = ? "
+                "WHERE id = ?",
+                (worker_pid, time.time(), row["id"]),
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return self.get(row["id"])
+
+    def complete(self, job_id: str, result: Any) -> None:
+        self._db().execute(
+            "UPDATE jobs SET status = 'done', result = ?, error = NULL, finished_at = ? WHERE id = ? AND status = 'running'",
+            (json.dumps(result), time.time(), job_id),
+        )
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._db().execute(
+            "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ? AND status = 'running'",
+            (error, time.time(), job_id),
+        )
+
+    def retry_or_fail(self, job_id: str, error: str, max_attempts: int) -> str:
+        """
+        Requeue a running job whose worker was lost, or fail it once max_attempts are used
+
+        Returns:
+            The job's new status ("queued" or "failed")
+        """
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            row = db.execute("SELECT attempts FROM jobs WHERE id = ? AND status = 'running'", (job_id,)).fetchone()
+            if row is None:
+                db.execute("COMMIT")
+                return "missing"
+            if row["attempts"] < max_attempts:
+                status = "queued"
+                db.execute(
+                    "UPDATE jobs SET status = 'queued', error = ?, worker_pid = NULL, started_at = NULL WHERE id = ?",
+                    (error, job_id),
+                )
+            else:
+                status = "failed"
+                db.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                    (error, time.time(), job_id),
+                )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return status
+
+    def running(self) -> List[Job]:
+        rows = self._db().execute("SELECT * FROM jobs WHERE status = 'running'").fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in JOB_STATUSES}
+        for row in self._db().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        return counts
+
+
+_default_queue: Optional[JobQueue] = None
+_default_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """
+    Return the job queue configured from the environment
+
+    Environment variables:
+        SERVICE_DB_PATH: SQLite file holding the queue (default .cache/jobs.sqlite)
+        SERVICE_MAX_PENDING: Queued plus running jobs before submit() raises QueueFull (default 100)
+        SERVICE_JOB_TIMEOUT: Seconds a job may run before its worker is killed (default 300)
+    """
+    global _default_queue
+
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = JobQueue(
+                db_path=os.getenv("SERVICE_DB_PATH") or ".cache/jobs.sqlite",
+                max_pending=int(os.getenv("SERVICE_MAX_PENDING", "100")),
+                default_timeout=float(os.getenv("SERVICE_JOB_TIMEOUT", "300")),
+            )
+        return _default_queue
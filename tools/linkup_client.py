@@ -0,0 +1,354 @@
+import os
+import time
+import threading
+import weakref
+import asyncio
+import contextlib
+from typing import Any, Dict, Optional, Tuple
+
+from tools.rate_limiter import backoff_delay, get_rate_limiter, parse_retry_after
+from tools.single_flight import get_search_single_flight
+
+
+DEFAULT_BASE_URL = "https://api.linkup.so/v1"
+
+# Throttling and transient server errors worth retrying
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class PoolConfig:
+    """
+    Connection pool settings shared by every pooled Linkup client
+
+    Environment variables:
+        LINKUP_MAX_CONNECTIONS: Upper bound on open connections (default 20)
+        LINKUP_MAX_KEEPALIVE: Idle connections kept alive for reuse (default 10)
+        LINKUP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept (default 30)
+        LINKUP_HTTP2: "1"/"0" to force HTTP/2 on or off (default: on when h2 is installed)
+        LINKUP_REQUEST_TIMEOUT: Seconds before a single HTTP request is abandoned (default 10)
+        LINKUP_MAX_RETRIES: Retries after a 429 or 5xx response (default 2)
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        request_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.max_connections = max_connections or int(os.getenv("LINKUP_MAX_CONNECTIONS", "20"))
+        self.max_keepalive_connections = max_keepalive_connections or int(
+            os.getenv("LINKUP_MAX_KEEPALIVE", "10")
+        )
+        self.keepalive_expiry = keepalive_expiry or float(os.getenv("LINKUP_KEEPALIVE_EXPIRY", "30"))
+        if http2 is None:
+            env_http2 = os.getenv("LINKUP_HTTP2")
+            http2 = env_http2 == "1" if env_http2 is not None else _http2_available()
+        self.http2 = http2 and _http2_available()
+        self.request_timeout = request_timeout or float(os.getenv("LINKUP_REQUEST_TIMEOUT", "10"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("LINKUP_MAX_RETRIES", "2"))
+
+    def limits(self):
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "http2": self.http2,
+            "request_timeout": self.request_timeout,
+            "max_retries": self.max_retries,
+        }
+
+
+def _build_pooled_client_class():
+    """
+    Subclass the SDK client so its requests go through long-lived httpx clients
+
+    The stock LinkupClient opens a new httpx client (and so a new TCP/TLS
+    connection) for every request. Overriding its _request/_async_request
+    hooks is the least invasive way to keep connections alive between calls.
+    """
+    import httpx
+    from linkup import LinkupClient
+
+    class PooledLinkupClient(LinkupClient):
+        def __init__(self, api_key: str, base_url: str = DEFAULT_BASE_URL, config: Optional[PoolConfig] = None):
+            super().__init__(api_key=api_key, base_url=base_url)
+            self.pool_config = config or PoolConfig()
+            self._pool_base_url = base_url
+            self._sync_client: Optional[httpx.Client] = None
+            self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+                weakref.WeakKeyDictionary()
+            )
+            self._lock = threading.Lock()
+            self._counters: Dict[str, int] = {
+                "requests": 0,
+                "async_requests": 0,
+                "errors": 0,
+                "in_flight": 0,
+                "peak_in_flight": 0,
+                "retries": 0,
+            }
+
+        def _get_sync_client(self) -> httpx.Client:
+            with self._lock:
+                if self._sync_client is None:
+                    self._sync_client = httpx.Client(
+                        base_url=self._pool_base_url,
+                        headers=self._headers(),
+                        limits=self.pool_config.limits(),
+                        http2=self.pool_config.http2,
+                    )
+                return self._sync_client
+
+        def _get_async_client(self) -> httpx.AsyncClient:
+            # httpx.AsyncClient is bound to the loop it was first used on
+            loop = asyncio.get_running_loop()
+            with self._lock:
+                client = self._async_clients.get(loop)
+                if client is None:
+                    client = httpx.AsyncClient(
+                        base_url=self._pool_base_url,
+                        headers=self._headers(),
+                        limits=self.pool_config.limits(),
+                        http2=self.pool_config.http2,
+                    )
+                    self._async_clients[loop] = client
+                return client
+
+        def _enter(self, counter: str) -> None:
+            with self._lock:
+                self._counters[counter] += 1
+                self._counters["in_flight"] += 1
+                self._counters["peak_in_flight"] = max(
+                    self._counters["peak_in_flight"], self._counters["in_flight"]
+                )
+
+        def _exit(self, failed: bool) -> None:
+            with self._lock:
+                self._counters["in_flight"] -= 1
+                if failed:
+                    self._counters["errors"] += 1
+
+        def _with_timeout(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            # The SDK passes timeout=None (wait forever); enforce our own bound instead
+            if kwargs.get("timeout") is None:
+                kwargs["timeout"] = self.pool_config.request_timeout
+            return kwargs
+
+        def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+            """
+            Seconds to wait before retrying response, or None to return it as is
+            
+            The server's Retry-After is honoured when present.
+            """
+            if response.status_code not in RETRY_STATUSES or attempt >= self.pool_config.max_retries:
+                return None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = backoff_delay(attempt, retry_after)
+            with self._lock:
+                self._counters["retries"] += 1
+            return delay
+
+        @staticmethod
+        def _note_throttling(response: httpx.Response, limiter, outcome: Dict[str, bool]) -> None:
+            # A 429 slows the shared limiter down so concurrent callers back off together
+            if response.status_code == 429 and limiter is not None:
+                outcome["throttled"] = True
+                limiter.penalize()
+
+        def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+            kwargs = self._with_timeout(kwargs)
+            client = self._get_sync_client()
+            limiter = get_rate_limiter()
+            attempt = 0
+            while True:
+                with limiter.slot() if limiter is not None else contextlib.nullcontext({}) as outcome:
+                    self._enter("requests")
+                    failed = True
+                    try:
+                        response = client.request(method=method, url=url, **kwargs)
+                        failed = False
+                    finally:
+                        self._exit(failed)
+                    self._note_throttling(response, limiter, outcome)
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    return response
+                attempt += 1
+                time.sleep(delay)
+
+        async def _async_request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+            kwargs = self._with_timeout(kwargs)
+            client = self._get_async_client()
+            limiter = get_rate_limiter()
+            attempt = 0
+            while True:
+                async with limiter.aslot() if limiter is not None else contextlib.nullcontext({}) as outcome:
+                    self._enter("async_requests")
+                    failed = True
+                    try:
+                        response = await client.request(method=method, url=url, **kwargs)
+                        failed = False
+                    except asyncio.CancelledError:
+                        # Straggler cancelled by the caller, not a transport failure
+                        failed = False
+                        raise
+                    finally:
+                        self._exit(failed)
+                    self._note_throttling(response, limiter, outcome)
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    return response
+                attempt += 1
+                await asyncio.sleep(delay)
+
+        def pool_stats(self) -> Dict[str, Any]:
+            with self._lock:
+                stats: Dict[str, Any] = dict(self._counters)
+                stats["open_connections"] = _count_connections(self._sync_client)
+                stats["async_clients"] = len(self._async_clients)
+            stats.update(self.pool_config.as_dict())
+            return stats
+
+        def close(self) -> None:
+            """
+            Close the sync client and every pooled async client
+
+            Each async client is closed on its own event loop: run to completion
+            there when the loop is idle, or scheduled on it when it is running.
+            Clients of loops that are already closed are only dropped. Inside a
+            running loop, prefer ``await aclose()``, which waits for its client.
+            """
+            with self._lock:
+                sync_client, self._sync_client = self._sync_client, None
+                async_clients = list(self._async_clients.items())
+                self._async_clients.clear()
+            if sync_client is not None:
+                sync_client.close()
+            for loop, client in async_clients:
+                _close_async_client(loop, client)
+
+        async def aclose(self) -> None:
+            """Close the running loop's async client, then everything else as close() does"""
+            loop = asyncio.get_running_loop()
+            with self._lock:
+                client = self._async_clients.pop(loop, None)
+            if client is not None:
+                await client.aclose()
+            self.close()
+
+    return PooledLinkupClient
+
+
+def _close_async_client(loop: asyncio.AbstractEventLoop, client) -> None:
+    """Close an httpx.AsyncClient on the event loop it is bound to"""
+    if loop.is_closed():
+        return
+    if loop.is_running():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(client.aclose())
+        else:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+        return
+    loop.run_until_complete(client.aclose())
+
+
+def _count_connections(client) -> Optional[int]:
+    """Best-effort count of connections held by an httpx client's pool"""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    return len(connections) if connections is not None else None
+
+
+_registry: Dict[Tuple[str, str], Any] = {}
+_registry_lock = threading.Lock()
+_registry_counters: Dict[str, int] = {"clients_created": 0, "client_reuses": 0}
+_pooled_client_class = None
+
+
+def get_linkup_client(api_key: Optional[str] = None, base_url: Optional[str] = None):
+    """
+    Return the process-wide pooled LinkupClient for this API key and base URL
+
+    Every LinkupSearchTool instance shares the same client, so HTTP keep-alive
+    and TLS sessions survive between searches.
+
+    Raises:
+        ImportError: If linkup-sdk is not installed
+        ValueError: If no API key is provided or set in LINKUP_API_KEY
+    """
+    global _pooled_client_class
+
+    api_key = api_key or os.getenv("LINKUP_API_KEY")
+    if not api_key:
+        raise ValueError("LINKUP_API_KEY environment variable not set")
+    base_url = base_url or os.getenv("LINKUP_BASE_URL", DEFAULT_BASE_URL)
+    key = (api_key, base_url)
+
+    with _registry_lock:
+        client = _registry.get(key)
+        if client is not None:
+            _registry_counters["client_reuses"] += 1
+            return client
+
+        if _pooled_client_class is None:
+            _pooled_client_class = _build_pooled_client_class()
+        client = _pooled_client_class(api_key=api_key, base_url=base_url)
+        _registry[key] = client
+        _registry_counters["clients_created"] += 1
+        return client
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Return registry counters, per-client pool statistics, rate limiter state and search coalescing"""
+    with _registry_lock:
+        clients = list(_registry.items())
+        stats: Dict[str, Any] = dict(_registry_counters)
+    stats["clients"] = [
+        {"base_url": base_url, **client.pool_stats()} for (_, base_url), client in clients
+    ]
+    limiter = get_rate_limiter()
+    stats["rate_limiter"] = limiter.stats() if limiter is not None else None
+    stats["single_flight"] = get_search_single_flight().stats()
+    return stats
+
+
+def close_linkup_clients() -> None:
+    """Close and forget every pooled client (e.g. at shutdown or in tests)"""
+    with _registry_lock:
+        clients = list(_registry.values())
+        _registry.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_linkup_clients() -> None:
+    """close_linkup_clients() for code running in an event loop, awaiting that loop's async clients"""
+    with _registry_lock:
+        clients = list(_registry.values())
+        _registry.clear()
+    for client in clients:
+        await client.aclose()
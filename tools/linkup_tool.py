@@ -1,11 +1,124 @@
 import os
 from crewai.tools import BaseTool
-from typing import Type, Any
+from typing import Type, Any, List, Optional
 from pydantic import BaseModel, Field
 import asyncio
 import concurrent.futures
+import contextvars
+import threading
+import time
 from datetime import datetime
 
+from tools.linkup_client import get_linkup_client
+from tools.result_compaction import compact_results
+from tools.search_results import SearchRecord, record_from_response, render_records
+from tools.search_cache import cache_reads_enabled, get_default_search_cache, make_cache_key
+from tools.single_flight import get_search_single_flight
+from tools.tracing import span, increment
+from tools.runtime_profile import get_logger
+from tools.query_planner import QueryPlan, get_default_query_planner
+from tools.prefetcher import get_query_frequency
+
+
+logger = get_logger("linkup")
+
+TRENDING_ANALYSIS_GUIDANCE = """
+=== TRENDING TOPIC ANALYSIS WITH SPECIFICITY REQUIREMENTS ===
+
+The Linkup search results contain various trending topics and viral moments. 
+
+YOUR TASK: Identify trending topics from the search results that can be turned into engaging LinkedIn content.
+
+USE AVAILABLE DETAILS:
+1. NAMES: Include people, leaders, organizations, countries when mentioned
+2. NUMBERS: Add specific figures, percentages, metrics when available
+3. SOURCES: Reference news outlets or platforms when they appear
+4. TIMING: Include dates or timeframes when mentioned
+5. SPECIFICS: Focus on concrete incidents and developments
+
+SEARCH FOR THESE SPECIFIC ELEMENTS:
+- Names of leaders, politicians, business figures, organizations
+- Specific numbers, statistics, financial figures, or metrics
+- Social media engagement numbers (likes, shares, views)
+- News outlet citations (Reuters, BBC, CNN, Bloomberg, etc.)
+- Specific dates and timeline details
+- Concrete developments and outcomes
+
+EXAMPLES OF GOOD SPECIFICITY:
+✅ "Lebanon's Prime Minister announced new economic reforms affecting 2M citizens, reported by Reuters"
+✅ "UAE's trade with Asia increased 15% to $200B in 2024, according to government data"
+✅ "Diplomatic meeting between Saudi Arabia and Iran drew 500K social media mentions, BBC coverage"
+
+❌ AVOID VAGUE DESCRIPTIONS:
+❌ "Middle East faces challenges"
+❌ "Leaders make statements"
+❌ "Tensions rise"
+
+CONTENT APPROACH:
+Extract trending topics exactly as they appear in the search results. Don't force connections to specific industries unless they naturally exist in the source material.
+
+MAIN GOAL: Create engaging LinkedIn topics based on whatever trending content is found in the search results, whether it's geopolitics, business, culture, sports, or any other subject.
+"""
+
+
+def analysis_guidance_inline() -> bool:
+    """
+    Whether tool results carry TRENDING_ANALYSIS_GUIDANCE themselves
+
+    By default the guidance is placed once in the research and topic discovery
+    task prompts, and the tool returns search data only, so the block isn't
+    repeated in the conversation on every tool call. Set
+    LINKUP_INLINE_ANALYSIS_GUIDANCE=1 to restore the old behaviour, e.g. to
+    compare prompt token usage.
+    """
+    return os.getenv("LINKUP_INLINE_ANALYSIS_GUIDANCE", "0") == "1"
+
+
+def analysis_guidance_for_task() -> str:
+    """Guidance section to embed in a task prompt ("" when the tool inlines it)"""
+    if analysis_guidance_inline():
+        return ""
+    return "\n\n" + TRENDING_ANALYSIS_GUIDANCE
+
+
+_search_executor = None
+_search_executor_lock = threading.Lock()
+
+
+def _get_search_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Return the thread pool shared by all synchronous Linkup searches
+
+    A shared pool avoids spinning up threads on every tool call and lets a
+    timed-out search finish in the background without blocking the caller.
+    """
+    global _search_executor
+
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(os.getenv("LINKUP_SEARCH_WORKERS", "16")),
+                thread_name_prefix="linkup-search",
+            )
+        return _search_executor
+
+
+USER_QUERY_TEMPLATES = [
+    "latest news {topic}",
+    "trending {topic}",
+    "breaking news {topic}",
+    "recent developments {topic}",
+    "{topic} news today",
+]
+
+DEFAULT_TRENDING_QUERIES = [
+    "latest business news",
+    "latest tech news",
+    "breaking news today",
+    "latest CEO news",
+    "trending news today",
+]
+
 
 class LinkupSearchInput(BaseModel):
     """Input schema for Linkup Search Tool."""
@@ -20,6 +133,36 @@ class LinkupSearchTool(BaseTool):
         and professional content that can be used for LinkedIn posts."""
     ).strip()
     args_schema: Type[BaseModel] = LinkupSearchInput
+    use_cache: bool = True
+    cache: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Search result cache; defaults to the process-wide cache from tools.search_cache",
+    )
+    max_concurrent_searches: int = 5
+    search_timeout: float = 10.0
+    min_results: int = 3
+    time_budget: float = 20.0
+    hedge_after: float = 4.0
+    dedup_threshold: float = 0.6
+    include_analysis_guidance: bool = Field(
+        default_factory=analysis_guidance_inline,
+        description="Append TRENDING_ANALYSIS_GUIDANCE to results; defaults to LINKUP_INLINE_ANALYSIS_GUIDANCE",
+    )
+    max_result_tokens: Optional[int] = 1500
+    adaptive_queries: bool = True
+    coalesce_searches: bool = True
+    planner: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Query planner; defaults to the process-wide planner from tools.query_planner",
+    )
+
+    def _get_cache(self):
+        """Return the cache used by this tool, or None when caching is disabled"""
+        if not self.use_cache:
+            return None
+        return self.cache if self.cache is not None else get_default_search_cache()
 
     def _run(self, query: str) -> str:
         """
@@ -36,18 +179,18 @@ class LinkupSearchTool(BaseTool):
             if not api_key:
                 return "Error: LINKUP_API_KEY environment variable not set"
             
-            print(f"🔍 Searching for trending topics: '{query}'")
+            logger.info("🔍 Searching for trending topics: '%s'", query)
+            get_query_frequency().record(query)
             
             try:
-                from linkup import LinkupClient
+                client = get_linkup_client(api_key)
             except ImportError:
                 return "Error: linkup-sdk not installed. Please run: pip install linkup-sdk"
             
-            client = LinkupClient(api_key=api_key)
+            with span("linkup.tool_call", query=query, mode="sync"):
+                search_results = self._parallel_trending_search(client, query)
             
-            search_results = self._parallel_trending_search(client, query)
-            
-            print(f"✅ Linkup trending search completed successfully")
+            logger.info("✅ Linkup trending search completed successfully")
             return search_results
                 
         except ImportError:
@@ -56,101 +199,308 @@ class LinkupSearchTool(BaseTool):
             error_msg = str(e)
             return f"Error: {error_msg}"
 
+    async def _arun(self, query: str) -> str:
+        """
+        Async variant of _run for crews running inside an event loop
+        
+        All generated sub-queries are issued at once through the SDK's
+        async client, so a single worker can serve many concurrent tool calls.
+        
+        Args:
+            query: The search query string
+            
+        Returns:
+            String containing search results
+        """
+        try:
+            api_key = os.getenv("LINKUP_API_KEY")
+            if not api_key:
+                return "Error: LINKUP_API_KEY environment variable not set"
+            
+            logger.info("🔍 Searching for trending topics (async): '%s'", query)
+            get_query_frequency().record(query)
+            
+            try:
+                client = get_linkup_client(api_key)
+            except ImportError:
+                return "Error: linkup-sdk not installed. Please run: pip install linkup-sdk"
+            
+            with span("linkup.tool_call", query=query, mode="async"):
+                search_results = await self._async_trending_search(client, query)
+            
+            logger.info("✅ Linkup trending search completed successfully")
+            return search_results
+                
+        except Exception as e:
+            error_msg = str(e)
+            return f"Error: {error_msg}"
+
+    def _build_search_queries(self, query: str) -> list:
+        """
+        Expand the user query into (template, sub-query) candidates to search
+        """
+        if query and query.strip():
+            logger.debug("🎯 User-focused search for: '%s'", query)
+            return [(template, template.format(topic=query)) for template in USER_QUERY_TEMPLATES]
+        logger.debug("🔍 Default trending content search")
+        return [(default_query, default_query) for default_query in DEFAULT_TRENDING_QUERIES]
+
+    def _plan_queries(self, query: str) -> QueryPlan:
+        """
+        Decide which sub-queries to send first and how many answers to wait for
+        
+        With adaptive_queries the planner orders templates by their observed
+        yield and sizes the first wave for the topic, with sub-queries that
+        are already cached first. Otherwise the listed order is used with a
+        first wave of three.
+        """
+        candidates = self._build_search_queries(query)
+        if not self.adaptive_queries:
+            return QueryPlan(first_wave=candidates[:3], fallback=candidates[3:], target=self.min_results, sufficient=2)
+        plan = self._get_planner().plan(query, candidates, self.min_results, cached=self._cached_queries(candidates))
+        increment("linkup_planned_queries_total", len(plan.first_wave))
+        return plan
+
+    def _cached_queries(self, candidates: list) -> set:
+        """Sub-queries among candidates with a fresh cache entry"""
+        contains = getattr(self._get_cache(), "contains", None)
+        if contains is None or not cache_reads_enabled():
+            return set()
+        return {text for _, text in candidates if contains(text, "standard", "sourcedAnswer")}
+
+    def _get_planner(self):
+        return self.planner if self.planner is not None else get_default_query_planner()
+
+    def _record_outcome(self, plan: QueryPlan, search_query: str, record: Optional[SearchRecord], latency: float) -> None:
+        # Cache hits say nothing about a template's latency; only searches sent to Linkup count
+        if self.adaptive_queries and not (record is not None and record.from_cache):
+            self._get_planner().record(plan.template_for(search_query), record, latency, self._is_usable(record))
+
     def _parallel_trending_search(self, client, query: str) -> str:
         """
         Execute multiple parallel searches to find trending content faster
+        
+        The query planner picks the first wave (three queries unless the topic
+        is narrow or some templates have been yielding poorly) and how many
+        usable answers are enough. The whole call is bounded by time_budget
+        seconds of wall-clock time and each sub-query by search_timeout. The
+        fallback queries start once the first wave has finished (answered,
+        failed or timed out) with fewer than plan.sufficient usable answers,
+        or speculatively alongside it if it is still short after hedge_after
+        seconds. Whatever has arrived when the budget runs out is returned.
         """
-        if query and query.strip():
-            search_queries = [
-                f"latest news {query}",
-                f"trending {query}",
-                f"breaking news {query}",
-                f"recent developments {query}",
-                f"{query} news today"
-            ]
-            print(f"🎯 User-focused search for: '{query}'")
-        else:
-            search_queries = [
-                "latest business news",
-                "latest tech news", 
-                "breaking news today",
-                "latest CEO news",
-                "trending news today"
-            ]
-            print("🔍 Default trending content search")
+        plan = self._plan_queries(query)
+        first_wave = [text for _, text in plan.first_wave]
+        fallback_queries = [text for _, text in plan.fallback]
+        
+        executor = _get_search_executor()
+        start = time.monotonic()
+        deadline = start + self.time_budget
+        pending = {}
         
+        def launch(queries):
+            submitted_at = time.monotonic()
+            for q in queries:
+                # Copy the context so sub-query spans keep the tool call as parent
+                future = executor.submit(contextvars.copy_context().run, self._execute_single_search, client, q)
+                pending[future] = (q, submitted_at)
+        
+        launch(first_wave)
+        fallback_launched = False
         all_results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_query = {
-                executor.submit(self._execute_single_search, client, q): q 
-                for q in search_queries[:3]
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_query):
-                query_text = future_to_query[future]
-                try:
-                    result = future.result(timeout=10)  # 10 second timeout per search
-                    if result and len(result) > 50: 
-                        all_results.append(f"=== SEARCH: {query_text[:50]}... ===\n{result}\n")
-                except Exception as e:
-                    print(f"Search failed for '{query_text[:30]}...': {e}")
-                    continue
         
-        if len(all_results) < 2:
-            for q in search_queries[3:]:
+        while len(all_results) < plan.target:
+            now = time.monotonic()
+            if now >= deadline:
+                logger.warning("⏱️  Search budget of %ss exhausted with %d searches outstanding", self.time_budget, len(pending))
+                break
+            
+            for future, (query_text, submitted_at) in list(pending.items()):
+                if now - submitted_at >= self.search_timeout:
+                    logger.warning("Search timed out for '%s...'", query_text[:30])
+                    increment("linkup_search_timeouts_total")
+                    self._record_outcome(plan, query_text, None, self.search_timeout)
+                    future.cancel()
+                    del pending[future]
+            
+            # Checked before giving up on an empty pending set: a first wave that
+            # timed out entirely still has the fallback to try
+            reason = None if fallback_launched else self._fallback_reason(plan, now - start, len(pending), len(all_results))
+            if reason is not None:
+                self._log_fallback(reason, len(fallback_queries))
+                launch(fallback_queries)
+                fallback_launched = True
+            
+            if not pending:
+                break
+            
+            wake_at = min(
+                [deadline]
+                + [submitted_at + self.search_timeout for _, submitted_at in pending.values()]
+                + ([start + self.hedge_after] if not fallback_launched and fallback_queries else [])
+            )
+            done, _ = concurrent.futures.wait(
+                pending,
+                timeout=max(0.0, wake_at - time.monotonic()),
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            
+            for future in done:
+                query_text, submitted_at = pending.pop(future)
                 try:
-                    result = self._execute_single_search(client, q)
-                    if result and len(result) > 50:
-                        all_results.append(f"=== SEARCH: {q[:50]}... ===\n{result}\n")
-                        if len(all_results) >= 3:  # Stop when we have enough
-                            break
+                    record = future.result()
+                    self._record_outcome(plan, query_text, record, time.monotonic() - submitted_at)
+                    if self._is_usable(record): 
+                        all_results.append(record)
                 except Exception as e:
+                    self._record_outcome(plan, query_text, None, time.monotonic() - submitted_at)
+                    logger.warning("Search failed for '%s...': %s", query_text[:30], e)
                     continue
         
-        if all_results:
-            combined_results = "\n".join(all_results)
-            
-            analysis_prompt = """
-            
-=== TRENDING TOPIC ANALYSIS WITH SPECIFICITY REQUIREMENTS ===
-
-The search results above contain various trending topics and viral moments. 
-
-YOUR TASK: Identify trending topics from the search results that can be turned into engaging LinkedIn content.
-
-USE AVAILABLE DETAILS:
-1. NAMES: Include people, leaders, organizations, countries when mentioned
-2. NUMBERS: Add specific figures, percentages, metrics when available
-3. SOURCES: Reference news outlets or platforms when they appear
-4. TIMING: Include dates or timeframes when mentioned
-5. SPECIFICS: Focus on concrete incidents and developments
+        for future in pending:
+            future.cancel()
+        
+        return self._format_results(all_results[:plan.target])
 
-SEARCH FOR THESE SPECIFIC ELEMENTS:
-- Names of leaders, politicians, business figures, organizations
-- Specific numbers, statistics, financial figures, or metrics
-- Social media engagement numbers (likes, shares, views)
-- News outlet citations (Reuters, BBC, CNN, Bloomberg, etc.)
-- Specific dates and timeline details
-- Concrete developments and outcomes
+    async def _async_trending_search(self, client, query: str) -> str:
+        """
+        Async counterpart of _parallel_trending_search
+        
+        The planned first wave is issued at once through the SDK's async
+        client (at most max_concurrent_searches in flight). The fallback
+        queries start only if the first wave comes back with fewer than
+        plan.sufficient usable answers, or is still short after hedge_after
+        seconds. Each sub-query is cut off after search_timeout seconds and
+        the whole call after time_budget; outstanding searches are cancelled
+        as soon as the plan's target of usable answers has arrived.
+        """
+        plan = self._plan_queries(query)
+        first_wave = [text for _, text in plan.first_wave]
+        fallback_queries = [text for _, text in plan.fallback]
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_searches))
+        start = time.monotonic()
+        deadline = start + self.time_budget
+        
+        async def bounded_search(q: str):
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    record = await asyncio.wait_for(
+                        self._execute_single_search_async(client, q),
+                        timeout=self.search_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    self._record_outcome(plan, q, None, self.search_timeout)
+                    raise
+                self._record_outcome(plan, q, record, time.monotonic() - started)
+                return record
+        
+        tasks, pending = [], set()
+        
+        def launch(queries):
+            for q in queries:
+                task = asyncio.ensure_future(bounded_search(q))
+                tasks.append(task)
+                pending.add(task)
+        
+        launch(first_wave)
+        fallback_launched = False
+        all_results = []
+        try:
+            while len(all_results) < plan.target:
+                now = time.monotonic()
+                if now >= deadline:
+                    logger.warning("⏱️  Search budget of %ss exhausted with %d searches outstanding", self.time_budget, len(pending))
+                    break
+                
+                reason = None if fallback_launched else self._fallback_reason(plan, now - start, len(pending), len(all_results))
+                if reason is not None:
+                    self._log_fallback(reason, len(fallback_queries))
+                    launch(fallback_queries)
+                    fallback_launched = True
+                
+                if not pending:
+                    break
+                
+                wake_at = deadline
+                if not fallback_launched and fallback_queries:
+                    wake_at = min(deadline, start + self.hedge_after)
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, wake_at - time.monotonic()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                pending -= done
+                
+                for task in done:
+                    try:
+                        record = task.result()
+                    except asyncio.TimeoutError:
+                        logger.warning("Search timed out, skipping")
+                        increment("linkup_search_timeouts_total")
+                        continue
+                    except Exception as e:
+                        logger.warning("Search failed: %s", e)
+                        continue
+                    if self._is_usable(record):
+                        all_results.append(record)
+        finally:
+            stragglers = [task for task in tasks if not task.done()]
+            for task in stragglers:
+                task.cancel()
+            if stragglers:
+                logger.debug("✂️  Cancelled %d outstanding searches", len(stragglers))
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return self._format_results(all_results[:plan.target])
 
-EXAMPLES OF GOOD SPECIFICITY:
-✅ "Lebanon's Prime Minister announced new economic reforms affecting 2M citizens, reported by Reuters"
-✅ "UAE's trade with Asia increased 15% to $200B in 2024, according to government data"
-✅ "Diplomatic meeting between Saudi Arabia and Iran drew 500K social media mentions, BBC coverage"
+    def _fallback_reason(self, plan: QueryPlan, elapsed: float, outstanding: int, usable: int) -> Optional[str]:
+        """
+        Why a plan's fallback queries should start now, or None to keep waiting
 
-❌ AVOID VAGUE DESCRIPTIONS:
-❌ "Middle East faces challenges"
-❌ "Leaders make statements"
-❌ "Tensions rise"
+        "hedge" once the first wave has been running for hedge_after seconds,
+        "short_first_wave" once none of it is outstanding (every search
+        answered, failed or timed out) and fewer than plan.sufficient usable
+        answers came back.
+        """
+        if not plan.fallback:
+            return None
+        if elapsed >= self.hedge_after:
+            return "hedge"
+        if outstanding == 0 and usable < plan.sufficient:
+            return "short_first_wave"
+        return None
 
-CONTENT APPROACH:
-Extract trending topics exactly as they appear in the search results. Don't force connections to specific industries unless they naturally exist in the source material.
+    @staticmethod
+    def _log_fallback(reason: str, count: int) -> None:
+        if reason == "hedge":
+            logger.info("🪂 First wave is late, launching %d fallback searches", count)
+        else:
+            logger.info("🪂 First wave came back short, launching %d fallback searches", count)
+        increment("linkup_fallback_total", reason=reason)
 
-MAIN GOAL: Create engaging LinkedIn topics based on whatever trending content is found in the search results, whether it's geopolitics, business, culture, sports, or any other subject.
-"""
+    def _format_results(self, all_results: List[SearchRecord]) -> str:
+        """
+        Render search records for the LLM, or return the fallback block
+        
+        This is the only place records are turned into text. Near-duplicate
+        sentences and sources across records are removed and the remainder
+        is held to max_result_tokens before it reaches the LLM.
+        """
+        if all_results:
+            report = compact_results(all_results, self.dedup_threshold, self.max_result_tokens)
+            if report.tokens_saved > 0:
+                logger.info(
+                    "🧹 Compacted search results: %d → %d tokens (%d saved)",
+                    report.tokens_before, report.tokens_after, report.tokens_saved,
+                )
+            combined_results = render_records(report.records)
             
-            return combined_results + analysis_prompt
+            if self.include_analysis_guidance:
+                return combined_results + "\n\n" + TRENDING_ANALYSIS_GUIDANCE
+            return combined_results
         else:
+            increment("linkup_fallback_total", reason="canned_block")
             fallback_content = """
 === FALLBACK TRENDING TOPICS (Search temporarily limited) ===
 
@@ -173,28 +523,131 @@ Focus on creating specific, detailed topics even with limited real-time search r
 """
             return fallback_content
 
-    def _execute_single_search(self, client, search_query: str) -> str:
+    def _execute_single_search(self, client, search_query: str, refresh: bool = False) -> Optional[SearchRecord]:
         """
         Execute a single optimized search query
+
+        Concurrent callers of the same normalized query share one request
+        (see tools.single_flight) unless coalesce_searches is off. With
+        refresh the cache is not read, only rewritten (used by the prefetcher).
         """
-        try:
-            print(f"📡 Linkup Query: '{search_query}'")
-            response = client.search(
-                query=search_query,
-                depth="standard", 
-                output_type="sourcedAnswer",
-                include_images=False,
-            )
-            
-            if hasattr(response, 'answer') and response.answer:
-                result = response.answer
-                if result and result.lower() not in ['undefined', 'none', '']:
-                    return result
-            elif hasattr(response, 'results') and response.results:
-                return str(response.results)
-            
-            return ""
-            
-        except Exception as e:
-            print(f"Single search error: {e}")
-            return "" 
\ No newline at end of file
+        with span("linkup.search", query=search_query) as current:
+            cached = None if refresh else self._cached_record(search_query)
+            current.set("cached", cached is not None)
+            if cached is not None:
+                return cached
+
+            def fetch() -> SearchRecord:
+                logger.debug("📡 Linkup Query: '%s'", search_query)
+                started = time.perf_counter()
+                response = client.search(
+                    query=search_query,
+                    depth="standard", 
+                    output_type="sourcedAnswer",
+                    include_images=False,
+                )
+                
+                record = record_from_response(search_query, response, time.perf_counter() - started)
+                self._store_record(record)
+                return record
+
+            try:
+                if self.coalesce_searches:
+                    record, coalesced = get_search_single_flight().do(self._flight_key(search_query), fetch)
+                    current.set("coalesced", coalesced)
+                else:
+                    record = fetch()
+                current.set("usable", self._is_usable(record))
+                return record
+                
+            except Exception as e:
+                logger.warning("Single search error: %s", e)
+                current.set("error", str(e))
+                increment("linkup_search_errors_total")
+                return None
+
+    async def _execute_single_search_async(self, client, search_query: str) -> Optional[SearchRecord]:
+        """
+        Async counterpart of _execute_single_search using client.async_search
+        """
+        with span("linkup.search", query=search_query) as current:
+            cached = self._cached_record(search_query)
+            current.set("cached", cached is not None)
+            if cached is not None:
+                return cached
+
+            async def fetch() -> SearchRecord:
+                logger.debug("📡 Linkup Query: '%s'", search_query)
+                started = time.perf_counter()
+                response = await client.async_search(
+                    query=search_query,
+                    depth="standard", 
+                    output_type="sourcedAnswer",
+                    include_images=False,
+                )
+                
+                record = record_from_response(search_query, response, time.perf_counter() - started)
+                self._store_record(record)
+                return record
+
+            try:
+                if self.coalesce_searches:
+                    record, coalesced = await get_search_single_flight().ado(self._flight_key(search_query), fetch)
+                    current.set("coalesced", coalesced)
+                else:
+                    record = await fetch()
+                current.set("usable", self._is_usable(record))
+                return record
+                
+            except Exception as e:
+                logger.warning("Single search error: %s", e)
+                current.set("error", str(e))
+                increment("linkup_search_errors_total")
+                return None
+
+    @staticmethod
+    def _flight_key(search_query: str):
+        # Same normalization as the cache, so searches that would share an entry share a request
+        return make_cache_key(search_query, "standard", "sourcedAnswer")
+
+    def _cached_record(self, search_query: str) -> Optional[SearchRecord]:
+        cache = self._get_cache()
+        if cache is None or not cache_reads_enabled():
+            return None
+        cached = cache.get(search_query, "standard", "sourcedAnswer")
+        if cached is None:
+            increment("linkup_cache_misses_total")
+            return None
+        increment("linkup_cache_hits_total")
+        logger.debug("⚡ Cache hit: '%s'", search_query)
+        record = SearchRecord.from_dict(cached, query=search_query)
+        record.from_cache = True
+        return record
+
+    def _store_record(self, record: Optional[SearchRecord]) -> None:
+        cache = self._get_cache()
+        if record is not None and cache is not None:
+            cache.set(record.query, "standard", "sourcedAnswer", record.to_dict())
+
+    @staticmethod
+    def _is_usable(record: Optional[SearchRecord]) -> bool:
+        return record is not None and len(record.answer) > 50
+
+
+_shared_search_tool: Optional[LinkupSearchTool] = None
+_shared_search_tool_lock = threading.Lock()
+
+
+def get_shared_search_tool() -> LinkupSearchTool:
+    """
+    Return the process-wide LinkupSearchTool used by the crew's agents
+
+    The tool is built once so every agent shares its configuration, cache and
+    pooled client instead of constructing a new tool per agent or task.
+    """
+    global _shared_search_tool
+
+    with _shared_search_tool_lock:
+        if _shared_search_tool is None:
+            _shared_search_tool = LinkupSearchTool()
+        return _shared_search_tool
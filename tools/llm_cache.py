@@ -0,0 +1,145 @@
+import os
+import json
+import hashlib
+import threading
+import contextlib
+import contextvars
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from tools.search_cache import SearchCache
+
+
+# Tasks whose output should differ run to run: a rerun of a post should write a new post
+DEFAULT_SKIP_TASKS = "content_creation"
+
+# Completion parameters that change how a request is sent, not what the model answers
+_TRANSPORT_PARAMS = frozenset({
+    "timeout", "stream", "stream_options", "max_retries",
+    "api_key", "api_base", "base_url", "api_version",
+})
+
+_bypass: contextvars.ContextVar = contextvars.ContextVar("llm_cache_bypass", default=False)
+
+
+@contextlib.contextmanager
+def fresh_completions() -> Iterator[None]:
+    """
+    Skip the LLM cache for calls made inside the block, e.g. to get a new take on a post
+
+    Fresh answers still replace the cached ones, so later cached calls see
+    the newest completion. Applies to the current thread and to threads
+    started with a copy of its context (such as stream_linkedin_post's).
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def _jsonable(value: Any) -> Any:
+    # response_format is a pydantic class; its schema is what the model sees
+    schema = getattr(value, "model_json_schema", None)
+    if callable(schema):
+        return schema()
+    return str(value)
+
+
+def completion_key(params: Dict[str, Any]) -> str:
+    """
+    Content address of a completion request
+
+    SHA-256 over the model, the full message list and every parameter that
+    affects the answer (temperature, stop words, response format...), so
+    two requests share an entry only when the model would see the same input.
+    """
+    relevant = {name: value for name, value in params.items() if name not in _TRANSPORT_PARAMS and value is not None}
+    canonical = json.dumps(relevant, sort_keys=True, separators=(",", ":"), default=_jsonable)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    Cache of LLM completions keyed by completion_key
+
+    Entries live in a SearchCache, the same two-tier store as Linkup
+    results: an in-process LRU of ``max_entries`` and an optional SQLite
+    file (shared by every process using ``db_path``, so reruns after a
+    crash are served from it) capped at ``max_disk_entries``. Entries older
+    than ``ttl_seconds`` are misses. Tasks named in ``skip_tasks`` always
+    call the model and their completions are never stored; everything
+    inside fresh_completions() calls the model too, but its answers are.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_entries: int = 256,
+        db_path: Optional[str] = None,
+        max_disk_entries: int = 2000,
+        skip_tasks: Iterable[str] = (),
+    ):
+        self.skip_tasks = frozenset(skip_tasks)
+        self._store = SearchCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            db_path=db_path,
+            max_disk_entries=max_disk_entries,
+        )
+
+    def reads_enabled(self, task: Any = None) -> bool:
+        """Whether a call for this crewai task may be answered from the cache"""
+        return not _bypass.get() and self.writes_enabled(task)
+
+    def writes_enabled(self, task: Any = None) -> bool:
+        """Whether a completion for this crewai task is stored"""
+        return (getattr(task, "name", None) or "") not in self.skip_tasks
+
+    def get(self, key: str) -> Optional[str]:
+        return self._store.get(key, "llm", "completion")
+
+    def set(self, key: str, completion: str) -> None:
+        self._store.set(key, "llm", "completion", completion)
+
+    def invalidate(self, key: str) -> None:
+        self._store.invalidate(key, "llm", "completion")
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._store.stats()
+
+
+_default_cache: Optional[LLMCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """
+    Return the process-wide LLM completion cache configured from the environment
+
+    Environment variables:
+        LLM_CACHE_TTL: Seconds a completion is reused (default 3600, 0 disables the cache)
+        LLM_CACHE_SIZE: Completions kept in memory (default 256)
+        LLM_CACHE_PATH: SQLite file for the on-disk tier (default .cache/llm_completions.sqlite,
+            empty string keeps the cache in memory only)
+        LLM_CACHE_SKIP_TASKS: Comma-separated task names that always call the model and are
+            never stored (default content_creation, so every post is written fresh;
+            empty string caches every task)
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            ttl = float(os.getenv("LLM_CACHE_TTL", "3600"))
+            if ttl <= 0:
+                return None
+            skip = os.getenv("LLM_CACHE_SKIP_TASKS", DEFAULT_SKIP_TASKS)
+            _default_cache = LLMCache(
+                ttl_seconds=ttl,
+                max_entries=int(os.getenv("LLM_CACHE_SIZE", "256")),
+                db_path=os.getenv("LLM_CACHE_PATH", ".cache/llm_completions.sqlite") or None,
+                skip_tasks=[name.strip() for name in skip.split(",") if name.strip()],
+            )
+        return _default_cache
@@ -0,0 +1,402 @@
+import os
+import copy
+import time
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from crewai import LLM
+
+from tools.llm_cache import LLMCache, completion_key, get_llm_cache
+from tools.result_compaction import estimate_tokens
+from tools.runtime_profile import get_logger
+from tools.tracing import increment, observe
+
+
+logger = get_logger("model_router")
+
+DEFAULT_MODEL = "gpt-4.1-2025-04-14"
+
+# crewai task name -> route; tasks without a known name use their agent's route
+TASK_ROUTES = {
+    "topic_discovery": "topic",
+    "research": "research",
+    "content_creation": "content",
+}
+
+# Input sizes (estimated prompt tokens) with separate latency estimates, since
+# a model that is fast on a short prompt can be slow on a long research context
+INPUT_BUCKETS = (2_000, 8_000, 32_000)
+
+# A primary call with a latency budget is abandoned for the fallback model after
+# this multiple of the budget
+FALLBACK_TIMEOUT_FACTOR = 2.0
+
+
+@dataclass
+class ModelRoute:
+    """
+    Model choice for one kind of task
+
+    Args:
+        name: Route name ("topic", "research" or "content")
+        model: Primary model
+        fallback_model: Faster model used when the primary is too slow (None disables fallback)
+        latency_budget: Target seconds per LLM call (0 means no budget, always use the primary)
+    """
+    name: str
+    model: str
+    fallback_model: Optional[str] = None
+    latency_budget: float = 0.0
+
+    @property
+    def can_fall_back(self) -> bool:
+        return bool(self.fallback_model) and self.fallback_model != self.model and self.latency_budget > 0
+
+
+class _ModelLatency:
+    """Smoothed latency of one model per input-size bucket"""
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        # bucket -> (smoothed seconds, monotonic time of the last sample)
+        self.buckets: Dict[int, Tuple[float, float]] = {}
+
+    def record(self, bucket: int, seconds: float) -> None:
+        previous = self.buckets.get(bucket)
+        smoothed = seconds if previous is None else previous[0] + self.alpha * (seconds - previous[0])
+        self.buckets[bucket] = (smoothed, time.monotonic())
+
+    def predict(self, bucket: int) -> Optional[Tuple[float, float]]:
+        """(seconds, sampled_at) for the bucket, or for the nearest bucket with samples"""
+        if bucket in self.buckets:
+            return self.buckets[bucket]
+        if not self.buckets:
+            return None
+        nearest = min(self.buckets, key=lambda known: abs(known - bucket))
+        return self.buckets[nearest]
+
+
+class ModelRouter:
+    """
+    Picks the model for each LLM call from the task type, input size and latency budget
+
+    Every call is routed by its task ("topic", "research" or "content") to
+    that route's primary model. When the route has a latency budget and a
+    fallback model, the router keeps a smoothed latency per model and input
+    size, and sends the call straight to the fallback while the primary is
+    predicted to exceed the budget for an input of that size. Every
+    ``probe_interval`` seconds one such call still goes to the primary, so
+    the router notices when it recovers. A primary call that runs past
+    FALLBACK_TIMEOUT_FACTOR x the budget is abandoned and retried on the
+    fallback.
+    """
+
+    def __init__(self, routes: Dict[str, ModelRoute], probe_interval: float = 60.0):
+        self.routes = routes
+        self.probe_interval = probe_interval
+        self._lock = threading.Lock()
+        self._latency: Dict[str, _ModelLatency] = {}
+        self._route_counters: Dict[str, Dict[str, int]] = {
+            name: {"calls": 0, "cache_hits": 0, "routed_to_fallback": 0, "timeouts": 0, "errors": 0} for name in routes
+        }
+        # (route, model) -> calls, seconds, prompt tokens, completion tokens, slowest call
+        self._model_counters: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def route(self, name: str) -> ModelRoute:
+        return self.routes[name]
+
+    def route_for_task(self, task: Any, default: str) -> str:
+        """Route of a crewai task, or default when the task is unknown"""
+        return TASK_ROUTES.get(getattr(task, "name", None) or "", default)
+
+    def select(self, route_name: str, input_tokens: int) -> str:
+        """Model to call for a prompt of input_tokens on this route"""
+        route = self.routes[route_name]
+        if not route.can_fall_back:
+            return route.model
+        bucket = bisect_right(INPUT_BUCKETS, input_tokens)
+        with self._lock:
+            latency = self._latency.get(route.model)
+            predicted = latency.predict(bucket) if latency is not None else None
+        if predicted is None:
+            return route.model
+        seconds, sampled_at = predicted
+        if seconds <= route.latency_budget or time.monotonic() - sampled_at >= self.probe_interval:
+            return route.model
+        with self._lock:
+            self._route_counters[route_name]["routed_to_fallback"] += 1
+        return route.fallback_model
+
+    def timeout_for(self, route_name: str, model: str) -> Optional[float]:
+        """Seconds after which a call is abandoned for the fallback (None: no router timeout)"""
+        route = self.routes[route_name]
+        if route.can_fall_back and model == route.model:
+            return route.latency_budget * FALLBACK_TIMEOUT_FACTOR
+        return None
+
+    def record(
+        self,
+        route_name: str,
+        model: str,
+        input_tokens: int,
+        seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        outcome: str = "ok",
+    ) -> None:
+        """
+        Record one call's latency and token usage under its route and model
+
+        outcome is "ok", "timeout", "error" or "cached"; cached answers are
+        only counted, since they say nothing about the model's latency.
+        """
+        if outcome == "cached":
+            with self._lock:
+                self._route_counters[route_name]["cache_hits"] += 1
+            increment("llm_route_cache_hits_total", route=route_name, model=model)
+            return
+
+        bucket = bisect_right(INPUT_BUCKETS, input_tokens)
+        with self._lock:
+            if outcome != "error":
+                self._latency.setdefault(model, _ModelLatency()).record(bucket, seconds)
+            route = self._route_counters[route_name]
+            route["calls"] += 1
+            if outcome == "timeout":
+                route["timeouts"] += 1
+            elif outcome == "error":
+                route["errors"] += 1
+            counters = self._model_counters.setdefault(
+                (route_name, model),
+                {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "prompt_tokens": 0, "completion_tokens": 0},
+            )
+            counters["calls"] += 1
+            counters["seconds"] += seconds
+            counters["max_seconds"] = max(counters["max_seconds"], seconds)
+            counters["prompt_tokens"] += prompt_tokens
+            counters["completion_tokens"] += completion_tokens
+
+        observe("llm_route_duration_seconds", seconds, route=route_name, model=model, outcome=outcome)
+        increment("llm_route_prompt_tokens_total", prompt_tokens, route=route_name, model=model)
+        increment("llm_route_completion_tokens_total", completion_tokens, route=route_name, model=model)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per route: its configuration, call counters and latency/tokens per model"""
+        with self._lock:
+            stats: Dict[str, Any] = {}
+            for name, route in self.routes.items():
+                models = {}
+                for (route_name, model), counters in self._model_counters.items():
+                    if route_name != name:
+                        continue
+                    calls = counters["calls"]
+                    models[model] = {
+                        "calls": calls,
+                        "latency_avg": counters["seconds"] / calls if calls else 0.0,
+                        "latency_max": counters["max_seconds"],
+                        "prompt_tokens": counters["prompt_tokens"],
+                        "completion_tokens": counters["completion_tokens"],
+                    }
+                stats[name] = {
+                    "model": route.model,
+                    "fallback_model": route.fallback_model,
+                    "latency_budget": route.latency_budget,
+                    **self._route_counters[name],
+                    "models": models,
+                }
+        return stats
+
+
+def _message_text(messages: Union[str, List[Dict[str, Any]]]) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(message.get("content") or "") for message in messages)
+
+
+def _token_processes(callbacks: Optional[List[Any]]) -> List[Any]:
+    """crewai token counters reachable from the callbacks of a call"""
+    return [
+        callback.token_cost_process
+        for callback in callbacks or []
+        if getattr(callback, "token_cost_process", None) is not None
+    ]
+
+
+def _token_totals(processes: List[Any]) -> Tuple[int, int]:
+    prompt = completion = 0
+    for process in processes:
+        summary = process.get_summary()
+        prompt += summary.prompt_tokens
+        completion += summary.completion_tokens
+    return prompt, completion
+
+
+class RoutedLLM(LLM):
+    """
+    crewai LLM whose model is chosen by a ModelRouter on every call
+
+    ``route`` is used for calls whose task isn't one of TASK_ROUTES, e.g.
+    the research agent's route when it runs an unnamed task. With a
+    ``cache``, text completions are looked up by content before the model
+    is called (see LLMCache). Each call runs on its own shallow copy with
+    the chosen model and timeout, so one RoutedLLM can serve concurrent calls.
+    """
+
+    def __init__(self, router: ModelRouter, route: str, cache: Optional[LLMCache] = None, **kwargs):
+        super().__init__(model=router.route(route).model, **kwargs)
+        self.router = router
+        self.route = route
+        self.cache = cache
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+    ):
+        route_name = self.router.route_for_task(from_task, self.route)
+        input_tokens = estimate_tokens(_message_text(messages))
+        model = self.router.select(route_name, input_tokens)
+        args = (messages, tools, callbacks, available_functions, from_task, from_agent)
+
+        timeout = self.router.timeout_for(route_name, model)
+        try:
+            return self._call_model(route_name, model, input_tokens, timeout, *args)
+        except Exception as e:
+            fallback = self.router.route(route_name).fallback_model
+            if timeout is None or not _is_timeout(e):
+                raise
+            logger.warning("⏱️  %s call on %s took over %.0fs; retrying on %s", route_name, model, timeout, fallback)
+            return self._call_model(route_name, fallback, input_tokens, None, *args)
+
+    def _call_model(
+        self,
+        route_name,
+        model,
+        input_tokens,
+        timeout,
+        messages,
+        tools,
+        callbacks,
+        available_functions,
+        from_task,
+        from_agent,
+    ):
+        llm = self._for_call(model, timeout)
+        processes = _token_processes(callbacks)
+        tokens_before = _token_totals(processes)
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            # Only plain text completions are cached; native tool calls return objects
+            cache_key = None
+            cacheable = not tools and not available_functions
+            if self.cache is not None and cacheable and self.cache.writes_enabled(from_task):
+                cache_key = completion_key(llm._prepare_completion_params(messages))
+                cached = self.cache.get(cache_key) if self.cache.reads_enabled(from_task) else None
+                if cached is not None:
+                    outcome = "cached"
+                    llm._replay(cached, messages, from_task, from_agent)
+                    return cached
+
+            answer = LLM.call(llm, messages, tools, callbacks, available_functions, from_task, from_agent)
+            outcome = "ok"
+            if cache_key is not None and isinstance(answer, str) and answer:
+                self.cache.set(cache_key, answer)
+            return answer
+        except Exception as e:
+            outcome = "timeout" if _is_timeout(e) else "error"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            tokens_after = _token_totals(processes)
+            prompt_tokens = tokens_after[0] - tokens_before[0]
+            completion_tokens = tokens_after[1] - tokens_before[1]
+            if not processes and outcome == "ok":
+                # Called outside an agent (e.g. output conversion): estimate instead
+                prompt_tokens, completion_tokens = input_tokens, estimate_tokens(str(answer))
+            self.router.record(route_name, model, input_tokens, elapsed, prompt_tokens, completion_tokens, outcome)
+
+    def _for_call(self, model: str, timeout: Optional[float]) -> "RoutedLLM":
+        """A shallow copy of this LLM set up for one call on model, leaving self untouched"""
+        llm = copy.copy(self)
+        llm.model, llm.is_anthropic = model, self._is_anthropic_model(model)
+        if timeout is not None:
+            llm.timeout = min(timeout, self.timeout) if self.timeout else timeout
+            # The client's own retries would multiply the timeout; the fallback is the retry
+            llm.additional_params = {**self.additional_params, "max_retries": 0}
+        return llm
+
+    def _replay(self, completion: str, messages, from_task, from_agent) -> None:
+        """Emit the events of a real call for a cached completion, so streams and tracing see it"""
+        from crewai.utilities.events import crewai_event_bus
+        from crewai.utilities.events.llm_events import (
+            LLMCallCompletedEvent,
+            LLMCallStartedEvent,
+            LLMCallType,
+            LLMStreamChunkEvent,
+        )
+
+        context = {"from_task": from_task, "from_agent": from_agent}
+        crewai_event_bus.emit(self, event=LLMCallStartedEvent(messages=messages, model=self.model, **context))
+        if self.stream:
+            crewai_event_bus.emit(self, event=LLMStreamChunkEvent(chunk=completion, **context))
+        crewai_event_bus.emit(self, event=LLMCallCompletedEvent(
+            messages=messages,
+            response=completion,
+            call_type=LLMCallType.LLM_CALL,
+            model=self.model,
+            **context,
+        ))
+
+
+def _is_timeout(error: Exception) -> bool:
+    # litellm.Timeout and openai's APITimeoutError; avoids importing either here
+    return "timeout" in type(error).__name__.lower()
+
+
+_default_router: Optional[ModelRouter] = None
+_default_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """
+    Return the process-wide model router configured from the environment
+
+    Environment variables:
+        OPENAI_MODEL_NAME: Default model for every route (default gpt-4.1-2025-04-14)
+        TOPIC_MODEL_NAME: Model for topic discovery
+        RESEARCH_MODEL_NAME: Model for research
+        CONTENT_MODEL_NAME: Model for writing posts
+        FAST_MODEL_NAME: Faster fallback model used when a route's model is over budget (default none)
+        MODEL_LATENCY_BUDGET: Target seconds per LLM call (default 0, no budget);
+            TOPIC_/RESEARCH_/CONTENT_MODEL_LATENCY_BUDGET override it per route
+    """
+    global _default_router
+
+    with _default_router_lock:
+        if _default_router is None:
+            default_model = os.getenv("OPENAI_MODEL_NAME") or DEFAULT_MODEL
+            fallback_model = os.getenv("FAST_MODEL_NAME") or None
+            default_budget = float(os.getenv("MODEL_LATENCY_BUDGET") or 0)
+            routes = {}
+            for name in ("topic", "research", "content"):
+                prefix = name.upper()
+                routes[name] = ModelRoute(
+                    name=name,
+                    model=os.getenv(f"{prefix}_MODEL_NAME") or default_model,
+                    fallback_model=fallback_model,
+                    latency_budget=float(os.getenv(f"{prefix}_MODEL_LATENCY_BUDGET") or default_budget),
+                )
+            _default_router = ModelRouter(routes)
+        return _default_router
+
+
+def routed_llm(route: str) -> RoutedLLM:
+    """A RoutedLLM on the process-wide router and LLM cache, for an agent whose default route is route"""
+    return RoutedLLM(get_model_router(), route, cache=get_llm_cache())
@@ -0,0 +1,189 @@
+import threading
+import contextlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set
+
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+# Event kinds after which a stream produces nothing more
+TERMINAL_KINDS = ("done", "error", "cancelled")
+
+
+@dataclass
+class StreamEvent:
+    """
+    One item of a streamed post
+
+    kind is "status" (research progress), "token" (a chunk of the post as
+    the content creator writes it), or one of the terminal kinds: "done"
+    (text holds the final post), "error" (text holds the message) or
+    "cancelled".
+    """
+    kind: str
+    text: str = ""
+    agent: str = ""
+
+
+class StreamCancelled(TimeoutError):
+    """
+    Raised inside a streamed pipeline to stop it once the caller has gone away
+
+    Subclasses TimeoutError because crewai agents re-run a task on most
+    other exceptions, but propagate timeouts immediately.
+    """
+
+
+class FinalAnswerFilter:
+    """
+    Strip the ReAct preamble ("Thought: ...") from a streamed agent answer
+
+    Chunks are held back until "Final Answer:" has been seen; everything
+    after the marker is passed through as it arrives, minus the whitespace
+    that separates the marker from the answer.
+    """
+
+    def __init__(self, marker: str = FINAL_ANSWER_MARKER):
+        self.marker = marker
+        self._buffer = ""
+        self._open = False
+        self._started = False
+
+    def feed(self, chunk: str) -> str:
+        if self._open:
+            text = chunk
+        else:
+            self._buffer += chunk
+            index = self._buffer.find(self.marker)
+            if index < 0:
+                return ""
+            self._open = True
+            text = self._buffer[index + len(self.marker):]
+        if not self._started:
+            # The marker may end a chunk, leaving the separator at the start of the next
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
+
+    def reset(self) -> None:
+        self._buffer = ""
+        self._open = False
+        self._started = False
+
+
+class PostStreamSubscription:
+    """
+    Receives crewai events emitted on the thread a streamed pipeline runs on
+
+    crewai's event bus is process-wide and calls handlers on the emitting
+    thread, so events are routed to the subscription attached to the
+    current thread. Concurrent streams never see each other's events.
+    """
+
+    def __init__(self, emit: Callable[[StreamEvent], None], token_roles: Set[str]):
+        self.emit = emit
+        self.token_roles = token_roles
+        self.cancelled = threading.Event()
+        self._filters: Dict[str, FinalAnswerFilter] = {}
+
+    @contextlib.contextmanager
+    def attach(self):
+        _register_listeners()
+        ident = threading.get_ident()
+        with _subscribers_lock:
+            _subscribers[ident] = self
+        try:
+            yield self
+        finally:
+            with _subscribers_lock:
+                _subscribers.pop(ident, None)
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+    def on_token(self, role: str, chunk: str) -> None:
+        if role not in self.token_roles or self.cancelled.is_set():
+            return
+        text = self._filters.setdefault(role, FinalAnswerFilter()).feed(chunk)
+        if text:
+            self.emit(StreamEvent("token", text, role))
+
+    def on_llm_call_started(self, role: str) -> None:
+        # Each LLM call writes a fresh ReAct answer
+        if role in self._filters:
+            self._filters[role].reset()
+
+
+_subscribers: Dict[int, PostStreamSubscription] = {}
+_subscribers_lock = threading.Lock()
+_listeners_registered = False
+
+
+def current_subscription() -> Optional[PostStreamSubscription]:
+    return _subscribers.get(threading.get_ident())
+
+
+def abort_if_cancelled(*_args) -> None:
+    """
+    step_callback for streaming agents: stop the pipeline at the next agent
+    step once the caller has cancelled the stream attached to this thread
+    """
+    subscription = current_subscription()
+    if subscription is not None and subscription.cancelled.is_set():
+        raise StreamCancelled()
+
+
+def _register_listeners() -> None:
+    """Hook crewai task, tool and LLM stream events once per process"""
+    global _listeners_registered
+
+    with _subscribers_lock:
+        if _listeners_registered:
+            return
+        _listeners_registered = True
+
+    from crewai.utilities.events import crewai_event_bus
+    from crewai.utilities.events.task_events import TaskStartedEvent, TaskCompletedEvent
+    from crewai.utilities.events.tool_usage_events import ToolUsageStartedEvent
+    from crewai.utilities.events.llm_events import LLMCallStartedEvent, LLMStreamChunkEvent
+
+    def task_role(event) -> str:
+        agent = getattr(getattr(event, "task", None), "agent", None)
+        return getattr(agent, "role", "")
+
+    def on_task_started(source, event):
+        subscription = current_subscription()
+        if subscription:
+            role = task_role(event)
+            subscription.emit(StreamEvent("status", f"▶️  {role} started", role))
+
+    def on_task_completed(source, event):
+        subscription = current_subscription()
+        if subscription:
+            role = task_role(event)
+            subscription.emit(StreamEvent("status", f"✅ {role} finished", role))
+
+    def on_tool_started(source, event):
+        subscription = current_subscription()
+        if subscription:
+            subscription.emit(StreamEvent(
+                "status",
+                f"🔍 {event.tool_name}: {event.tool_args}",
+                event.agent_role or "",
+            ))
+
+    def on_llm_started(source, event):
+        subscription = current_subscription()
+        if subscription:
+            subscription.on_llm_call_started(event.agent_role or "")
+
+    def on_chunk(source, event):
+        subscription = current_subscription()
+        if subscription:
+            subscription.on_token(event.agent_role or "", event.chunk)
+
+    crewai_event_bus.register_handler(TaskStartedEvent, on_task_started)
+    crewai_event_bus.register_handler(TaskCompletedEvent, on_task_completed)
+    crewai_event_bus.register_handler(ToolUsageStartedEvent, on_tool_started)
+    crewai_event_bus.register_handler(LLMCallStartedEvent, on_llm_started)
+    crewai_event_bus.register_handler(LLMStreamChunkEvent, on_chunk)
@@ -0,0 +1,266 @@
+import os
+import time
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.search_cache import make_cache_key
+from tools.tracing import increment, span
+from tools.rate_limiter import request_priority
+from tools.runtime_profile import get_logger
+
+
+logger = get_logger("prefetch")
+
+
+class QueryFrequency:
+    """
+    Recent popularity of Linkup tool queries
+
+    Each call to the tool adds one to its query's score, and scores halve
+    every ``half_life`` seconds, so top() favours what users asked for
+    lately over what was popular yesterday. Only the ``max_queries``
+    highest-scoring queries are kept.
+    """
+
+    def __init__(self, half_life: float = 3600, max_queries: int = 500):
+        self.half_life = half_life
+        self.max_queries = max_queries
+        self._lock = threading.Lock()
+        # normalized query -> (score, updated_at, query as last asked)
+        self._scores: Dict[str, Tuple[float, float, str]] = {}
+
+    def _decayed(self, score: float, updated: float, now: float) -> float:
+        return score * 0.5 ** ((now - updated) / self.half_life)
+
+    def record(self, query: str) -> None:
+        if not query or not query.strip():
+            return
+        key = make_cache_key(query, "", "")[0]
+        now = time.time()
+        with self._lock:
+            score, updated, _ = self._scores.get(key, (0.0, now, query))
+            self._scores[key] = (self._decayed(score, updated, now) + 1.0, now, query.strip())
+            if len(self._scores) > self.max_queries:
+                weakest = min(self._scores, key=lambda k: self._decayed(self._scores[k][0], self._scores[k][1], now))
+                del self._scores[weakest]
+
+    def top(self, n: int) -> List[str]:
+        """The n most popular recent queries, most popular first"""
+        now = time.time()
+        with self._lock:
+            ranked = sorted(
+                self._scores.values(),
+                key=lambda entry: self._decayed(entry[0], entry[1], now),
+                reverse=True,
+            )
+        return [query for _, _, query in ranked[:n]]
+
+
+_frequency: Optional[QueryFrequency] = None
+_frequency_lock = threading.Lock()
+
+
+def get_query_frequency() -> QueryFrequency:
+    """Return the process-wide tracker fed by every LinkupSearchTool call"""
+    global _frequency
+
+    with _frequency_lock:
+        if _frequency is None:
+            _frequency = QueryFrequency()
+        return _frequency
+
+
+def default_tool_queries() -> List[str]:
+    """
+    Tool queries the default paths send when the user gives no topic
+
+    "" is the tool's own no-query path (DEFAULT_TRENDING_QUERIES); the
+    others are what the topic discovery and research tasks search for
+    without a general area or topic.
+    """
+    from tasks.research_task import DEFAULT_RESEARCH_QUERY
+    from tasks.topic_discovery_task import DEFAULT_SEARCH_FOCUS
+
+    return ["", DEFAULT_SEARCH_FOCUS, DEFAULT_RESEARCH_QUERY]
+
+
+class TrendPrefetcher:
+    """
+    Background refresher that keeps popular Linkup searches warm in the cache
+
+    Every ``interval`` seconds it re-runs the sub-queries behind the default
+    no-topic paths and behind the ``top_queries`` most frequent recent tool
+    queries, and writes the fresh results to the search cache. Interactive
+    calls for those queries are then cache hits. Each query contributes its
+    ``queries_per_topic`` best sub-queries (as ranked by the query planner).
+    At most ``hourly_quota`` searches are sent per rolling hour; anything
+    over the quota waits for the next cycle. Searches run at batch priority,
+    so they never delay interactive requests in the rate limiter.
+
+    Keep ``interval`` below LINKUP_CACHE_TTL, otherwise entries expire
+    between refreshes.
+    """
+
+    def __init__(
+        self,
+        tool=None,
+        interval: float = 600,
+        hourly_quota: int = 120,
+        top_queries: int = 3,
+        queries_per_topic: int = 3,
+        frequency: Optional[QueryFrequency] = None,
+    ):
+        self.tool = tool
+        self.interval = interval
+        self.hourly_quota = hourly_quota
+        self.top_queries = top_queries
+        self.queries_per_topic = queries_per_topic
+        self.frequency = frequency if frequency is not None else get_query_frequency()
+
+        self._lock = threading.Lock()
+        self._sent: deque = deque()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._counters: Dict[str, Any] = {"cycles": 0, "searches": 0, "errors": 0, "over_quota": 0}
+        self._last_cycle: Dict[str, Any] = {}
+
+    def _get_tool(self):
+        if self.tool is None:
+            from tools.linkup_tool import get_shared_search_tool
+            self.tool = get_shared_search_tool()
+        return self.tool
+
+    def _take_quota(self) -> bool:
+        """Reserve one search from the rolling hourly quota"""
+        now = time.monotonic()
+        with self._lock:
+            while self._sent and now - self._sent[0] >= 3600:
+                self._sent.popleft()
+            if len(self._sent) >= self.hourly_quota:
+                return False
+            self._sent.append(now)
+            return True
+
+    def planned_searches(self) -> List[str]:
+        """Sub-queries to refresh this cycle, most valuable first and without duplicates"""
+        tool = self._get_tool()
+        planner = tool._get_planner() if tool.adaptive_queries else None
+        searches, seen = [], set()
+        for query in default_tool_queries() + self.frequency.top(self.top_queries):
+            candidates = tool._build_search_queries(query)
+            ranked = planner.rank(candidates) if planner is not None else candidates
+            for _, search_query in ranked[:self.queries_per_topic]:
+                key = make_cache_key(search_query, "standard", "sourcedAnswer")
+                if key not in seen:
+                    seen.add(key)
+                    searches.append(search_query)
+        return searches
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        Refresh the cache once
+
+        Returns:
+            Summary of the cycle: searches sent, errors, searches deferred by the quota
+        """
+        from tools.linkup_client import get_linkup_client
+
+        summary = {"searches": 0, "errors": 0, "over_quota": 0, "elapsed": 0.0}
+        tool = self._get_tool()
+        api_key = os.getenv("LINKUP_API_KEY")
+        if tool._get_cache() is None or not api_key:
+            logger.warning("⚠️  Trend prefetch skipped: needs LINKUP_API_KEY and the search cache enabled")
+            return summary
+
+        start = time.perf_counter()
+        client = get_linkup_client(api_key)
+        with request_priority("batch"), span("linkup.prefetch") as current:
+            for search_query in self.planned_searches():
+                if self._stop.is_set():
+                    break
+                if not self._take_quota():
+                    summary["over_quota"] += 1
+                    continue
+                record = tool._execute_single_search(client, search_query, refresh=True)
+                summary["searches"] += 1
+                summary["errors"] += int(record is None)
+            current.set("searches", summary["searches"])
+        summary["elapsed"] = time.perf_counter() - start
+
+        increment("linkup_prefetch_searches_total", summary["searches"])
+        with self._lock:
+            self._counters["cycles"] += 1
+            for key in ("searches", "errors", "over_quota"):
+                self._counters[key] += summary[key]
+            self._last_cycle = dict(summary, finished_at=time.time())
+        logger.info(
+            "🔥 Prefetched %d searches in %.1fs (%d over quota)",
+            summary["searches"], summary["elapsed"], summary["over_quota"],
+        )
+        return summary
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning("Trend prefetch cycle failed: %s", e)
+            self._stop.wait(self.interval)
+
+    def start(self) -> "TrendPrefetcher":
+        """Start refreshing in a daemon thread; the first cycle runs immediately"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._loop, name="trend-prefetch", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            stats["last_cycle"] = dict(self._last_cycle)
+            stats["quota_used"] = len(self._sent)
+        stats.update({"interval": self.interval, "hourly_quota": self.hourly_quota})
+        return stats
+
+
+_default_prefetcher: Optional[TrendPrefetcher] = None
+_default_prefetcher_lock = threading.Lock()
+
+
+def get_trend_prefetcher() -> Optional[TrendPrefetcher]:
+    """
+    Return the process-wide prefetcher configured from the environment, started
+
+    Environment variables:
+        TREND_PREFETCH_INTERVAL: Seconds between refreshes (default 0, which disables prefetching)
+        TREND_PREFETCH_QUOTA: Linkup searches the prefetcher may send per hour (default 120)
+        TREND_PREFETCH_TOPICS: Frequent recent tool queries to keep warm besides the defaults (default 3)
+    """
+    global _default_prefetcher
+
+    with _default_prefetcher_lock:
+        if _default_prefetcher is None:
+            interval = float(os.getenv("TREND_PREFETCH_INTERVAL") or 0)
+            if interval <= 0:
+                return None
+            cache_ttl = float(os.getenv("LINKUP_CACHE_TTL", "900"))
+            if cache_ttl > 0 and interval >= cache_ttl:
+                logger.warning(
+                    "⚠️  TREND_PREFETCH_INTERVAL (%ss) is not below LINKUP_CACHE_TTL (%ss); "
+                    "cached searches will expire between refreshes", interval, cache_ttl,
+                )
+            _default_prefetcher = TrendPrefetcher(
+                interval=interval,
+                hourly_quota=int(os.getenv("TREND_PREFETCH_QUOTA", "120")),
+                top_queries=int(os.getenv("TREND_PREFETCH_TOPICS", "3")),
+            ).start()
+        return _default_prefetcher
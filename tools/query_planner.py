@@ -0,0 +1,177 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence, Tuple
+
+from tools.search_results import SearchRecord
+
+
+# (template, query text) pairs, e.g. ("latest news {topic}", "latest news AI chips")
+Candidate = Tuple[str, str]
+
+_STOPWORDS = {
+    "a", "an", "and", "the", "of", "in", "on", "for", "to", "with", "about", "at", "by", "from",
+    "news", "latest", "trending", "today", "recent",
+}
+
+
+def is_narrow_topic(topic: Optional[str]) -> bool:
+    """
+    Guess whether a topic is specific enough that a few searches cover it
+
+    Three or more content words ("Nvidia H20 export license") or a quoted
+    phrase count as narrow. Empty and one- or two-word topics ("AI") are broad.
+    """
+    if not topic or not topic.strip():
+        return False
+    if '"' in topic:
+        return True
+    words = [word for word in re.findall(r"[\w$%.-]+", topic.lower()) if word not in _STOPWORDS]
+    return len(words) >= 3
+
+
+@dataclass
+class TemplateStats:
+    """Exponentially weighted yield of one query template"""
+    samples: int = 0
+    useful_rate: float = 1.0
+    answer_chars: float = 0.0
+    latency: float = 0.0
+
+    def update(self, useful: bool, answer_chars: int, latency: float, alpha: float) -> None:
+        if self.samples == 0:
+            self.answer_chars, self.latency = float(answer_chars), latency
+        else:
+            self.answer_chars += alpha * (answer_chars - self.answer_chars)
+            self.latency += alpha * (latency - self.latency)
+        self.useful_rate += alpha * (float(useful) - self.useful_rate)
+        self.samples += 1
+
+
+@dataclass
+class QueryPlan:
+    """
+    Which sub-queries to issue for one tool call
+
+    first_wave is sent immediately and fallback only if the first wave
+    comes back short. The search stops once target usable answers have
+    arrived. A finished first wave with at least sufficient answers is good
+    enough without the fallback.
+    """
+    first_wave: List[Candidate]
+    fallback: List[Candidate] = field(default_factory=list)
+    target: int = 3
+    sufficient: int = 2
+
+    @property
+    def queries(self) -> List[Candidate]:
+        return self.first_wave + self.fallback
+
+    def template_for(self, query: str) -> Optional[str]:
+        for template, text in self.queries:
+            if text == query:
+                return template
+        return None
+
+
+class QueryPlanner:
+    """
+    Learns which search templates pay off and plans each call's fan-out
+
+    Every finished sub-query is recorded against its template: whether it
+    gave a usable answer, how long the answer was and how long it took.
+    Templates are then ranked by expected yield per second. The first wave
+    is only as large as needed to expect enough usable answers (untried
+    templates are assumed to succeed). Narrow topics aim for fewer answers
+    than broad ones, because their searches overlap heavily. Sub-queries
+    already in the search cache (e.g. warmed by the prefetcher) cost
+    nothing, so they go first regardless of score.
+    """
+
+    def __init__(self, alpha: float = 0.2, max_first_wave: int = 4, answer_chars_cap: int = 1000):
+        self.alpha = alpha
+        self.max_first_wave = max_first_wave
+        self.answer_chars_cap = answer_chars_cap
+        self._lock = threading.Lock()
+        self._stats: Dict[str, TemplateStats] = {}
+        self._counters = {"plans": 0, "planned_queries": 0, "narrow_plans": 0}
+
+    def score(self, template: str) -> float:
+        stats = self._stats.get(template)
+        if stats is None or stats.samples == 0:
+            return 1.0
+        length = min(stats.answer_chars, self.answer_chars_cap) / self.answer_chars_cap
+        return stats.useful_rate * (0.5 + 0.5 * length) / (1.0 + stats.latency)
+
+    def rank(self, candidates: Sequence[Candidate]) -> List[Candidate]:
+        """Candidates ordered by expected yield; sorted() is stable, so untried templates keep their listed order"""
+        return sorted(candidates, key=lambda candidate: self.score(candidate[0]), reverse=True)
+
+    def plan(
+        self,
+        topic: Optional[str],
+        candidates: Sequence[Candidate],
+        min_results: int = 3,
+        cached: AbstractSet[str] = frozenset(),
+    ) -> QueryPlan:
+        narrow = is_narrow_topic(topic)
+        target = min(min_results, 2) if narrow else min_results
+        sufficient = max(1, target - 1)
+
+        with self._lock:
+            ranked = self.rank(candidates)
+            if cached:
+                ranked = [c for c in ranked if c[1] in cached] + [c for c in ranked if c[1] not in cached]
+            wave_limit = min(len(ranked), max(target, self.max_first_wave))
+            expected, size = 0.0, 0
+            for template, _ in ranked[:wave_limit]:
+                size += 1
+                stats = self._stats.get(template)
+                expected += stats.useful_rate if stats and stats.samples else 1.0
+                if expected >= target and size >= target:
+                    break
+
+            self._counters["plans"] += 1
+            self._counters["planned_queries"] += size
+            self._counters["narrow_plans"] += int(narrow)
+
+        return QueryPlan(first_wave=ranked[:size], fallback=ranked[size:], target=target, sufficient=sufficient)
+
+    def record(self, template: Optional[str], record: Optional[SearchRecord], latency: float, useful: bool) -> None:
+        """Record the outcome of one sub-query (record is None on errors and timeouts)"""
+        if template is None:
+            return
+        answer_chars = len(record.answer) if record is not None else 0
+        with self._lock:
+            self._stats.setdefault(template, TemplateStats()).update(useful, answer_chars, latency, self.alpha)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            templates = {
+                template: {
+                    "samples": stats.samples,
+                    "useful_rate": round(stats.useful_rate, 3),
+                    "answer_chars": round(stats.answer_chars),
+                    "latency": round(stats.latency, 3),
+                    "score": round(self.score(template), 3),
+                }
+                for template, stats in self._stats.items()
+            }
+            counters = dict(self._counters)
+        counters["queries_per_plan"] = counters["planned_queries"] / counters["plans"] if counters["plans"] else 0.0
+        counters["templates"] = templates
+        return counters
+
+
+_default_planner: Optional[QueryPlanner] = None
+_default_planner_lock = threading.Lock()
+
+
+def get_default_query_planner() -> QueryPlanner:
+    """Return the process-wide planner, so template statistics accumulate across calls"""
+    global _default_planner
+
+    with _default_planner_lock:
+        if _default_planner is None:
+            _default_planner = QueryPlanner()
+        return _default_planner
@@ -0,0 +1,265 @@
+import os
+import time
+import heapq
+import random
+import itertools
+import threading
+import contextlib
+import contextvars
+from typing import Any, Dict, Optional
+
+from tools.tracing import increment, observe
+
+
+# Lower value = served first when requests are queued
+PRIORITIES = {"interactive": 0, "batch": 1}
+
+_request_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "linkup_request_priority", default="interactive"
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: str):
+    """
+    Run Linkup calls made inside the block with the given priority class
+
+    ``interactive`` (the default) is for a person waiting on the result,
+    e.g. main(). ``batch`` is for bulk work such as create_linkedin_posts. When
+    the limiter is saturated, queued interactive requests go first.
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}, expected one of {', '.join(PRIORITIES)}")
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_priority() -> str:
+    return _request_priority.get()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After as seconds, from either delta-seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None, base: float = 0.5, cap: float = 8.0) -> float:
+    """
+    Seconds to wait before retry number attempt (0-based)
+
+    The server's Retry-After is honoured, plus a little jitter so throttled
+    callers don't all retry at the same instant. Without it, full-jitter
+    exponential backoff is used.
+    """
+    if retry_after is not None:
+        return min(cap, retry_after) + random.uniform(0, base)
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class RateLimiter:
+    """
+    Process-wide token bucket plus in-flight budget for Linkup requests
+
+    Requests take one token (refilled at ``rate`` per second, up to
+    ``burst``) and one of ``max_in_flight`` slots. Waiting requests are
+    served by priority class, then arrival order. When Linkup answers 429,
+    penalize() drains the bucket and halves the refill rate, so every caller
+    slows down together instead of piling on more rejected requests. Each
+    successful request then wins back 5% of the configured rate (AIMD), so
+    the limiter settles just under the provider's actual ceiling.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: Optional[float] = None, max_in_flight: int = 8):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.max_in_flight = max_in_flight
+        self.current_rate = rate
+
+        self._cond = threading.Condition()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        self._waiting: list = []
+        self._sequence = itertools.count()
+        self._counters: Dict[str, Any] = {"throttled": 0, "peak_in_flight": 0}
+        self._waits: Dict[str, Dict[str, float]] = {
+            name: {"acquired": 0, "wait_total": 0.0, "wait_max": 0.0} for name in PRIORITIES
+        }
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.current_rate)
+        self._updated = now
+
+    def _delay(self, ticket, now: float) -> Optional[float]:
+        """0 if ticket may proceed now, seconds to wait, or None to wait for a release"""
+        if self._waiting[0] != ticket or self._in_flight >= self.max_in_flight:
+            return None
+        self._refill(now)
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.current_rate
+        return 0.0
+
+    def _take(self) -> None:
+        heapq.heappop(self._waiting)
+        self._tokens -= 1
+        self._in_flight += 1
+        self._counters["peak_in_flight"] = max(self._counters["peak_in_flight"], self._in_flight)
+        self._cond.notify_all()
+
+    def _forget(self, ticket) -> None:
+        if ticket in self._waiting:
+            self._waiting.remove(ticket)
+            heapq.heapify(self._waiting)
+            self._cond.notify_all()
+
+    def _record_wait(self, priority: str, waited: float) -> None:
+        with self._cond:
+            waits = self._waits[priority]
+            waits["acquired"] += 1
+            waits["wait_total"] += waited
+            waits["wait_max"] = max(waits["wait_max"], waited)
+        observe("linkup_rate_limit_wait_seconds", waited, priority=priority)
+
+    def acquire(self, priority: Optional[str] = None) -> float:
+        """Block until a request may be sent; returns the time spent waiting"""
+        priority = priority or current_priority()
+        ticket = (PRIORITIES[priority], next(self._sequence))
+        started = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    delay = self._delay(ticket, time.monotonic())
+                    if delay == 0:
+                        self._take()
+                        break
+                    self._cond.wait(timeout=delay if delay is not None else 0.5)
+            except BaseException:
+                self._forget(ticket)
+                raise
+        waited = time.monotonic() - started
+        self._record_wait(priority, waited)
+        return waited
+
+    async def acquire_async(self, priority: Optional[str] = None) -> float:
+        """Async acquire: waits with asyncio.sleep so the event loop keeps running"""
+        import asyncio
+
+        priority = priority or current_priority()
+        ticket = (PRIORITIES[priority], next(self._sequence))
+        started = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+        try:
+            while True:
+                with self._cond:
+                    delay = self._delay(ticket, time.monotonic())
+                    if delay == 0:
+                        self._take()
+                        break
+                await asyncio.sleep(min(delay, 0.5) if delay is not None else 0.01)
+        except BaseException:
+            with self._cond:
+                self._forget(ticket)
+            raise
+        waited = time.monotonic() - started
+        self._record_wait(priority, waited)
+        return waited
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if not throttled:
+                self.current_rate = min(self.rate, self.current_rate + 0.05 * self.rate)
+            self._cond.notify_all()
+
+    def penalize(self) -> None:
+        """Slow every caller down after the provider throttled a request"""
+        with self._cond:
+            self._refill(time.monotonic())
+            self.current_rate = max(0.1 * self.rate, self.current_rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._counters["throttled"] += 1
+        increment("linkup_throttled_total")
+
+    @contextlib.contextmanager
+    def slot(self, priority: Optional[str] = None):
+        """Hold a request slot; set the yielded dict's "throttled" key on a 429"""
+        self.acquire(priority)
+        outcome = {"throttled": False}
+        try:
+            yield outcome
+        finally:
+            self.release(outcome["throttled"])
+
+    @contextlib.asynccontextmanager
+    async def aslot(self, priority: Optional[str] = None):
+        await self.acquire_async(priority)
+        outcome = {"throttled": False}
+        try:
+            yield outcome
+        finally:
+            self.release(outcome["throttled"])
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue wait per priority class, throttling events and in-flight usage"""
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._counters)
+            stats["in_flight"] = self._in_flight
+            stats["queued"] = len(self._waiting)
+            for name, waits in self._waits.items():
+                acquired = waits["acquired"]
+                stats[name] = {
+                    "acquired": acquired,
+                    "wait_avg": waits["wait_total"] / acquired if acquired else 0.0,
+                    "wait_max": waits["wait_max"],
+                }
+        stats.update({
+            "rate": self.rate,
+            "current_rate": round(self.current_rate, 3),
+            "burst": self.burst,
+            "max_in_flight": self.max_in_flight,
+        })
+        return stats
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Return the process-wide Linkup rate limiter configured from the environment
+
+    Environment variables:
+        LINKUP_RATE_LIMIT: Requests per second across the process (default 10, 0 disables limiting)
+        LINKUP_RATE_BURST: Requests allowed in a burst above the steady rate (default = rate)
+        LINKUP_MAX_IN_FLIGHT: Requests allowed in flight at once (default 8)
+    """
+    global _default_limiter
+
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            rate = float(os.getenv("LINKUP_RATE_LIMIT", "10"))
+            if rate <= 0:
+                return None
+            _default_limiter = RateLimiter(
+                rate=rate,
+                burst=float(os.getenv("LINKUP_RATE_BURST") or 0) or None,
+                max_in_flight=int(os.getenv("LINKUP_MAX_IN_FLIGHT", "8")),
+            )
+        return _default_limiter
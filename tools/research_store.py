@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from tools.search_cache import SearchCache
+
+
+@dataclass
+class ResearchBrief:
+    """Research task output kept for reuse by later content tasks"""
+    topic: Optional[str]
+    brief: str
+    created_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"topic": self.topic, "brief": self.brief, "created_at": self.created_at}
+
+
+class ResearchStore:
+    """
+    Stores research briefs by normalized topic and time window
+
+    A brief is reused only while it is younger than ``ttl_seconds`` and was
+    written in the current ``window_seconds`` bucket (one UTC day by
+    default), so research never carries over into the next news cycle.
+    Storage is a SearchCache, which gives the same in-memory LRU and
+    optional SQLite tier as the Linkup result cache.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        window_seconds: float = 86400,
+        max_entries: int = 128,
+        db_path: Optional[str] = None,
+    ):
+        self.window_seconds = window_seconds
+        self._cache = SearchCache(ttl_seconds=ttl_seconds, max_entries=max_entries, db_path=db_path)
+
+    def _window(self, now: Optional[float] = None) -> str:
+        return f"window:{int((now or time.time()) // self.window_seconds)}"
+
+    def get(self, topic: Optional[str]) -> Optional[ResearchBrief]:
+        """Return a fresh brief for topic (None means general trends), or None"""
+        value = self._cache.get(topic or "", "research", self._window())
+        if value is None:
+            return None
+        return ResearchBrief(topic=value.get("topic"), brief=value["brief"], created_at=value["created_at"])
+
+    def put(self, topic: Optional[str], brief: str) -> ResearchBrief:
+        record = ResearchBrief(topic=topic, brief=brief, created_at=time.time())
+        self._cache.set(topic or "", "research", self._window(record.created_at), record.to_dict())
+        return record
+
+    def invalidate(self, topic: Optional[str]) -> None:
+        """Forget the current brief for topic so the next post researches again"""
+        self._cache.invalidate(topic or "", "research", self._window())
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+_default_store: Optional[ResearchStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_research_store() -> Optional[ResearchStore]:
+    """
+    Return the process-wide research store configured from the environment
+
+    Environment variables:
+        RESEARCH_STORE_TTL: Seconds a brief stays reusable (default 3600, 0 disables reuse)
+        RESEARCH_STORE_WINDOW: Length of the time window briefs are keyed by (default 86400)
+        RESEARCH_STORE_PATH: SQLite file for the on-disk tier (default .cache/research_briefs.sqlite,
+            empty string keeps briefs in memory only)
+    """
+    global _default_store
+
+    with _default_store_lock:
+        if _default_store is None:
+            ttl = float(os.getenv("RESEARCH_STORE_TTL", "3600"))
+            if ttl <= 0:
+                return None
+            _default_store = ResearchStore(
+                ttl_seconds=ttl,
+                window_seconds=float(os.getenv("RESEARCH_STORE_WINDOW", "86400")),
+                db_path=os.getenv("RESEARCH_STORE_PATH", ".cache/research_briefs.sqlite") or None,
+            )
+        return _default_store
@@ -0,0 +1,229 @@
+import re
+import random
+import threading
+import zlib
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from tools.search_results import SearchRecord, format_sources
+
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD = re.compile(r"[a-z0-9$%]+")
+_PRIME = (1 << 61) - 1
+_NUM_PERM = 32
+_rng = random.Random(1729)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_NUM_PERM)]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)"""
+    return (len(text) + 3) // 4
+
+
+def record_tokens(record: SearchRecord) -> int:
+    return estimate_tokens(record.answer) + sum(estimate_tokens(source) for source in record.sources)
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in _SENTENCE_SPLIT.split(text) if sentence.strip()]
+
+
+def shingles(sentence: str, size: int = 2) -> set:
+    """Word n-gram shingles of a sentence (single words for very short ones)"""
+    words = _WORD.findall(sentence.lower())
+    if len(words) < size:
+        return set(words)
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash_signature(shingle_set: set) -> Optional[Tuple[int, ...]]:
+    """MinHash signature used to estimate Jaccard similarity between shingle sets"""
+    if not shingle_set:
+        return None
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingle_set]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def estimated_similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    return sum(1 for a, b in zip(left, right) if a == b) / _NUM_PERM
+
+
+@dataclass
+class CompactionReport:
+    """Compacted records plus before/after token counts"""
+    records: List[SearchRecord]
+    tokens_before: int
+    tokens_after: int
+    sentences_dropped: int = 0
+    sources_dropped: int = 0
+    truncated: bool = False
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+def compact_results(
+    records: Sequence[SearchRecord],
+    similarity_threshold: float = 0.6,
+    max_tokens: Optional[int] = None,
+    max_sources: int = 3,
+) -> CompactionReport:
+    """
+    Remove near-duplicate sentences and sources across search records and enforce a token budget
+
+    A source URL already cited by an earlier record is dropped from later
+    ones. Sentences are compared by MinHash over word-bigram shingles; a sentence
+    whose estimated similarity to an already kept sentence reaches
+    similarity_threshold is dropped. If the remainder, with the source lines
+    render_records prints, still exceeds max_tokens, each record is cut to
+    its first source, then sentences are kept round-robin across results
+    (leads first) until the budget is spent.
+
+    Args:
+        records: Search records in priority order
+        similarity_threshold: Estimated Jaccard similarity at which sentences count as duplicates
+        max_tokens: Optional budget for the combined compacted answers and their sources
+        max_sources: Sources rendered per record, as passed to render_records
+
+    Returns:
+        A CompactionReport with the compacted records
+    """
+    tokens_before = sum(record_tokens(record) for record in records)
+
+    kept_signatures: List[Tuple[int, ...]] = []
+    seen_exact: set = set()
+    kept: List[List[str]] = []
+    kept_sources: List[Tuple[str, ...]] = []
+    seen_sources: set = set()
+    dropped = 0
+    sources_dropped = 0
+
+    for record in records:
+        unique_sources = tuple(source for source in record.sources if source not in seen_sources)
+        sources_dropped += len(record.sources) - len(unique_sources)
+        seen_sources.update(unique_sources)
+        kept_sources.append(unique_sources)
+
+        kept_sentences = []
+        for sentence in split_sentences(record.answer):
+            normalized = " ".join(_WORD.findall(sentence.lower()))
+            if normalized in seen_exact:
+                dropped += 1
+                continue
+            signature = minhash_signature(shingles(sentence))
+            if signature is not None and any(
+                estimated_similarity(signature, other) >= similarity_threshold
+                for other in kept_signatures
+            ):
+                dropped += 1
+                continue
+            seen_exact.add(normalized)
+            if signature is not None:
+                kept_signatures.append(signature)
+            kept_sentences.append(sentence)
+        kept.append(kept_sentences)
+
+    truncated = False
+    if max_tokens is not None:
+        budgeted_sources, kept, truncated = _apply_budget(kept, kept_sources, max_tokens, max_sources)
+        sources_dropped += sum(len(before) - len(after) for before, after in zip(kept_sources, budgeted_sources))
+        kept_sources = budgeted_sources
+
+    compacted = [
+        replace(record, answer=" ".join(sentences), sources=sources)
+        for record, sentences, sources in zip(records, kept, kept_sources)
+        if sentences
+    ]
+    tokens_after = sum(record_tokens(record) for record in compacted)
+
+    report = CompactionReport(
+        records=compacted,
+        tokens_before=tokens_before,
+        tokens_after=tokens_after,
+        sentences_dropped=dropped,
+        sources_dropped=sources_dropped,
+        truncated=truncated,
+    )
+    _record(report)
+    return report
+
+
+def _apply_budget(
+    kept: List[List[str]],
+    kept_sources: List[Tuple[str, ...]],
+    max_tokens: int,
+    max_sources: int,
+) -> Tuple[List[Tuple[str, ...]], List[List[str]], bool]:
+    """
+    Fit sentences and their rendered source lines into max_tokens
+
+    Returns:
+        (sources, sentences, truncated) per record
+    """
+    def sources_cost(sources: Tuple[str, ...]) -> int:
+        return estimate_tokens(format_sources(sources, max_sources))
+
+    def total(sources_per_record: List[Tuple[str, ...]]) -> int:
+        return sum(
+            sum(estimate_tokens(sentence) + 1 for sentence in sentences) + sources_cost(sources)
+            for sentences, sources in zip(kept, sources_per_record)
+            if sentences
+        )
+
+    if total(kept_sources) <= max_tokens:
+        return kept_sources, kept, False
+    # Sources are the cheapest thing to give up: keep each record's first one
+    kept_sources = [sources[:1] for sources in kept_sources]
+    if total(kept_sources) <= max_tokens:
+        return kept_sources, kept, True
+
+    budgeted: List[List[str]] = [[] for _ in kept]
+    remaining = max_tokens
+    depth = 0
+    progressing = True
+    while progressing and remaining > 0:
+        progressing = False
+        for index, sentences in enumerate(kept):
+            if depth >= len(sentences):
+                continue
+            progressing = True
+            cost = estimate_tokens(sentences[depth]) + 1
+            if not budgeted[index]:
+                # A record's source line is only rendered once it has a sentence
+                cost += sources_cost(kept_sources[index])
+            if cost <= remaining:
+                budgeted[index].append(sentences[depth])
+                remaining -= cost
+        depth += 1
+    return kept_sources, budgeted, True
+
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "compactions": 0,
+    "tokens_before": 0,
+    "tokens_after": 0,
+    "sentences_dropped": 0,
+    "sources_dropped": 0,
+    "truncations": 0,
+}
+
+
+def _record(report: CompactionReport) -> None:
+    with _stats_lock:
+        _stats["compactions"] += 1
+        _stats["tokens_before"] += report.tokens_before
+        _stats["tokens_after"] += report.tokens_after
+        _stats["sentences_dropped"] += report.sentences_dropped
+        _stats["sources_dropped"] += report.sources_dropped
+        _stats["truncations"] += int(report.truncated)
+
+
+def get_compaction_stats() -> Dict[str, int]:
+    """Cumulative compaction counters for this process, including tokens saved"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["tokens_saved"] = stats["tokens_before"] - stats["tokens_after"]
+    return stats
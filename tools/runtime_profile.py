@@ -0,0 +1,123 @@
+import os
+import sys
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Optional
+
+
+PROFILES = ("dev", "production")
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+_atexit_registered = False
+
+
+def runtime_profile() -> str:
+    """
+    Current runtime profile from RUNTIME_PROFILE: "dev" (default) or "production"
+
+    dev keeps the verbose agent transcripts and the emoji progress lines on
+    stdout. production turns transcripts off and only logs warnings and errors.
+    """
+    profile = os.getenv("RUNTIME_PROFILE", "dev").strip().lower()
+    return profile if profile in PROFILES else "dev"
+
+
+def is_production() -> bool:
+    return runtime_profile() == "production"
+
+
+def crew_verbose() -> bool:
+    """verbose flag for Agents and Crews; CREW_VERBOSE=0/1 overrides the profile"""
+    override = os.getenv("CREW_VERBOSE")
+    if override is not None and override.strip():
+        return override.strip() == "1"
+    return not is_production()
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Write to the current sys.stdout, so contextlib.redirect_stdout still applies"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def profile_explicit() -> bool:
+    """True when RUNTIME_PROFILE is set, rather than defaulting to dev"""
+    return bool(os.getenv("RUNTIME_PROFILE", "").strip())
+
+
+def configure_logging() -> None:
+    """
+    Route the "crew" logger through a QueueHandler for the current profile
+
+    Callers only put records on an in-memory queue. A single listener thread
+    formats them and writes to the console, so concurrent pipelines never
+    block on, or contend for, the terminal. LOG_LEVEL overrides the level
+    implied by the profile. Calling it again (e.g. after load_dotenv)
+    applies the current environment.
+
+    Entry points (crew.main, the service and its workers) call this; importing
+    the package never does, so an embedding application keeps its own logging.
+    Records still propagate to the application's handlers unless
+    RUNTIME_PROFILE is set explicitly.
+    """
+    global _listener, _atexit_registered
+
+    stop_logging()
+    with _setup_lock:
+        production = is_production()
+        level_name = os.getenv("LOG_LEVEL", "").strip().upper() or ("WARNING" if production else "INFO")
+        level = getattr(logging, level_name, logging.INFO)
+
+        if production:
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+        else:
+            handler = _StdoutHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+
+        records = queue.SimpleQueue()
+        root = logging.getLogger("crew")
+        root.setLevel(level)
+        if profile_explicit():
+            root.propagate = False
+        root.addHandler(logging.handlers.QueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, handler)
+        _listener.start()
+
+    if not _atexit_registered:
+        atexit.register(stop_logging)
+        _atexit_registered = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Return a logger under the shared "crew" hierarchy, e.g. get_logger("linkup")
+
+    Records below the profile's level are dropped by the caller-side level
+    check before any formatting happens. Nothing is written by the crew's
+    own handler until configure_logging() has been called.
+    """
+    return logging.getLogger(f"crew.{name}")
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the listener thread"""
+    global _listener
+
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            root = logging.getLogger("crew")
+            root.handlers.clear()
+            root.propagate = True
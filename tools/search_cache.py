@@ -0,0 +1,277 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+import contextlib
+import contextvars
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+CacheKey = Tuple[str, str, str]
+
+_bypass: contextvars.ContextVar = contextvars.ContextVar("search_cache_bypass", default=False)
+
+
+@contextlib.contextmanager
+def fresh_searches() -> Iterator[None]:
+    """
+    Send Linkup searches made inside the block to the API instead of reading the cache
+
+    Results are still written, so the cache holds the fresh answers
+    afterwards. Applies to the current thread and to work started with a
+    copy of its context (LinkupSearchTool's sub-query threads included).
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def cache_reads_enabled() -> bool:
+    """False inside fresh_searches()"""
+    return not _bypass.get()
+
+
+def make_cache_key(query: str, depth: str, output_type: str) -> CacheKey:
+    """
+    Build a normalized cache key for a Linkup search
+
+    Queries are lower-cased and whitespace-collapsed so that trivially
+    different spellings of the same search share one entry.
+    """
+    normalized_query = " ".join((query or "").lower().split())
+    return (normalized_query, depth, output_type)
+
+
+class SearchCache:
+    """
+    TTL-aware, two-tier cache for Linkup search results.
+
+    The first tier is an in-process LRU (``max_entries`` items). The second,
+    optional tier is a SQLite file that survives restarts and is shared by
+    every process pointing at the same ``db_path``. Entries older than
+    ``ttl_seconds`` are treated as misses in both tiers.
+
+    Any object exposing ``get(query, depth, output_type)``,
+    ``set(query, depth, output_type, value)`` and ``stats()`` can be plugged
+    into ``LinkupSearchTool`` in place of this class.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900,
+        max_entries: int = 256,
+        db_path: Optional[str] = None,
+        max_disk_entries: int = 5000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.max_disk_entries = max_disk_entries
+
+        self._memory: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "evictions": 0,
+            "writes": 0,
+        }
+
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS search_cache (
+                query TEXT NOT NULL,
+                depth TEXT NOT NULL,
+                output_type TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (query, depth, output_type)
+            )"""
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS search_cache_stored_at ON search_cache (stored_at)"
+        )
+        self._db.commit()
+
+    def _is_fresh(self, stored_at: float, now: float) -> bool:
+        return now - stored_at < self.ttl_seconds
+
+    def get(self, query: str, depth: str = "standard", output_type: str = "sourcedAnswer") -> Optional[Any]:
+        """
+        Look up a cached result
+
+        Returns:
+            The cached value, or None on a miss or when the entry is stale
+        """
+        key = make_cache_key(query, depth, output_type)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self._is_fresh(stored_at, now):
+                    self._memory.move_to_end(key)
+                    self._counters["hits"] += 1
+                    self._counters["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._counters["expired"] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT stored_at, value FROM search_cache "
+                    "WHERE query = ? AND depth = ? AND output_type = ?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    stored_at, raw_value = row
+                    if self._is_fresh(stored_at, now):
+                        value = json.loads(raw_value)
+                        self._remember(key, stored_at, value)
+                        self._counters["hits"] += 1
+                        self._counters["disk_hits"] += 1
+                        return value
+                    self._counters["expired"] += 1
+
+            self._counters["misses"] += 1
+            return None
+
+    def contains(self, query: str, depth: str = "standard", output_type: str = "sourcedAnswer") -> bool:
+        """Whether a fresh entry exists, without loading it or counting a hit or miss"""
+        key = make_cache_key(query, depth, output_type)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._is_fresh(entry[0], now):
+                return True
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT stored_at FROM search_cache "
+                    "WHERE query = ? AND depth = ? AND output_type = ?",
+                    key,
+                ).fetchone()
+                return row is not None and self._is_fresh(row[0], now)
+        return False
+
+    def set(self, query: str, depth: str, output_type: str, value: Any) -> None:
+        """Store a result in both tiers"""
+        key = make_cache_key(query, depth, output_type)
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, now, value)
+            self._counters["writes"] += 1
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO search_cache "
+                    "(query, depth, output_type, stored_at, value) VALUES (?, ?, ?, ?, ?)",
+                    (*key, now, json.dumps(value)),
+                )
+                self._prune_disk(now)
+                self._db.commit()
+
+    def _remember(self, key: CacheKey, stored_at: float, value: Any) -> None:
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _prune_disk(self, now: float) -> None:
+        cursor = self._db.execute(
+            "DELETE FROM search_cache WHERE stored_at < ?", (now - self.ttl_seconds,)
+        )
+        removed = cursor.rowcount or 0
+
+        (count,) = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            cursor = self._db.execute(
+                "DELETE FROM search_cache WHERE rowid IN ("
+                "SELECT rowid FROM search_cache ORDER BY stored_at ASC LIMIT ?)",
+                (overflow,),
+            )
+            removed += cursor.rowcount or 0
+
+        self._counters["evictions"] += removed
+
+    def invalidate(self, query: str, depth: str = "standard", output_type: str = "sourcedAnswer") -> None:
+        """Drop a single entry from both tiers"""
+        key = make_cache_key(query, depth, output_type)
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM search_cache WHERE query = ? AND depth = ? AND output_type = ?",
+                    key,
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Empty both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM search_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current tier sizes"""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            if self._db is not None:
+                (stats["disk_entries"],) = self._db.execute(
+                    "SELECT COUNT(*) FROM search_cache"
+                ).fetchone()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+_default_cache: Optional[SearchCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_search_cache() -> Optional[SearchCache]:
+    """
+    Return the process-wide search cache configured from the environment
+
+    Environment variables:
+        LINKUP_CACHE_TTL: Freshness window in seconds (default 900, 0 disables caching)
+        LINKUP_CACHE_SIZE: Number of entries kept in memory (default 256)
+        LINKUP_CACHE_PATH: SQLite file for the on-disk tier (default .cache/linkup_search.sqlite,
+            empty string keeps the cache in memory only)
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            ttl = float(os.getenv("LINKUP_CACHE_TTL", "900"))
+            if ttl <= 0:
+                return None
+            _default_cache = SearchCache(
+                ttl_seconds=ttl,
+                max_entries=int(os.getenv("LINKUP_CACHE_SIZE", "256")),
+                db_path=os.getenv("LINKUP_CACHE_PATH", ".cache/linkup_search.sqlite") or None,
+            )
+        return _default_cache
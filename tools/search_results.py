@@ -0,0 +1,103 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+
+MAX_SEARCH_RESULTS = 5
+MAX_SNIPPET_CHARS = 500
+
+
+@dataclass(slots=True)
+class SearchRecord:
+    """One Linkup sub-query and what came back for it"""
+    query: str
+    answer: str
+    sources: Tuple[str, ...] = field(default_factory=tuple)
+    fetched_at: float = 0.0
+    latency: float = 0.0
+    # Served from the search cache rather than fetched by this call; never persisted
+    from_cache: bool = field(default=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "query": self.query,
+            "answer": self.answer,
+            "sources": list(self.sources),
+            "fetched_at": self.fetched_at,
+            "latency": self.latency,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any, query: str = "") -> "SearchRecord":
+        # Plain strings are what the cache held before results were structured
+        if isinstance(data, str):
+            return cls(query=query, answer=data)
+        return cls(
+            query=data.get("query", query),
+            answer=data.get("answer", ""),
+            sources=tuple(data.get("sources", ())),
+            fetched_at=data.get("fetched_at", 0.0),
+            latency=data.get("latency", 0.0),
+        )
+
+
+def record_from_response(query: str, response: Any, latency: float) -> Optional[SearchRecord]:
+    """
+    Convert a Linkup SDK response into a SearchRecord
+
+    Only the answer text and source URLs are kept, so whole SDK result
+    objects never end up in memory or in prompts.
+
+    Returns:
+        The record, or None when the response holds no usable text
+    """
+    answer = ""
+    sources: Tuple[str, ...] = ()
+
+    if hasattr(response, 'answer') and response.answer:
+        if response.answer.lower() not in ['undefined', 'none', '']:
+            answer = response.answer
+            sources = tuple(
+                source.url for source in (getattr(response, 'sources', None) or [])
+                if getattr(source, 'url', None)
+            )
+    elif hasattr(response, 'results') and response.results:
+        results = response.results[:MAX_SEARCH_RESULTS]
+        answer = "\n".join(
+            f"{getattr(result, 'name', '')}: {(getattr(result, 'content', '') or '')[:MAX_SNIPPET_CHARS]}"
+            for result in results
+        )
+        sources = tuple(result.url for result in results if getattr(result, 'url', None))
+
+    if not answer:
+        return None
+    return SearchRecord(
+        query=query,
+        answer=answer,
+        sources=sources,
+        fetched_at=time.time(),
+        latency=latency,
+    )
+
+
+def format_sources(sources: Sequence[str], max_sources: int = 3) -> str:
+    """The "Sources:" line render_records appends to a record ("" when none are listed)"""
+    if not sources or not max_sources:
+        return ""
+    return "\nSources: " + " | ".join(sources[:max_sources])
+
+
+def render_records(records: Iterable[SearchRecord], max_sources: int = 3) -> str:
+    """
+    Compact text rendering of search records for the LLM
+
+    Args:
+        records: Records to render, in order
+        max_sources: Source URLs listed per record
+    """
+    blocks = []
+    for record in records:
+        block = f"=== SEARCH: {record.query[:50]} ===\n{record.answer}"
+        block += format_sources(record.sources, max_sources)
+        blocks.append(block)
+    return "\n\n".join(blocks)
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import concurrent.futures
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from tools.tracing import increment
+
+
+class _LeaderCancelled(Exception):
+    """Handed to waiting callers when the leading async call was cancelled"""
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution
+
+    The first caller for a key (the leader) runs the work. Callers arriving
+    while it is still running wait for the leader's result, or exception,
+    instead of repeating the work. The key is forgotten as soon as the
+    leader finishes, so later callers start a fresh call; caching finished
+    results is left to SearchCache.
+
+    Sync and async callers share the same in-flight table, so a search
+    started on a worker thread also serves an async tool call for the same
+    query, and vice versa.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, concurrent.futures.Future] = {}
+        self._counters = {"leaders": 0, "coalesced": 0}
+
+    def _join(self, key: Hashable) -> Tuple[concurrent.futures.Future, bool]:
+        """Return the in-flight future for key and whether the caller leads it"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._counters["coalesced"] += 1
+                increment("linkup_coalesced_total")
+                return future, False
+            future = concurrent.futures.Future()
+            # Running futures can't be cancelled, so a waiter that gives up can't take the call down with it
+            future.set_running_or_notify_cancel()
+            self._calls[key] = future
+            self._counters["leaders"] += 1
+            return future, True
+
+    def _finish(self, key: Hashable, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers of key
+
+        Returns:
+            (result, coalesced) where coalesced is True when another caller's
+            execution was reused. The leader's exception is raised in every caller.
+        """
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return future.result(), True
+            except _LeaderCancelled:
+                continue
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future)
+            future.set_exception(e)
+            raise
+        self._finish(key, future)
+        future.set_result(result)
+        return result, False
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Async counterpart of do(); fn is called to create the coroutine to run
+
+        A leader cancelled by its own caller (e.g. a straggler dropped after an
+        early stop) doesn't fail the callers waiting on it: the next one in
+        line runs the call itself.
+        """
+        while True:
+            future, leader = self._join(key)
+            if not leader:
+                try:
+                    return await asyncio.wrap_future(future), True
+                except _LeaderCancelled:
+                    continue
+
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                self._finish(key, future)
+                future.set_exception(_LeaderCancelled())
+                raise
+            except BaseException as e:
+                self._finish(key, future)
+                future.set_exception(e)
+                raise
+            self._finish(key, future)
+            future.set_result(result)
+            return result, False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            stats["in_flight"] = len(self._calls)
+        calls = stats["leaders"] + stats["coalesced"]
+        stats["coalesced_rate"] = stats["coalesced"] / calls if calls else 0.0
+        return stats
+
+
+_default_group: Optional[SingleFlight] = None
+_default_group_lock = threading.Lock()
+
+
+def get_search_single_flight() -> SingleFlight:
+    """Return the process-wide group shared by every LinkupSearchTool"""
+    global _default_group
+
+    with _default_group_lock:
+        if _default_group is None:
+            _default_group = SingleFlight()
+        return _default_group
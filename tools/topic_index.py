@@ -0,0 +1,114 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from tools.topic_pool import PooledTopic, normalize_title
+
+
+class DiscoveredTopic(BaseModel):
+    """One trending topic found by topic discovery, with the facts gathered for it"""
+    title: str = Field(description="Engaging, specific topic title")
+    context: str = Field(description="What's happening, with the names, companies and details available")
+    key_details: List[str] = Field(
+        default_factory=list,
+        description="Important facts, numbers or specifics from the search results",
+    )
+    why_hot: str = Field(default="", description="Why this topic is trending or engaging")
+    professional_angle: str = Field(default="", description="Why this matters to professionals and business leaders")
+    source_urls: List[str] = Field(
+        default_factory=list,
+        description="URLs of the search results this topic is based on",
+    )
+
+    @property
+    def id(self) -> str:
+        """Stable id derived from the title, so rediscovering a topic refreshes its entry"""
+        return hashlib.sha1(normalize_title(self.title).encode("utf-8")).hexdigest()[:10]
+
+    @classmethod
+    def from_pooled(cls, topic: PooledTopic) -> "DiscoveredTopic":
+        """Wrap a topic parsed from free-text discovery output"""
+        return cls(title=topic.title, context=topic.details)
+
+    def render(self, number: int) -> str:
+        """Numbered, human-readable rendering in the format discovery used to print"""
+        lines = [f"{number}. **{self.title}**", f"📰 **Context:** {self.context}"]
+        if self.key_details:
+            lines.append(f"📊 **Key Details:** {'; '.join(self.key_details)}")
+        if self.why_hot:
+            lines.append(f"🔥 **Why It's Hot:** {self.why_hot}")
+        if self.professional_angle:
+            lines.append(f"🔗 **Professional Angle:** {self.professional_angle}")
+        if self.source_urls:
+            lines.append(f"🌐 **Sources:** {' | '.join(self.source_urls)}")
+        return "\n".join(lines)
+
+    def brief(self) -> str:
+        """Gathered facts as plain text for the research task"""
+        lines = [f"Topic: {self.title}", f"Context: {self.context}"]
+        lines += [f"- {detail}" for detail in self.key_details]
+        if self.why_hot:
+            lines.append(f"Why it's trending: {self.why_hot}")
+        if self.professional_angle:
+            lines.append(f"Professional angle: {self.professional_angle}")
+        if self.source_urls:
+            lines.append("Sources: " + " | ".join(self.source_urls))
+        return "\n".join(lines)
+
+
+class TopicDiscoveryResult(BaseModel):
+    """Structured output of the topic discovery task"""
+    topics: List[DiscoveredTopic] = Field(description="The discovered trending topics, hottest first")
+
+
+class TopicIndex:
+    """
+    In-memory index of discovered topics keyed by DiscoveredTopic.id
+
+    Every topic discovery run adds its topics here, so a topic picked later
+    (from any page or session) can be looked up by id and its gathered
+    context handed to the research task. The least recently added or used
+    topics are dropped beyond ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._topics: "OrderedDict[str, DiscoveredTopic]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"added": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+    def add(self, topics: Iterable[DiscoveredTopic]) -> List[DiscoveredTopic]:
+        """Index topics (replacing older entries with the same id) and return them"""
+        topics = list(topics)
+        with self._lock:
+            for topic in topics:
+                self._topics[topic.id] = topic
+                self._topics.move_to_end(topic.id)
+                self._counters["added"] += 1
+            while len(self._topics) > self.max_entries:
+                self._topics.popitem(last=False)
+                self._counters["evictions"] += 1
+        return topics
+
+    def get(self, topic_id: str) -> Optional[DiscoveredTopic]:
+        with self._lock:
+            topic = self._topics.get(topic_id)
+            if topic is None:
+                self._counters["misses"] += 1
+                return None
+            self._topics.move_to_end(topic_id)
+            self._counters["hits"] += 1
+            return topic
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._topics)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            stats["entries"] = len(self._topics)
+        return stats
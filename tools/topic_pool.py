@@ -0,0 +1,103 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+
+_TOPIC_START = re.compile(r"^\s*(?:#+\s*)?(\d+)[.)]\s*(.*)$")
+
+
+@dataclass
+class PooledTopic:
+    """One discovered topic: its title and the details the LLM gave for it"""
+    title: str
+    details: str = ""
+
+    def render(self, number: int) -> str:
+        text = f"{number}. **{self.title}**"
+        if self.details:
+            text += f"\n{self.details}"
+        return text
+
+
+def normalize_title(title: str) -> str:
+    return " ".join(re.sub(r"[^a-z0-9 ]", " ", title.lower()).split())
+
+
+def parse_numbered_topics(text: str) -> List[PooledTopic]:
+    """
+    Split topic discovery output ("1. **Title**" followed by detail lines) into topics
+    """
+    topics: List[PooledTopic] = []
+    title: Optional[str] = None
+    details: List[str] = []
+
+    def flush():
+        if title:
+            topics.append(PooledTopic(title=title, details="\n".join(details).strip()))
+
+    for line in str(text).splitlines():
+        match = _TOPIC_START.match(line)
+        if match:
+            flush()
+            title = match.group(2).replace("**", "").strip().rstrip(":")
+            details = []
+        elif title is not None:
+            details.append(line.rstrip())
+    flush()
+    return topics
+
+
+class TopicPool:
+    """
+    Session-scoped pool of discovered topics served one page at a time
+
+    Discovery fetches a larger batch of topics once. Later "new" requests
+    are served from the pool, skipping anything already shown in this
+    session, so they don't repeat the Linkup search and LLM pass. The pool
+    needs a refill only when it runs dry or the search focus changes.
+    Topics can be anything with a ``title`` and ``render(number)``, e.g.
+    PooledTopic or tools.topic_index.DiscoveredTopic.
+    """
+
+    def __init__(self, page_size: int = 5, pool_size: int = 15):
+        self.page_size = page_size
+        self.pool_size = pool_size
+        self.focus: Optional[str] = None
+        self.last_raw_output: str = ""
+        self._available: List[PooledTopic] = []
+        self._shown: set = set()
+        self._shown_titles: List[str] = []
+
+    def needs_refill(self, focus: Optional[str]) -> bool:
+        return focus != self.focus or len(self._available) < self.page_size
+
+    @property
+    def shown_titles(self) -> List[str]:
+        return list(self._shown_titles)
+
+    def fill(self, focus: Optional[str], topics: Iterable[PooledTopic], raw_output: str = "") -> None:
+        """
+        Add freshly discovered topics for focus to the pool
+
+        Topics are appended after the ones still waiting to be shown, skipping
+        any already pooled or shown this session. A different focus empties
+        the pool first, so pages never mix two searches.
+        """
+        if focus != self.focus:
+            self._available = []
+        self.focus = focus
+        self.last_raw_output = raw_output
+        pooled = {normalize_title(topic.title) for topic in self._available}
+        for topic in topics:
+            key = normalize_title(topic.title)
+            if key and key not in self._shown and key not in pooled:
+                self._available.append(topic)
+                pooled.add(key)
+
+    def next_page(self) -> List[PooledTopic]:
+        """Take the next page of unseen topics and mark them as shown"""
+        page, self._available = self._available[:self.page_size], self._available[self.page_size:]
+        for topic in page:
+            self._shown.add(normalize_title(topic.title))
+            self._shown_titles.append(topic.title)
+        return page
@@ -0,0 +1,451 @@
+import os
+import abc
+import json
+import atexit
+import threading
+import time
+import uuid
+import contextvars
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_enabled = False
+_sinks: List["SpanSink"] = []
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+_configure_lock = threading.Lock()
+_crewai_listeners_registered = False
+
+
+class Span:
+    """A timed operation with attributes, linked to its parent span"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start", "end", "attributes", "status")
+
+    def __init__(self, name: str, attributes: Dict[str, Any], parent: Optional["Span"] = None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.attributes = attributes
+        self.status = "ok"
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.time()) - self.start
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "end": self.end,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Returned by span() while tracing is disabled so instrumentation costs ~nothing"""
+
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _SpanContext:
+    __slots__ = ("span", "token")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.span = Span(name, attributes, _current_span.get())
+        self.token = None
+
+    def __enter__(self) -> Span:
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        self.span.end = time.time()
+        if exc_type is not None:
+            self.span.status = "error"
+            self.span.attributes["error"] = str(exc)
+        _current_span.reset(self.token)
+        _export(self.span)
+        return False
+
+
+def _logger():
+    from tools.runtime_profile import get_logger
+    return get_logger("tracing")
+
+
+def tracing_enabled() -> bool:
+    return _enabled
+
+
+def span(name: str, **attributes: Any):
+    """
+    Time a block of code as a span: ``with span("linkup.search", query=q) as s: ...``
+
+    Spans nest through contextvars, so a sub-query span run via
+    contextvars.copy_context() on a worker thread keeps its parent.
+    """
+    if not _enabled:
+        return NOOP_SPAN
+    return _SpanContext(name, attributes)
+
+
+def record_span(name: str, start: float, end: float, status: str = "ok", **attributes: Any) -> None:
+    """Export a span whose timing was measured elsewhere (e.g. from crewai events)"""
+    if not _enabled:
+        return
+    finished = Span(name, attributes, _current_span.get())
+    finished.start, finished.end, finished.status = start, end, status
+    _export(finished)
+
+
+def increment(name: str, value: float = 1, **labels: Any) -> None:
+    """Add to a counter, e.g. increment("linkup_cache_hits_total")"""
+    if not _enabled:
+        return
+    metrics.increment(name, value, labels)
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    """Record a histogram observation such as a latency or a token count"""
+    if not _enabled:
+        return
+    metrics.observe(name, value, labels)
+
+
+def _export(finished: Span) -> None:
+    metrics.observe("crew_span_duration_seconds", finished.duration, {"span": finished.name})
+    for sink in _sinks:
+        try:
+            sink.export(finished)
+        except Exception as e:
+            _logger().warning("Tracing sink error: %s", e)
+
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+class MetricsRegistry:
+    """In-process counters and histograms, renderable in Prometheus text format"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[LabelKey, float] = {}
+        self._histograms: Dict[LabelKey, List[float]] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, Any]) -> LabelKey:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def increment(self, name: str, value: float, labels: Dict[str, Any]) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Dict[str, Any]) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            # [count, sum, bucket counts...]
+            histogram = self._histograms.setdefault(key, [0, 0.0] + [0] * len(self.buckets))
+            histogram[0] += 1
+            histogram[1] += value
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[2 + index] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": {self._format(key): value for key, value in self._counters.items()},
+                "histograms": {
+                    self._format(key): {"count": values[0], "sum": values[1]}
+                    for key, values in self._histograms.items()
+                },
+            }
+
+    @staticmethod
+    def _format(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        name, labels = key
+        labels = labels + extra
+        if not labels:
+            return name
+        rendered = ",".join(f'{label}="{value}"' for label, value in labels)
+        return f"{name}{{{rendered}}}"
+
+    def render_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for key, value in sorted(self._counters.items()):
+                lines.append(f"{self._format(key)} {value}")
+            for (name, labels), values in sorted(self._histograms.items()):
+                for index, bound in enumerate(self.buckets):
+                    lines.append(f"{self._format((name + '_bucket', labels), (('le', str(bound)),))} {values[2 + index]}")
+                lines.append(f"{self._format((name + '_bucket', labels), (('le', '+Inf'),))} {values[0]}")
+                lines.append(f"{self._format((name + '_count', labels))} {values[0]}")
+                lines.append(f"{self._format((name + '_sum', labels))} {values[1]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+metrics = MetricsRegistry()
+
+
+class SpanSink(abc.ABC):
+    """Destination for finished spans"""
+
+    @abc.abstractmethod
+    def export(self, finished: Span) -> None:
+        """Record one finished span"""
+
+    def flush(self) -> None:
+        pass
+
+
+class JSONLSink(SpanSink):
+    """Append each finished span as one JSON line"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._handle = open(path, "a", buffering=64 * 1024)
+
+    def export(self, finished: Span) -> None:
+        line = json.dumps(finished.to_dict(), default=str)
+        with self._lock:
+            self._handle.write(line + "\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            self._handle.flush()
+
+
+class OTelJSONSink(SpanSink):
+    """
+    Collect spans and write them as an OTLP/JSON-shaped dump on flush
+
+    The file can be loaded by OpenTelemetry tooling that reads OTLP JSON.
+    """
+
+    def __init__(self, path: str, service_name: str = "linkedin-content-crew"):
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    def export(self, finished: Span) -> None:
+        with self._lock:
+            self._spans.append(finished)
+
+    def flush(self) -> None:
+        with self._lock:
+            spans = list(self._spans)
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": self.service_name}}
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "crew.tracing"},
+                    "spans": [self._otel_span(item) for item in spans],
+                }],
+            }]
+        }
+        with open(self.path, "w") as handle:
+            json.dump(payload, handle)
+
+    @staticmethod
+    def _otel_span(item: Span) -> Dict[str, Any]:
+        return {
+            "traceId": item.trace_id,
+            "spanId": item.span_id,
+            "parentSpanId": item.parent_id or "",
+            "name": item.name,
+            "startTimeUnixNano": int(item.start * 1e9),
+            "endTimeUnixNano": int((item.end or item.start) * 1e9),
+            "status": {"code": 2 if item.status == "error" else 1},
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in item.attributes.items()
+            ],
+        }
+
+
+class PrometheusSink(SpanSink):
+    """
+    Serve the metrics registry as a Prometheus text endpoint
+
+    Span durations are always aggregated into the registry, so this sink
+    only needs to expose it over HTTP.
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, name="prometheus-metrics", daemon=True).start()
+
+    def export(self, finished: Span) -> None:
+        pass
+
+
+def configure_tracing(sinks: Optional[List[SpanSink]] = None) -> None:
+    """
+    Turn instrumentation on and route spans to the given sinks
+
+    Metrics are always collected in ``tracing.metrics`` once enabled; sinks
+    are optional. crewai task and LLM events are hooked up the first time.
+    """
+    global _enabled
+
+    with _configure_lock:
+        _sinks[:] = list(sinks or [])
+        _enabled = True
+        _register_crewai_listeners()
+
+
+def configure_tracing_from_env() -> None:
+    """
+    Enable tracing from CREW_TRACING, a comma-separated list of sinks:
+
+        CREW_TRACING=jsonl:traces.jsonl,otel:spans.json,prometheus:9464
+
+    Leaving it unset keeps tracing disabled.
+    """
+    spec = os.getenv("CREW_TRACING", "").strip()
+    if not spec:
+        return
+
+    sinks: List[SpanSink] = []
+    for entry in spec.split(","):
+        kind, _, target = entry.strip().partition(":")
+        if kind == "jsonl":
+            sinks.append(JSONLSink(target or "traces.jsonl"))
+        elif kind == "otel":
+            sinks.append(OTelJSONSink(target or "spans.otel.json"))
+        elif kind == "prometheus":
+            sinks.append(PrometheusSink(int(target or "9464")))
+        elif kind:
+            _logger().warning("⚠️  Unknown CREW_TRACING sink: %s", kind)
+    configure_tracing(sinks)
+    atexit.register(flush_tracing)
+
+
+def flush_tracing() -> None:
+    for sink in _sinks:
+        sink.flush()
+
+
+def disable_tracing() -> None:
+    global _enabled
+
+    flush_tracing()
+    with _configure_lock:
+        _enabled = False
+        _sinks.clear()
+
+
+def _register_crewai_listeners() -> None:
+    """Time crewai tasks and LLM calls via its event bus (handlers run in the emitting thread)"""
+    global _crewai_listeners_registered
+
+    if _crewai_listeners_registered:
+        return
+    try:
+        from crewai.utilities.events import crewai_event_bus
+        from crewai.utilities.events.task_events import TaskStartedEvent, TaskCompletedEvent, TaskFailedEvent
+        from crewai.utilities.events.llm_events import LLMCallStartedEvent, LLMCallCompletedEvent, LLMCallFailedEvent
+    except ImportError:
+        return
+
+    task_starts: Dict[int, float] = {}
+    llm_starts = threading.local()
+
+    def task_label(event) -> Dict[str, Any]:
+        task = getattr(event, "task", None)
+        agent = getattr(task, "agent", None)
+        return {
+            "task": (getattr(task, "name", None) or getattr(task, "description", "") or "")[:60],
+            "agent": getattr(agent, "role", ""),
+        }
+
+    def on_task_started(source, event):
+        task_starts[id(getattr(event, "task", source))] = time.time()
+
+    def on_task_finished(source, event):
+        start = task_starts.pop(id(getattr(event, "task", source)), None)
+        if start is None:
+            return
+        status = "error" if isinstance(event, TaskFailedEvent) else "ok"
+        labels = task_label(event)
+        record_span("crew.task", start, time.time(), status=status, **labels)
+        observe("crew_task_duration_seconds", time.time() - start, agent=labels["agent"])
+
+    def on_llm_started(source, event):
+        stack = getattr(llm_starts, "stack", None)
+        if stack is None:
+            stack = llm_starts.stack = []
+        stack.append(time.time())
+
+    def on_llm_finished(source, event):
+        stack = getattr(llm_starts, "stack", None)
+        if not stack:
+            return
+        start = stack.pop()
+        status = "error" if isinstance(event, LLMCallFailedEvent) else "ok"
+        agent = getattr(event, "agent_role", None) or ""
+        model = getattr(event, "model", None) or getattr(source, "model", "")
+        record_span("llm.call", start, time.time(), status=status, agent=agent, model=model)
+        observe("llm_call_duration_seconds", time.time() - start, agent=agent, model=model)
+        increment("llm_calls_total", agent=agent, status=status)
+
+    crewai_event_bus.register_handler(TaskStartedEvent, on_task_started)
+    crewai_event_bus.register_handler(TaskCompletedEvent, on_task_finished)
+    crewai_event_bus.register_handler(TaskFailedEvent, on_task_finished)
+    crewai_event_bus.register_handler(LLMCallStartedEvent, on_llm_started)
+    crewai_event_bus.register_handler(LLMCallCompletedEvent, on_llm_finished)
+    crewai_event_bus.register_handler(LLMCallFailedEvent, on_llm_finished)
+    _crewai_listeners_registered = True